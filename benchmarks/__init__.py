@@ -0,0 +1,21 @@
+r"""The benchmark suite of Cambiato.
+
+The benchmarks are not part of the regular test suite and require the pytest-benchmark
+plugin. Run them from the root of the repository and select the data scale(s) with
+the option ``--scale`` (1k, 10k, 100k or 1M rows, default 10k):
+
+.. code-block:: bash
+
+   $ python -m pytest benchmarks --scale 10k --scale 100k --benchmark-autosave
+
+Compare against the latest saved run and fail if the mean time of a benchmark regressed
+by more than the default tolerance of 10 % (override with ``--benchmark-compare-fail``):
+
+.. code-block:: bash
+
+   $ python -m pytest benchmarks --benchmark-compare
+
+The peak memory of each benchmark is stored in the ``extra_info`` of the benchmark and
+checked against ``benchmarks/memory_baseline.json``. Update the baseline with
+``--save-memory-baseline``.
+"""
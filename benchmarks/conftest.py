@@ -0,0 +1,184 @@
+r"""Fixtures and configuration of the benchmark suite of Cambiato."""
+
+# Standard library
+import json
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, TypeVar
+
+# Third party
+import pyarrow as pa
+import pytest
+from pytest_benchmark.utils import parse_compare_fail
+
+# Local
+from benchmarks.data import DataScale, GeneratedData, generate
+from cambiato.database import SessionFactory, create_session_factory, init
+
+T = TypeVar('T')
+
+SCALES = {'1k': 1_000, '10k': 10_000, '100k': 100_000, '1M': 1_000_000}
+
+DEFAULT_SCALES = ('10k',)
+
+# The default tolerance [%] of a regression of the mean time of a benchmark.
+DEFAULT_TIME_TOLERANCE = 10
+
+# The default tolerance [%] of a regression of the peak memory of a benchmark.
+DEFAULT_MEMORY_TOLERANCE = 10
+
+# The default absolute slack [bytes] of a regression of the peak memory of a benchmark. Small
+# peaks vary by a few KiB between runs, e.g. due to interned objects and allocator caches, which
+# a relative tolerance alone cannot absorb.
+DEFAULT_MEMORY_SLACK = 64 * 1024
+
+MEMORY_BASELINE_FILE = Path(__file__).parent / 'memory_baseline.json'
+
+MeasurePeakMemory = Callable[..., Any]
+
+memory_baseline_key = pytest.StashKey[dict[str, int]]()
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    r"""Add the command line options of the benchmark suite."""
+
+    group = parser.getgroup('cambiato-benchmarks')
+    group.addoption(
+        '--scale',
+        action='append',
+        choices=tuple(SCALES),
+        help=f'The number of rows of the generated data. Default: {DEFAULT_SCALES}.',
+    )
+    group.addoption(
+        '--memory-tolerance',
+        type=float,
+        default=DEFAULT_MEMORY_TOLERANCE,
+        help='The allowed regression [%%] of the peak memory compared to the baseline.',
+    )
+    group.addoption(
+        '--memory-slack',
+        type=int,
+        default=DEFAULT_MEMORY_SLACK,
+        help=(
+            'The minimum allowed regression [bytes] of the peak memory compared to the baseline. '
+            f'Default: {DEFAULT_MEMORY_SLACK}.'
+        ),
+    )
+    group.addoption(
+        '--save-memory-baseline',
+        action='store_true',
+        help=f'Save the peak memory of the benchmarks to "{MEMORY_BASELINE_FILE.name}".',
+    )
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config: pytest.Config) -> None:
+    r"""Fail on time regressions beyond the default tolerance when comparing runs."""
+
+    option = config.option
+    if getattr(option, 'benchmark_compare', False) and not option.benchmark_compare_fail:
+        option.benchmark_compare_fail = [parse_compare_fail(f'mean:{DEFAULT_TIME_TOLERANCE}%')]
+
+    config.stash[memory_baseline_key] = (
+        json.loads(MEMORY_BASELINE_FILE.read_text()) if MEMORY_BASELINE_FILE.exists() else {}
+    )
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    r"""Parametrize the benchmarks with the selected data scales."""
+
+    if 'scale' in metafunc.fixturenames:
+        scales = metafunc.config.getoption('scale') or DEFAULT_SCALES
+        metafunc.parametrize('scale', [SCALES[s] for s in scales], ids=scales, scope='session')
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    r"""Save the memory baseline if requested."""
+
+    config = session.config
+    if config.getoption('save_memory_baseline'):
+        baseline = config.stash[memory_baseline_key]
+        MEMORY_BASELINE_FILE.write_text(json.dumps(baseline, indent=4, sort_keys=True) + '\n')
+
+
+_databases: dict[int, tuple[SessionFactory, GeneratedData]] = {}
+
+
+@pytest.fixture(scope='session')
+def database(
+    scale: int, tmp_path_factory: pytest.TempPathFactory
+) -> tuple[SessionFactory, GeneratedData]:
+    r"""A SQLite database with generated data of size `scale`.
+
+    Returns
+    -------
+    session_factory : cambiato.db.SessionFactory
+        The session factory of the database.
+
+    data : benchmarks.data.GeneratedData
+        A summary of the generated data.
+    """
+
+    if (db := _databases.get(scale)) is None:
+        path = tmp_path_factory.mktemp('db') / f'Cambiato_{scale}.db'
+        session_factory = create_session_factory(url=f'sqlite:///{path!s}', create_database=True)
+
+        with session_factory() as session:
+            init(session=session)
+            data = generate(session=session, scale=DataScale.from_rows(scale))
+
+        db = _databases[scale] = (session_factory, data)
+
+    return db
+
+
+@pytest.fixture
+def peak_memory(request: pytest.FixtureRequest, benchmark: Any) -> MeasurePeakMemory:
+    r"""Measure the peak memory of a function call.
+
+    The function is called once outside of the timed benchmark rounds. The peak memory
+    allocated by Python (tracemalloc) and the memory retained by the Arrow memory pool
+    are stored in the `extra_info` of the benchmark. The benchmark fails if the peak
+    memory has regressed beyond the tolerance compared to the memory baseline. The allowed
+    regression is the largest of the relative tolerance and the absolute slack.
+
+    Returns
+    -------
+    Callable[..., Any]
+        The function to measure the peak memory of a function call.
+        It returns the result of the measured function call.
+    """
+
+    config = request.config
+    baseline = config.stash[memory_baseline_key]
+    tolerance = config.getoption('memory_tolerance')
+    slack = config.getoption('memory_slack')
+    name = request.node.nodeid
+
+    def measure(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        arrow_start = pa.total_allocated_bytes()
+        tracemalloc.start()
+        try:
+            result = func(*args, **kwargs)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        arrow_retained = pa.total_allocated_bytes() - arrow_start
+
+        benchmark.extra_info['peak_memory_python_bytes'] = peak
+        benchmark.extra_info['memory_arrow_retained_bytes'] = arrow_retained
+
+        if config.getoption('save_memory_baseline'):
+            baseline[name] = peak
+        elif (peak_exp := baseline.get(name)) is not None and peak > peak_exp + max(
+            peak_exp * tolerance / 100, slack
+        ):
+            pytest.fail(
+                f'Peak memory regressed: {peak} B > {peak_exp} B '
+                f'(tolerance {tolerance} %, slack {slack} B)!'
+            )
+
+        return result
+
+    return measure
@@ -0,0 +1,622 @@
+r"""Generate synthetic data for the Cambiato database and the DataFrame models.
+
+The generated data is seeded and thus reproducible. The rows are inserted into a database
+that has been initialized with the default data by :func:`cambiato.database.init`. The
+DataFrames resemble the frames loaded by the crud functions and use pyarrow dtypes.
+"""
+
+# Standard library
+import random
+from collections.abc import Iterator, Sequence
+from datetime import UTC, date, datetime, timedelta
+from typing import Any, NamedTuple
+
+# Third party
+import numpy as np
+import pandas as pd
+from sqlalchemy import Table, insert
+from streamlit_passwordless.database.models import user_custom_role_link
+
+# Local
+from cambiato.database import Session
+from cambiato.database.models import (
+    Checklist,
+    ChecklistItem,
+    Customer,
+    Device,
+    DeviceFacilityLink,
+    ElectricityMeter,
+    Facility,
+    Location,
+    Order,
+    User,
+)
+from cambiato.database.models.default import (
+    coordinator,
+    el_utility,
+    electricity_meter_device_type,
+    enabled_device_state,
+    technician,
+    user_role,
+)
+from cambiato.models import FacilityDataFrameModel, OrderDataFrameModel
+
+Row = dict[str, Any]
+
+SEED = 1337
+
+CHUNK_SIZE = 50_000
+
+EPOCH = datetime(2025, 1, 1, tzinfo=UTC)
+
+FIRST_NAMES = (
+    'Alice', 'Anders', 'Anna', 'Astrid', 'Axel', 'Bo', 'Elin', 'Emil', 'Erik', 'Eva',
+    'Filip', 'Hanna', 'Ida', 'Johan', 'Karin', 'Lars', 'Lena', 'Linnea', 'Maja', 'Nils',
+    'Oscar', 'Sara', 'Sofia', 'Sven', 'Ulla', 'Viktor',
+)  # fmt: skip
+
+LAST_NAMES = (
+    'Andersson', 'Berg', 'Eriksson', 'Gustafsson', 'Hansson', 'Johansson', 'Karlsson',
+    'Larsson', 'Lindberg', 'Lundqvist', 'Nilsson', 'Olsson', 'Persson', 'Svensson',
+)  # fmt: skip
+
+COMPANY_SUFFIXES = ('AB', 'HB', 'Fastigheter AB', 'Bygg AB', 'Förvaltning AB')
+
+STREET_NAMES = (
+    'Storgatan', 'Kungsgatan', 'Drottninggatan', 'Skolgatan', 'Järnvägsgatan', 'Parkvägen',
+    'Björkvägen', 'Ekvägen', 'Tallvägen', 'Hamngatan', 'Kyrkogatan', 'Östra Långgatan',
+)  # fmt: skip
+
+CITIES = (
+    ('Stockholm', 11_000),
+    ('Göteborg', 41_000),
+    ('Malmö', 21_000),
+    ('Uppsala', 75_000),
+    ('Västerås', 72_000),
+    ('Örebro', 70_000),
+    ('Linköping', 58_000),
+    ('Umeå', 90_000),
+)
+
+# Utility ID : weight
+UTILITY_WEIGHTS = {1: 60, 2: 30, 3: 5, 4: 5}
+
+ORDER_DESCRIPTIONS = (
+    None,
+    'Meter is located behind the garage.',
+    'Call the customer 30 minutes before arrival.',
+    'The customer has a dog.',
+    'Key is available at the reception.',
+    'Replace the communication module as well.',
+)
+
+
+class DataScale(NamedTuple):
+    r"""The number of rows to generate for each table.
+
+    Parameters
+    ----------
+    facilities : int
+        The number of facilities and locations.
+
+    orders : int
+        The number of orders.
+
+    customers : int or None, default None
+        The number of customers. If None 90 % of `facilities` is used.
+
+    technicians : int, default 50
+        The number of technician users.
+
+    checklists_per_utility : int, default 5
+        The number of checklists for each utility.
+
+    items_per_checklist : int, default 10
+        The number of checklist items of each checklist.
+    """
+
+    facilities: int
+    orders: int
+    customers: int | None = None
+    technicians: int = 50
+    checklists_per_utility: int = 5
+    items_per_checklist: int = 10
+
+    @classmethod
+    def from_rows(cls, rows: int) -> 'DataScale':
+        r"""Create a scale with `rows` facilities and orders."""
+
+        return cls(facilities=rows, orders=rows)
+
+    @property
+    def nr_customers(self) -> int:
+        r"""The number of customers to generate."""
+
+        return int(self.facilities * 0.9) if self.customers is None else self.customers
+
+
+class GeneratedData(NamedTuple):
+    r"""Summary of the generated data.
+
+    Parameters
+    ----------
+    row_counts : dict[str, int]
+        The number of generated rows per table.
+
+    coordinator_user_id : str
+        The ID of the coordinator user that created the orders.
+
+    technician_user_ids : tuple[str, ...]
+        The IDs of the technician users.
+    """
+
+    row_counts: dict[str, int]
+    coordinator_user_id: str
+    technician_user_ids: tuple[str, ...]
+
+
+def _chunks(rows: Sequence[Row], size: int) -> Iterator[Sequence[Row]]:
+    r"""Split `rows` into chunks of `size` rows."""
+
+    for start in range(0, len(rows), size):
+        yield rows[start : start + size]
+
+
+def _insert(session: Session, table: Table, rows: Sequence[Row]) -> int:
+    r"""Bulk insert `rows` into `table` in chunks."""
+
+    for chunk in _chunks(rows, CHUNK_SIZE):
+        session.execute(insert(table), chunk)
+
+    return len(rows)
+
+
+def _user_id(rng: random.Random) -> str:
+    r"""Generate a random user ID."""
+
+    return f'{rng.getrandbits(128):032x}'
+
+
+def _timestamp(rng: random.Random, days: int = 365) -> datetime:
+    r"""Generate a random naive UTC timestamp within `days` days from the epoch."""
+
+    return (EPOCH + timedelta(seconds=rng.randrange(days * 24 * 3600))).replace(tzinfo=None)
+
+
+def generate_users(rng: random.Random, nr_technicians: int) -> tuple[list[Row], list[Row]]:
+    r"""Generate a coordinator and `nr_technicians` technician users.
+
+    Returns
+    -------
+    users : list[dict[str, Any]]
+        The users. The first user is the coordinator.
+
+    links : list[dict[str, Any]]
+        The links between the users and their custom roles.
+    """
+
+    users = []
+    links = []
+    for i in range(nr_technicians + 1):
+        user_id = _user_id(rng)
+        is_coordinator = i == 0
+        first_name, last_name = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        users.append(
+            {
+                'user_id': user_id,
+                'username': f'{first_name.lower()}.{last_name.lower()}.{i}',
+                'displayname': f'{first_name} {last_name} ({i})',
+                'role_id': user_role.role_id,
+            }
+        )
+        links.append(
+            {
+                'user_id': user_id,
+                'role_id': coordinator.role_id if is_coordinator else technician.role_id,
+            }
+        )
+
+    return users, links
+
+
+def generate_locations(rng: random.Random, n: int) -> list[Row]:
+    r"""Generate `n` customer locations."""
+
+    rows = []
+    for i in range(1, n + 1):
+        city, zip_base = rng.choice(CITIES)
+        is_apartment = rng.random() < 0.3
+        rows.append(
+            {
+                'location_id': i,
+                'ext_id': f'LOC{i:09d}',
+                'location_type_id': 3 if is_apartment else 2,
+                'street_name': rng.choice(STREET_NAMES),
+                'street_number': rng.randint(1, 150),
+                'street_number_suffix': rng.choice((None, None, None, 'A', 'B')),
+                'apartment_number': rng.randint(1001, 1305) if is_apartment else None,
+                'zip_code': zip_base + rng.randrange(1000),
+                'city': city,
+                'country': 'Sweden',
+            }
+        )
+
+    return rows
+
+
+def generate_customers(rng: random.Random, n: int) -> list[Row]:
+    r"""Generate `n` customers of which about 10 % are companies."""
+
+    rows = []
+    for i in range(1, n + 1):
+        is_company = rng.random() < 0.1
+        first_name, last_name = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        rows.append(
+            {
+                'customer_id': i,
+                'ext_id': f'CUS{i:09d}',
+                'first_name': None if is_company else first_name,
+                'last_name': None if is_company else last_name,
+                'company_name': f'{last_name} {rng.choice(COMPANY_SUFFIXES)}'
+                if is_company
+                else None,
+                'customer_type_id': 2 if is_company else 1,
+                'preferred_contact_method_id': rng.randint(1, 4),
+            }
+        )
+
+    return rows
+
+
+def generate_facilities(rng: random.Random, n: int, nr_customers: int) -> list[Row]:
+    r"""Generate `n` facilities with one location each."""
+
+    utility_ids = tuple(UTILITY_WEIGHTS)
+    weights = tuple(UTILITY_WEIGHTS.values())
+
+    return [
+        {
+            'facility_id': i,
+            'utility_id': rng.choices(utility_ids, weights=weights)[0],
+            'customer_id': rng.randint(1, nr_customers) if nr_customers else None,
+            'location_id': i,
+            'ext_id': f'FAC{i:09d}',
+            'ean': 735_999_100_000_000_000 + i,
+            'facility_access_method_id': rng.randint(1, 2),
+            'device_loc_type_id': rng.randint(1, 3),
+            'has_alarm': rng.random() < 0.05,
+        }
+        for i in range(1, n + 1)
+    ]
+
+
+def generate_devices(
+    rng: random.Random, facilities: Sequence[Row]
+) -> tuple[list[Row], list[Row], list[Row]]:
+    r"""Generate an electricity meter for each electricity facility.
+
+    Returns
+    -------
+    devices : list[dict[str, Any]]
+        The devices.
+
+    meters : list[dict[str, Any]]
+        The electricity meter details of the devices.
+
+    links : list[dict[str, Any]]
+        The links between the devices and the facilities.
+    """
+
+    devices, meters, links = [], [], []
+    device_id = 0
+    for facility in facilities:
+        if facility['utility_id'] != el_utility.utility_id:
+            continue
+
+        device_id += 1
+        devices.append(
+            {
+                'device_id': device_id,
+                'ext_id': f'EM{device_id:09d}',
+                'device_type_id': electricity_meter_device_type.device_type_id,
+                'device_state_id': enabled_device_state.device_state_id,
+                'manufacture_date': date(2015, 1, 1) + timedelta(days=rng.randrange(3650)),
+            }
+        )
+        meters.append(
+            {
+                'device_id': device_id,
+                'fuse_size': rng.choice((16, 20, 25, 35, 50, 63)),
+                'nr_phases': rng.choice((1, 3, 3, 3)),
+            }
+        )
+        links.append({'device_id': device_id, 'facility_id': facility['facility_id']})
+
+    return devices, meters, links
+
+
+def generate_checklists(
+    checklists_per_utility: int, items_per_checklist: int
+) -> tuple[list[Row], list[Row]]:
+    r"""Generate the checklists and their items for each utility.
+
+    Returns
+    -------
+    checklists : list[dict[str, Any]]
+        The checklists.
+
+    items : list[dict[str, Any]]
+        The items of the checklists.
+    """
+
+    checklists, items = [], []
+    checklist_id = 0
+    item_id = 0
+    for utility_id in UTILITY_WEIGHTS:
+        for c in range(1, checklists_per_utility + 1):
+            checklist_id += 1
+            checklists.append(
+                {'checklist_id': checklist_id, 'utility_id': utility_id, 'name': f'Checklist {c}'}
+            )
+            for j in range(1, items_per_checklist + 1):
+                item_id += 1
+                dtype_id = (j - 1) % 4 + 1  # TEXT, FLOAT, INT, BOOLEAN
+                items.append(
+                    {
+                        'checklist_item_id': item_id,
+                        'checklist_id': checklist_id,
+                        'dtype_id': dtype_id,
+                        'value_column_name_id': dtype_id,
+                        'name': f'Item {j}',
+                    }
+                )
+
+    return checklists, items
+
+
+def generate_orders(
+    rng: random.Random,
+    n: int,
+    *,
+    facilities: Sequence[Row],
+    checklists: Sequence[Row],
+    coordinator_user_id: str,
+    technician_user_ids: Sequence[str],
+) -> list[Row]:
+    r"""Generate `n` orders for random facilities."""
+
+    checklist_ids: dict[int, list[int]] = {}
+    for c in checklists:
+        checklist_ids.setdefault(c['utility_id'], []).append(c['checklist_id'])
+
+    rows = []
+    for i in range(1, n + 1):
+        facility = rng.choice(facilities)
+        utility_id = facility['utility_id']
+        created_at = _timestamp(rng)
+        is_scheduled = rng.random() < 0.6
+        scheduled_start_at = created_at + timedelta(days=rng.randint(1, 60))
+        is_updated = rng.random() < 0.4
+
+        rows.append(
+            {
+                'order_id': i,
+                'order_type_id': rng.randint(1, 6),
+                'order_status_id': rng.randint(1, 6),
+                'ext_id': f'ORD{i:09d}',
+                'utility_id': utility_id,
+                'facility_id': facility['facility_id'],
+                'location_id': facility['location_id'],
+                'customer_id': facility['customer_id'],
+                'checklist_id': rng.choice(checklist_ids[utility_id])
+                if utility_id in checklist_ids
+                else None,
+                'assigned_to_user_id': rng.choice(technician_user_ids)
+                if rng.random() < 0.7
+                else None,
+                'description': rng.choice(ORDER_DESCRIPTIONS),
+                'scheduled_start_at': scheduled_start_at if is_scheduled else None,
+                'scheduled_end_at': scheduled_start_at + timedelta(hours=2)
+                if is_scheduled
+                else None,
+                'created_at': created_at,
+                'created_by': coordinator_user_id,
+                'updated_at': created_at + timedelta(hours=rng.randint(1, 500))
+                if is_updated
+                else None,
+                'updated_by': coordinator_user_id if is_updated else None,
+            }
+        )
+
+    return rows
+
+
+def generate(session: Session, scale: DataScale, seed: int = SEED) -> GeneratedData:
+    r"""Generate synthetic data and insert it into the database.
+
+    The database should be initialized with the default data and not contain
+    any other data. The transaction is committed when all data is inserted.
+
+    Parameters
+    ----------
+    session : cambiato.db.Session
+        An active database session.
+
+    scale : DataScale
+        The number of rows to generate for each table.
+
+    seed : int, default SEED
+        The seed of the random number generator.
+
+    Returns
+    -------
+    GeneratedData
+        A summary of the generated data.
+    """
+
+    rng = random.Random(seed)
+
+    users, user_links = generate_users(rng=rng, nr_technicians=scale.technicians)
+    locations = generate_locations(rng=rng, n=scale.facilities)
+    customers = generate_customers(rng=rng, n=scale.nr_customers)
+    facilities = generate_facilities(rng=rng, n=scale.facilities, nr_customers=len(customers))
+    devices, meters, device_links = generate_devices(rng=rng, facilities=facilities)
+    checklists, checklist_items = generate_checklists(
+        checklists_per_utility=scale.checklists_per_utility,
+        items_per_checklist=scale.items_per_checklist,
+    )
+
+    coordinator_user_id = users[0]['user_id']
+    technician_user_ids = tuple(u['user_id'] for u in users[1:])
+    orders = generate_orders(
+        rng=rng,
+        n=scale.orders,
+        facilities=facilities,
+        checklists=checklists,
+        coordinator_user_id=coordinator_user_id,
+        technician_user_ids=technician_user_ids,
+    )
+
+    tables: tuple[tuple[Table, list[Row]], ...] = (
+        (User.__table__, users),  # type: ignore[arg-type]
+        (user_custom_role_link, user_links),
+        (Location.__table__, locations),  # type: ignore[arg-type]
+        (Customer.__table__, customers),  # type: ignore[arg-type]
+        (Facility.__table__, facilities),  # type: ignore[arg-type]
+        (Device.__table__, devices),  # type: ignore[arg-type]
+        (ElectricityMeter.__table__, meters),  # type: ignore[arg-type]
+        (DeviceFacilityLink.__table__, device_links),  # type: ignore[arg-type]
+        (Checklist.__table__, checklists),  # type: ignore[arg-type]
+        (ChecklistItem.__table__, checklist_items),  # type: ignore[arg-type]
+        (Order.__table__, orders),  # type: ignore[arg-type]
+    )
+    row_counts = {
+        table.name: _insert(session=session, table=table, rows=rows) for table, rows in tables
+    }
+    session.commit()
+
+    return GeneratedData(
+        row_counts=row_counts,
+        coordinator_user_id=coordinator_user_id,
+        technician_user_ids=technician_user_ids,
+    )
+
+
+def _timestamps(
+    values: np.ndarray, mask: np.ndarray | None = None
+) -> pd.arrays.ArrowExtensionArray:
+    r"""Create a pyarrow timestamp array from `values` with missing values where `mask` is False."""
+
+    s = pd.Series(values.astype('datetime64[ns]'))
+    return pd.array(s if mask is None else s.where(mask), dtype='timestamp[ns][pyarrow]')
+
+
+def _strings(values: np.ndarray, mask: np.ndarray | None = None) -> pd.arrays.ArrowExtensionArray:
+    r"""Create a pyarrow string array from `values` with missing values where `mask` is False."""
+
+    s = pd.Series(values, dtype=object)
+    return pd.array(s if mask is None else s.where(mask), dtype='string[pyarrow]')
+
+
+def generate_facilities_frame(rows: int, seed: int = SEED) -> pd.DataFrame:
+    r"""Generate a DataFrame of `rows` facilities like :func:`cambiato.database.get_all_facilities`."""
+
+    rng = np.random.default_rng(seed)
+    ids = np.arange(1, rows + 1)
+    streets = rng.choice(np.array(STREET_NAMES, dtype=object), size=rows)
+    cities = rng.choice(np.array([c for c, _ in CITIES], dtype=object), size=rows)
+    numbers = rng.integers(1, 200, size=rows).astype(str).astype(object)
+
+    return pd.DataFrame(
+        {
+            FacilityDataFrameModel.c_facility_id: pd.array(ids, dtype='uint32[pyarrow]'),
+            FacilityDataFrameModel.c_ean: pd.array(
+                735_999_100_000_000_000 + ids, dtype='uint64[pyarrow]'
+            ),
+            FacilityDataFrameModel.c_address: pd.array(
+                streets + ' ' + numbers + ', ' + cities, dtype='string[pyarrow]'
+            ),
+        }
+    ).set_index(FacilityDataFrameModel.index_cols)
+
+
+def generate_orders_frame(rows: int, seed: int = SEED) -> pd.DataFrame:
+    r"""Generate a DataFrame of `rows` orders.
+
+    The DataFrame resembles the frame loaded from the database by
+    :func:`cambiato.database.get_all_active_orders` before it is translated and
+    its datetime columns are localized. The order type and status ID columns are
+    thus included, the datetime columns are naive UTC timestamps and the columns with
+    few distinct values are categorical.
+    """
+
+    c = OrderDataFrameModel
+    rng = np.random.default_rng(seed)
+    ids = np.arange(1, rows + 1)
+    displaynames = np.array(
+        [f'{first} {last}' for first in FIRST_NAMES[:10] for last in LAST_NAMES[:5]], dtype=object
+    )
+
+    created_at = np.datetime64(EPOCH.replace(tzinfo=None), 's') + rng.integers(
+        0, 365 * 24 * 3600, size=rows
+    ).astype('timedelta64[s]')
+    scheduled_start_at = created_at + rng.integers(1, 60, size=rows).astype('timedelta64[D]')
+    is_scheduled = rng.random(size=rows) < 0.6
+    is_updated = rng.random(size=rows) < 0.4
+    is_assigned = rng.random(size=rows) < 0.7
+
+    order_type_ids = rng.integers(1, 7, size=rows)
+    order_status_ids = rng.integers(1, 7, size=rows)
+    utility_ids = rng.choice(
+        np.array(list(UTILITY_WEIGHTS)),
+        size=rows,
+        p=np.array(list(UTILITY_WEIGHTS.values())) / sum(UTILITY_WEIGHTS.values()),
+    )
+
+    return (
+        pd.DataFrame(
+            {
+                c.c_order_id: pd.array(ids, dtype='int64[pyarrow]'),
+                c.c_utility_id: pd.array(utility_ids, dtype='int64[pyarrow]'),
+                c.c_order_type_id: pd.array(order_type_ids, dtype='int64[pyarrow]'),
+                c.c_order_type_name: _strings(
+                    np.char.add('Order type ', order_type_ids.astype(str))
+                ),
+                c.c_order_status_id: pd.array(order_status_ids, dtype='int64[pyarrow]'),
+                c.c_order_status_name: _strings(
+                    np.char.add('Order status ', order_status_ids.astype(str))
+                ),
+                c.c_facility_ean: pd.array(
+                    735_999_100_000_000_000 + rng.integers(1, rows + 1, size=rows),
+                    dtype='int64[pyarrow]',
+                ),
+                c.c_address: _strings(
+                    rng.choice(np.array(STREET_NAMES, dtype=object), size=rows)
+                    + ', '
+                    + rng.choice(np.array([city for city, _ in CITIES], dtype=object), size=rows)
+                ),
+                c.c_ext_id: _strings(np.char.add('ORD', np.char.zfill(ids.astype(str), 9))),
+                c.c_description: _strings(
+                    rng.choice(np.array(ORDER_DESCRIPTIONS, dtype=object), size=rows)
+                ),
+                c.c_assigned_to_displayname: _strings(
+                    rng.choice(displaynames, size=rows), mask=is_assigned
+                ),
+                c.c_scheduled_start_at: _timestamps(scheduled_start_at, mask=is_scheduled),
+                c.c_scheduled_end_at: _timestamps(
+                    scheduled_start_at + np.timedelta64(2, 'h'), mask=is_scheduled
+                ),
+                c.c_created_by: _strings(np.full(rows, 'Coordinator', dtype=object)),
+                c.c_created_at: _timestamps(created_at),
+                c.c_updated_by: _strings(
+                    np.full(rows, 'Coordinator', dtype=object), mask=is_updated
+                ),
+                c.c_updated_at: _timestamps(
+                    created_at + rng.integers(1, 500, size=rows).astype('timedelta64[h]'),
+                    mask=is_updated,
+                ),
+            }
+        )
+        .astype(c.dtypes)
+        .set_index(c.index_cols)
+    )
@@ -0,0 +1,285 @@
+r"""Benchmarks of the functions of the sub-package `database.crud`."""
+
+# Standard library
+from typing import Any
+from zoneinfo import ZoneInfo
+
+# Third party
+import pytest
+
+# Local
+from benchmarks.conftest import MeasurePeakMemory
+from benchmarks.data import GeneratedData
+from cambiato.config import Language
+from cambiato.database import (
+    ChangedDatabaseRows,
+    SessionFactory,
+    create_order,
+    get_active_orders_page,
+    get_all_active_orders,
+    get_all_checklists,
+    get_all_facilities,
+    get_all_order_statuses,
+    get_all_order_types,
+    get_all_technicians,
+    get_all_utilities,
+    get_customer_id_by_facility_id,
+    process_changed_orders,
+)
+from cambiato.database.models import Order
+from cambiato.models import FacilityDataFrameModel, OrderDataFrameModel
+
+Database = tuple[SessionFactory, GeneratedData]
+
+TZ = ZoneInfo('Europe/Stockholm')
+
+ELECTRICITY_UTILITY_ID = 1
+
+
+@pytest.fixture(scope='session')
+def facilities(database: Database) -> FacilityDataFrameModel:
+    r"""All facilities of the benchmark database."""
+
+    session_factory, _ = database
+    with session_factory() as session:
+        return get_all_facilities(_session=session)
+
+
+@pytest.fixture(scope='session')
+def orders(database: Database) -> OrderDataFrameModel:
+    r"""All active orders of the benchmark database."""
+
+    session_factory, _ = database
+    with session_factory() as session:
+        return get_all_active_orders(
+            _session=session,
+            tz=TZ,
+            language=Language.EN,
+        )
+
+
+class TestReadFunctions:
+    r"""Benchmarks of the functions that read from the database."""
+
+    @pytest.mark.parametrize(
+        ('func', 'kwargs'),
+        [
+            pytest.param(get_all_utilities, {'language': Language.EN}, id='utilities'),
+            pytest.param(get_all_technicians, {}, id='technicians'),
+            pytest.param(
+                get_all_checklists, {'utility_ids': [ELECTRICITY_UTILITY_ID]}, id='checklists'
+            ),
+            pytest.param(
+                get_all_order_types,
+                {'utility_ids': [ELECTRICITY_UTILITY_ID], 'language': Language.EN},
+                id='order_types',
+            ),
+            pytest.param(
+                get_all_order_statuses,
+                {'utility_ids': [ELECTRICITY_UTILITY_ID], 'language': Language.EN},
+                id='order_statuses',
+            ),
+            pytest.param(get_all_facilities, {}, id='facilities'),
+            pytest.param(
+                get_all_facilities,
+                {'utility_ids': [ELECTRICITY_UTILITY_ID]},
+                id='facilities-electricity',
+            ),
+            pytest.param(
+                get_all_active_orders,
+                {
+                    'tz': TZ,
+                    'language': Language.EN,
+                },
+                id='active_orders',
+            ),
+            pytest.param(
+                get_all_active_orders,
+                {
+                    'utility_ids': [ELECTRICITY_UTILITY_ID],
+                    'tz': TZ,
+                    'language': Language.EN,
+                },
+                id='active_orders-electricity',
+            ),
+        ],
+    )
+    def test_get_all(
+        self,
+        func: Any,
+        kwargs: dict[str, Any],
+        database: Database,
+        benchmark: Any,
+        peak_memory: MeasurePeakMemory,
+    ) -> None:
+        r"""Benchmark the functions that load a DataFrame model from the database."""
+
+        session_factory, _ = database
+        benchmark.group = f'crud-read-{func.__name__}'
+
+        with session_factory() as session:
+            model = peak_memory(func, _session=session, **kwargs)
+            benchmark(func, _session=session, **kwargs)
+
+        assert not model.empty
+
+    @pytest.mark.parametrize(
+        'filters',
+        [
+            pytest.param({}, id='first'),
+            pytest.param({'order_statuses': [1, 2], 'order_types': [1]}, id='filtered'),
+        ],
+    )
+    def test_get_active_orders_page(
+        self,
+        filters: dict[str, Any],
+        database: Database,
+        benchmark: Any,
+        peak_memory: MeasurePeakMemory,
+    ) -> None:
+        r"""Benchmark loading the first page of the active orders of a utility."""
+
+        session_factory, _ = database
+        benchmark.group = 'crud-read-get_active_orders_page'
+        kwargs = {'utility_ids': [ELECTRICITY_UTILITY_ID], 'tz': TZ, 'language': Language.EN}
+
+        with session_factory() as session:
+            page = peak_memory(get_active_orders_page, _session=session, **kwargs, **filters)
+            benchmark(get_active_orders_page, _session=session, **kwargs, **filters)
+
+        assert not page.orders.empty
+
+    def test_get_customer_id_by_facility_id(
+        self, scale: int, database: Database, benchmark: Any, peak_memory: MeasurePeakMemory
+    ) -> None:
+        r"""Benchmark looking up the customer of a facility."""
+
+        session_factory, _ = database
+        facility_id = scale // 2
+
+        with session_factory() as session:
+            peak_memory(get_customer_id_by_facility_id, session=session, facility_id=facility_id)
+            customer_id = benchmark(
+                get_customer_id_by_facility_id, session=session, facility_id=facility_id
+            )
+
+        assert customer_id is not None
+
+
+class TestWriteFunctions:
+    r"""Benchmarks of the functions that write to the database."""
+
+    def test_create_order(
+        self, scale: int, database: Database, benchmark: Any, peak_memory: MeasurePeakMemory
+    ) -> None:
+        r"""Benchmark creating a single order."""
+
+        session_factory, data = database
+
+        def setup() -> tuple[tuple[()], dict[str, Any]]:
+            order = Order(
+                order_type_id=1,
+                order_status_id=1,
+                utility_id=ELECTRICITY_UTILITY_ID,
+                facility_id=scale // 2,
+                created_by=data.coordinator_user_id,
+            )
+            return (), {'session': session, 'order': order}
+
+        with session_factory() as session:
+            args, kwargs = setup()
+            result = peak_memory(create_order, *args, **kwargs)
+            benchmark.pedantic(create_order, setup=setup, rounds=50)
+
+        assert result.ok
+
+    @pytest.mark.parametrize('nr_orders', [pytest.param(1, id='1'), pytest.param(100, id='100')])
+    def test_process_changed_orders(
+        self,
+        nr_orders: int,
+        scale: int,
+        database: Database,
+        benchmark: Any,
+        peak_memory: MeasurePeakMemory,
+    ) -> None:
+        r"""Benchmark updating a batch of edited orders."""
+
+        session_factory, data = database
+        step = max(scale // nr_orders, 1)
+        changed_orders = ChangedDatabaseRows(
+            edited_rows=[
+                {
+                    'order_id': order_id,
+                    'description': f'Benchmark {order_id}',
+                    'assigned_to_user_id': data.technician_user_ids[0],
+                    'updated_by': data.coordinator_user_id,
+                }
+                for order_id in range(1, scale + 1, step)[:nr_orders]
+            ]
+        )
+
+        with session_factory() as session:
+            result = peak_memory(
+                process_changed_orders, session=session, changed_orders=changed_orders
+            )
+            benchmark(process_changed_orders, session=session, changed_orders=changed_orders)
+
+        assert result.ok
+
+
+class TestDataFrameModels:
+    r"""Benchmarks of the operations on the DataFrame models loaded from the database."""
+
+    def test_facilities_get_index(
+        self, facilities: FacilityDataFrameModel, benchmark: Any, peak_memory: MeasurePeakMemory
+    ) -> None:
+        r"""Benchmark looking up a facility by its EAN."""
+
+        ean = facilities.df[facilities.c_ean].iloc[facilities.row_count // 2]
+
+        peak_memory(facilities.get_index, value=ean, column=facilities.c_ean)
+        facility_id = benchmark(facilities.get_index, value=ean, column=facilities.c_ean)
+
+        assert facility_id is not None
+
+    def test_facilities_format_func(
+        self, facilities: FacilityDataFrameModel, benchmark: Any, peak_memory: MeasurePeakMemory
+    ) -> None:
+        r"""Benchmark formatting all facilities as selectbox options."""
+
+        def format_all() -> list[str]:
+            format_func = facilities.format_func
+            return [format_func(i) for i in facilities.index]
+
+        peak_memory(format_all)
+        labels = benchmark.pedantic(format_all, rounds=3)
+
+        assert len(labels) == facilities.row_count
+
+    def test_orders_get_column(
+        self, orders: OrderDataFrameModel, benchmark: Any, peak_memory: MeasurePeakMemory
+    ) -> None:
+        r"""Benchmark extracting the sorted unique values of an order column."""
+
+        kwargs = {
+            'column': orders.c_assigned_to_displayname,
+            'unique': True,
+            'sort_ascending': True,
+        }
+
+        peak_memory(orders.get_column, **kwargs)
+        s = benchmark(orders.get_column, **kwargs)
+
+        assert not s.empty
+
+    def test_orders_localize_and_convert_timezone(
+        self, orders: OrderDataFrameModel, benchmark: Any, peak_memory: MeasurePeakMemory
+    ) -> None:
+        r"""Benchmark converting the datetime columns of the orders to another timezone."""
+
+        kwargs = {'target_tz': 'America/New_York', 'copy': True}
+
+        peak_memory(orders.localize_and_convert_timezone, **kwargs)
+        df = benchmark(orders.localize_and_convert_timezone, **kwargs)
+
+        assert df.shape == orders.shape
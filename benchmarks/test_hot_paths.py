@@ -0,0 +1,318 @@
+r"""Micro-benchmarks of the DataFrame model and translation functions run on every app rerun.
+
+The functions are benchmarked on generated DataFrames with pyarrow dtypes, which
+resemble the DataFrames loaded from the database, and thus do not need a database.
+The column operations of the DataFrame models are benchmarked with each backend of
+the models. The polars backend is skipped if polars is not installed.
+"""
+
+# Standard library
+from typing import Any
+
+# Third party
+import pandas as pd
+import pytest
+
+# Local
+from benchmarks.conftest import MeasurePeakMemory
+from benchmarks.data import generate_facilities_frame, generate_orders_frame
+from cambiato.config import Language
+from cambiato.models import DataFrameBackend, FacilityDataFrameModel, OrderDataFrameModel
+from cambiato.translations import (
+    create_translation_mapping,
+    load_translation,
+    translate_dataframe,
+)
+
+# The number of rounds of the benchmarks that need a fresh copy of the DataFrame each round.
+ROUNDS = 10
+
+DATETIME_COLS = (
+    OrderDataFrameModel.c_scheduled_start_at,
+    OrderDataFrameModel.c_scheduled_end_at,
+    OrderDataFrameModel.c_created_at,
+    OrderDataFrameModel.c_updated_at,
+)
+
+db_trans = load_translation(Language.EN).order_page.db
+order_type_trans = create_translation_mapping(db_trans.order_type)
+order_status_trans = create_translation_mapping(db_trans.order_status)
+
+
+@pytest.fixture(
+    scope='session',
+    params=[
+        pytest.param(DataFrameBackend.PANDAS, id='pandas'),
+        pytest.param(DataFrameBackend.POLARS, id='polars'),
+    ],
+)
+def backend(request: pytest.FixtureRequest) -> DataFrameBackend:
+    r"""The backends of the DataFrame models to benchmark."""
+
+    if request.param == DataFrameBackend.POLARS:
+        pytest.importorskip('polars')
+
+    return request.param
+
+
+@pytest.fixture(scope='session')
+def facilities(scale: int) -> FacilityDataFrameModel:
+    r"""A model of `scale` generated facilities."""
+
+    return FacilityDataFrameModel(df=generate_facilities_frame(rows=scale))
+
+
+@pytest.fixture(scope='session')
+def orders_df(scale: int) -> pd.DataFrame:
+    r"""A DataFrame of `scale` generated orders as loaded from the database."""
+
+    return generate_orders_frame(rows=scale)
+
+
+@pytest.fixture(scope='session')
+def orders(orders_df: pd.DataFrame) -> OrderDataFrameModel:
+    r"""A model of the generated orders."""
+
+    return OrderDataFrameModel(
+        df=orders_df.drop(
+            columns=[OrderDataFrameModel.c_order_type_id, OrderDataFrameModel.c_order_status_id]
+        )
+    )
+
+
+@pytest.fixture(scope='session')
+def orders_with_backend(
+    orders: OrderDataFrameModel, backend: DataFrameBackend
+) -> OrderDataFrameModel:
+    r"""A model of the generated orders processed by `backend`."""
+
+    return OrderDataFrameModel(df=orders.df, backend=backend)
+
+
+class TestGetIndex:
+    r"""Benchmarks of the methods `BaseDataFrameModel.get_index` and `get_indices`."""
+
+    @pytest.mark.parametrize(
+        'position',
+        [
+            pytest.param(0.0, id='first'),
+            pytest.param(0.5, id='middle'),
+            pytest.param(None, id='missing'),
+        ],
+    )
+    def test_int_column(
+        self,
+        position: float | None,
+        facilities: FacilityDataFrameModel,
+        benchmark: Any,
+        peak_memory: MeasurePeakMemory,
+    ) -> None:
+        r"""Benchmark looking up a facility by its EAN."""
+
+        c_ean = facilities.c_ean
+        ean = (
+            0
+            if position is None
+            else facilities.df[c_ean].iloc[int(facilities.row_count * position)]
+        )
+
+        peak_memory(facilities.get_index, value=ean, column=c_ean)
+        facility_id = benchmark(facilities.get_index, value=ean, column=c_ean)
+
+        assert (facility_id is None) is (position is None)
+
+    def test_str_column(
+        self, orders: OrderDataFrameModel, benchmark: Any, peak_memory: MeasurePeakMemory
+    ) -> None:
+        r"""Benchmark looking up an order by its external ID."""
+
+        c_ext_id = orders.c_ext_id
+        ext_id = orders.df[c_ext_id].iloc[orders.row_count // 2]
+
+        peak_memory(orders.get_index, value=ext_id, column=c_ext_id)
+        order_id = benchmark(orders.get_index, value=ext_id, column=c_ext_id)
+
+        assert order_id is not None
+
+    def test_bulk(
+        self,
+        facilities: FacilityDataFrameModel,
+        benchmark: Any,
+        peak_memory: MeasurePeakMemory,
+    ) -> None:
+        r"""Benchmark looking up the facilities of every tenth EAN with `get_indices`."""
+
+        c_ean = facilities.c_ean
+        eans = facilities.df[c_ean].iloc[::10]
+
+        peak_memory(facilities.get_indices, values=eans, column=c_ean)
+        lookup = benchmark(facilities.get_indices, values=eans, column=c_ean)
+
+        assert not lookup.missing.any()
+
+
+class TestGetIndexMap:
+    r"""Benchmarks of building the hash maps of `BaseDataFrameModel.get_index_map`."""
+
+    @pytest.mark.parametrize(
+        'column',
+        [
+            pytest.param(OrderDataFrameModel.c_facility_ean, id='int'),
+            pytest.param(OrderDataFrameModel.c_ext_id, id='str'),
+        ],
+    )
+    def test_build(
+        self,
+        column: str,
+        orders_with_backend: OrderDataFrameModel,
+        benchmark: Any,
+        peak_memory: MeasurePeakMemory,
+    ) -> None:
+        r"""Benchmark building the map of a column of the orders from scratch.
+
+        The cached maps and backend of the model are cleared before each round, which
+        includes converting the column into the format of the backend.
+        """
+
+        def build() -> int:
+            orders_with_backend.clear_lookups()
+            return len(orders_with_backend.get_index_map(column).values)
+
+        peak_memory(build)
+        nr_values = benchmark.pedantic(build, rounds=ROUNDS)
+
+        assert nr_values > 0
+
+
+class TestGetColumn:
+    r"""Benchmarks of the method `BaseDataFrameModel.get_column`."""
+
+    @pytest.mark.parametrize(
+        'column',
+        [
+            pytest.param(OrderDataFrameModel.c_assigned_to_displayname, id='low_cardinality'),
+            pytest.param(OrderDataFrameModel.c_ext_id, id='high_cardinality'),
+        ],
+    )
+    @pytest.mark.parametrize(
+        'options',
+        [
+            pytest.param({'unique': False, 'sort_ascending': None}, id='as_is'),
+            pytest.param({'unique': True, 'sort_ascending': None}, id='unique'),
+            pytest.param({'unique': True, 'sort_ascending': True}, id='unique_sorted'),
+        ],
+    )
+    def test_get_column(
+        self,
+        column: str,
+        options: dict[str, Any],
+        orders_with_backend: OrderDataFrameModel,
+        benchmark: Any,
+        peak_memory: MeasurePeakMemory,
+    ) -> None:
+        r"""Benchmark extracting a column of the orders."""
+
+        kwargs = {'column': column, **options}
+
+        peak_memory(orders_with_backend.get_column, **kwargs)
+        s = benchmark(orders_with_backend.get_column, **kwargs)
+
+        assert not s.empty
+
+
+class TestLocalizeAndConvertTimezone:
+    r"""Benchmarks of the method `BaseDataFrameModel.localize_and_convert_timezone`."""
+
+    @pytest.mark.parametrize(
+        'target_tz',
+        [pytest.param(None, id='localize'), pytest.param('Europe/Stockholm', id='convert')],
+    )
+    def test_localize_and_convert_timezone(
+        self,
+        target_tz: str | None,
+        orders_with_backend: OrderDataFrameModel,
+        benchmark: Any,
+        peak_memory: MeasurePeakMemory,
+    ) -> None:
+        r"""Benchmark localizing and converting the naive datetime columns of the orders inplace.
+
+        Each round operates on a fresh copy of the naive DataFrame like when the
+        orders are loaded from the database.
+        """
+
+        model = orders_with_backend
+        kwargs = {'target_tz': target_tz, 'ensure_datetime_cols': DATETIME_COLS, 'copy': False}
+
+        def setup() -> tuple[tuple[()], dict[str, Any]]:
+            return (), {'df': model.df.copy(), **kwargs}
+
+        peak_memory(model.localize_and_convert_timezone, **setup()[1])
+        df = benchmark.pedantic(model.localize_and_convert_timezone, setup=setup, rounds=ROUNDS)
+
+        assert df[OrderDataFrameModel.c_created_at].dt.tz is not None
+
+
+class TestDiff:
+    r"""Benchmarks of the method `BaseDataFrameModel.diff`."""
+
+    def test_diff_orders(
+        self, orders: OrderDataFrameModel, benchmark: Any, peak_memory: MeasurePeakMemory
+    ) -> None:
+        r"""Benchmark the diff between two snapshots of the orders.
+
+        The current snapshot has 1 % of the orders deleted and the descriptions
+        of 1 % of the orders edited compared to the previous snapshot.
+        """
+
+        c_description = OrderDataFrameModel.c_description
+        df = orders.df.iloc[orders.row_count // 100 :].copy()
+        edited = df.index[::100]
+        df.loc[edited, c_description] = 'Edited'
+        current = OrderDataFrameModel(df=df)
+
+        peak_memory(current.diff, previous=orders)
+        result = benchmark(current.diff, previous=orders)
+
+        assert len(result.deleted_rows) == orders.row_count // 100
+        assert len(result.edited_rows) <= edited.size
+
+
+class TestTranslateDataFrame:
+    r"""Benchmarks of the function `translate_dataframe`."""
+
+    @pytest.mark.parametrize('categorical', [True, False], ids=['categorical', 'string'])
+    def test_translate_order_type_and_status(
+        self,
+        categorical: bool,
+        orders_df: pd.DataFrame,
+        benchmark: Any,
+        peak_memory: MeasurePeakMemory,
+    ) -> None:
+        r"""Benchmark translating the order type and status names of the orders.
+
+        The translation is performed on a fresh copy of the DataFrame each round. Categorical columns are translated by
+        their categories and string columns row by row.
+        """
+
+        columns = (OrderDataFrameModel.c_order_type_name, OrderDataFrameModel.c_order_status_name)
+        df = (
+            orders_df
+            if categorical
+            else orders_df.astype(dict.fromkeys(columns, 'string[pyarrow]'))
+        )
+        kwargs = {
+            'translation': (order_type_trans, order_status_trans),
+            'columns': columns,
+            'id_column': (
+                OrderDataFrameModel.c_order_type_id,
+                OrderDataFrameModel.c_order_status_id,
+            ),
+        }
+
+        def setup() -> tuple[tuple[()], dict[str, Any]]:
+            return (), {'df': df.copy(), **kwargs}
+
+        peak_memory(translate_dataframe, **setup()[1])
+        df_result = benchmark.pedantic(translate_dataframe, setup=setup, rounds=ROUNDS)
+
+        assert df_result.shape == orders_df.shape
@@ -9,6 +9,7 @@ from cambiato import database as db
 from cambiato.app import APP_PATH
 from cambiato.config import (
     BITWARDEN_PASSWORDLESS_API_URL,
+    CACHE_DEFAULT_DIR,
     CONFIG_DIR,
     CONFIG_FILE_ENV_VAR,
     CONFIG_FILE_PATH,
@@ -21,8 +22,11 @@ from cambiato.config import (
     LOGGING_DEFAULT_FORMAT_DEBUG,
     PROG_NAME,
     BitwardenPasswordlessConfig,
+    CacheBackend,
+    CacheConfig,
     ConfigManager,
     DatabaseConfig,
+    DataFrameConfig,
     EmailLogHandler,
     FileLogHandler,
     Language,
@@ -40,6 +44,7 @@ from cambiato.exceptions import (
     ConfigError,
     ConfigFileNotFoundError,
     DataFrameError,
+    ExportError,
     MissingColumnError,
     MissingRowError,
     MultipleRowsForColumnValueError,
@@ -62,6 +67,7 @@ __all__ = [
     '__versiontuple__',
     # config
     'BITWARDEN_PASSWORDLESS_API_URL',
+    'CACHE_DEFAULT_DIR',
     'CONFIG_DIR',
     'CONFIG_FILE_ENV_VAR',
     'CONFIG_FILE_PATH',
@@ -74,8 +80,11 @@ __all__ = [
     'LOGGING_DEFAULT_FORMAT_DEBUG',
     'PROG_NAME',
     'BitwardenPasswordlessConfig',
+    'CacheBackend',
+    'CacheConfig',
     'ConfigManager',
     'DatabaseConfig',
+    'DataFrameConfig',
     'EmailLogHandler',
     'FileLogHandler',
     'Language',
@@ -96,6 +105,7 @@ __all__ = [
     'ConfigError',
     'ConfigFileNotFoundError',
     'DataFrameError',
+    'ExportError',
     'MissingColumnError',
     'MissingRowError',
     'MultipleRowsForColumnValueError',
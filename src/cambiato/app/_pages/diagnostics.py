@@ -0,0 +1,58 @@
+r"""The entry point of the diagnostics page."""
+
+# Standard library
+from pathlib import Path
+
+# Third party
+import streamlit as st
+
+# Local
+from cambiato.app._pages import Pages
+from cambiato.app.auth import Permission, authorized, has_permission
+from cambiato.app.components import ICON_ERROR
+from cambiato.app.config import (
+    APP_HOME_PAGE_URL,
+    APP_ISSUES_PAGE_URL,
+    MAINTAINER_INFO,
+)
+from cambiato.app.controllers.diagnostics import controller
+from cambiato.app.setup import cache_registry, cache_warm_up
+from cambiato.core import get_current_user
+
+DIAGNOSTICS_PAGE_PATH = Path(__file__)
+
+ABOUT = f"""Diagnostics of the web app for administrators.
+
+{MAINTAINER_INFO}
+"""
+
+
+@authorized(redirect=Pages.SIGN_IN)
+def diagnostics_page() -> None:
+    r"""Render the diagnostics page."""
+
+    st.set_page_config(
+        page_title='Cambiato - Diagnostics',
+        page_icon=':bar_chart:',
+        layout='wide',
+        menu_items={
+            'Get Help': APP_HOME_PAGE_URL,
+            'Report a bug': APP_ISSUES_PAGE_URL,
+            'About': ABOUT,
+        },
+        initial_sidebar_state='auto',
+    )
+
+    user = get_current_user()
+    if user is None:
+        return
+
+    if not has_permission(user=user, permission=Permission.DIAGNOSTICS_VIEW):
+        st.error('You are not authorized to view the diagnostics!', icon=ICON_ERROR)
+        return
+
+    controller(registry=cache_registry, warm_up_status=cache_warm_up.status)
+
+
+if __name__ in {'__main__', '__page__'}:
+    diagnostics_page()
@@ -13,12 +13,14 @@ from cambiato.app.auth import (
     authorized,
     has_permission,
 )
+from cambiato.app.components import sidebar_language_selector, sidebar_render_profile
 from cambiato.app.config import (
     APP_HOME_PAGE_URL,
     APP_ISSUES_PAGE_URL,
     MAINTAINER_INFO,
 )
 from cambiato.app.controllers.order import controller
+from cambiato.app.profiling import RenderProfiler, stage
 from cambiato.app.setup import cm, session_factory, translations
 from cambiato.core import get_current_user
 
@@ -50,16 +52,28 @@ def order_page() -> None:
     if user is None:
         return
 
-    translation = translations[cm.default_language]
+    language = sidebar_language_selector(
+        languages=cm.languages, default_language=cm.default_language
+    )
+
+    with RenderProfiler(name='order_page') as profiler:
+        with stage('translations'):
+            translation = translations[language]
+
+        with session_factory() as session:
+            controller(
+                session=session,
+                trans=translation.order_page,
+                language=language,
+                tz=cm.timezone,
+                user_id=user.user_id,
+                has_edit_permission=has_permission(user=user, permission=Permission.ORDERS_EDIT),
+            )
 
-    with session_factory() as session:
-        controller(
-            session=session,
-            trans=translation.order_page,
-            tz=cm.timezone,
-            user_id=user.user_id,
-            has_edit_permission=has_permission(user=user, permission=Permission.ORDERS_EDIT),
-        )
+    if profiler.profile is not None and has_permission(
+        user=user, permission=Permission.DIAGNOSTICS_VIEW
+    ):
+        sidebar_render_profile(profile=profiler.profile)
 
 
 if __name__ in {'__main__', '__page__'}:
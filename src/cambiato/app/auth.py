@@ -30,12 +30,17 @@ class Permission(IntEnum):
     -------
     ORDERS_EDIT
         A user is allowed to edit orders.
+
+    DIAGNOSTICS_VIEW
+        A user is allowed to view the diagnostics of the web app, e.g. the memory usage
+        of the cache.
     """
 
     ORDERS_EDIT = 1
+    DIAGNOSTICS_VIEW = 2
 
 
-permission_mapping = {Permission.ORDERS_EDIT: UserRole}
+permission_mapping = {Permission.ORDERS_EDIT: UserRole, Permission.DIAGNOSTICS_VIEW: AdminRole}
 
 
 def has_permission(user: User, permission: Permission) -> bool:
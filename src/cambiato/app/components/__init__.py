@@ -25,10 +25,20 @@ from cambiato.app.components.keys import (
     CREATE_ORDER_FORM_SCHEDULED_START_TIME_INPUT,
     CREATE_ORDER_FORM_TECHNICIAN_SELECTBOX,
     EDIT_ORDERS_DATAFRAME_EDITOR,
+    EDIT_ORDERS_VIEW_ORDER_STATUS_FILTER,
+    EDIT_ORDERS_VIEW_ORDER_TYPE_FILTER,
+    EDIT_ORDERS_VIEW_PAGING,
+    EDIT_ORDERS_VIEW_SCHEDULED_FILTER,
+    EDIT_ORDERS_VIEW_TECHNICIAN_FILTER,
+    LANGUAGE_SELECTOR,
     UTILITY_PILLS_SELECTOR,
 )
-from cambiato.app.components.selectors import utility_pills_selector
-from cambiato.app.components.sidebar import sidebar
+from cambiato.app.components.selectors import language_selector, utility_pills_selector
+from cambiato.app.components.sidebar import (
+    sidebar,
+    sidebar_language_selector,
+    sidebar_render_profile,
+)
 
 # The Public API
 __all__ = [
@@ -65,9 +75,18 @@ __all__ = [
     'CREATE_ORDER_FORM_SCHEDULED_START_TIME_INPUT',
     'CREATE_ORDER_FORM_TECHNICIAN_SELECTBOX',
     'EDIT_ORDERS_DATAFRAME_EDITOR',
+    'EDIT_ORDERS_VIEW_ORDER_STATUS_FILTER',
+    'EDIT_ORDERS_VIEW_ORDER_TYPE_FILTER',
+    'EDIT_ORDERS_VIEW_PAGING',
+    'EDIT_ORDERS_VIEW_SCHEDULED_FILTER',
+    'EDIT_ORDERS_VIEW_TECHNICIAN_FILTER',
+    'LANGUAGE_SELECTOR',
     'UTILITY_PILLS_SELECTOR',
     # sidebar
     'sidebar',
+    'sidebar_language_selector',
+    'sidebar_render_profile',
     # selectors
+    'language_selector',
     'utility_pills_selector',
 ]
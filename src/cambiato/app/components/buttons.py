@@ -11,6 +11,7 @@ import streamlit as st
 from cambiato.app.auth import get_current_user, sign_out
 from cambiato.app.components import keys
 from cambiato.app.components.forms.create_order_form import create_order_form
+from cambiato.app.profiling import profiled
 from cambiato.database import Session
 from cambiato.models import User
 from cambiato.models.dataframe import (
@@ -80,6 +81,7 @@ def sign_out_button(
     )
 
 
+@profiled()
 def create_order_button(
     label: str,
     session: Session,
@@ -1,6 +1,7 @@
 r"""The `edit_orders` component to edit multiple orders in DataFrame mode."""
 
 # Standard library
+from collections.abc import Mapping
 from typing import Literal, TypeAlias
 
 # Third party
@@ -16,6 +17,7 @@ from streamlit.column_config import (
 # Local
 from cambiato.app.components.icons import ICON_ERROR
 from cambiato.app.components.keys import EDIT_ORDERS_DATAFRAME_EDITOR
+from cambiato.app.profiling import profiled, stage
 from cambiato.core import OperationResult
 from cambiato.models.dataframe import (
     FacilityDataFrameModel,
@@ -29,6 +31,43 @@ from cambiato.translations import EditOrdersDataFrame, EditOrdersDataFrameValida
 ScheduledAt: TypeAlias = Literal['datetime', 'date']
 
 
+def _add_categories(df: pd.DataFrame, options: Mapping[str, pd.Series]) -> pd.DataFrame:
+    r"""Add the selectable options of categorical columns to their categories.
+
+    The data editor can only set values of a categorical column that are among its categories.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        The DataFrame to edit.
+
+    options : Mapping[str, pandas.Series]
+        The mapping of column names to their selectable options.
+
+    Returns
+    -------
+    pandas.DataFrame
+        A shallow copy of `df` with the options added to the categories of its
+        categorical columns.
+    """
+
+    df = df.copy(deep=False)
+
+    for col, opts in options.items():
+        s = df[col]
+        if not isinstance(s.dtype, pd.CategoricalDtype):
+            continue
+
+        categories = s.cat.categories
+        new_categories = pd.Index(opts.dropna().unique()).astype(categories.dtype)
+        new_categories = new_categories.difference(categories)
+
+        if not new_categories.empty:
+            df[col] = s.cat.add_categories(new_categories)
+
+    return df
+
+
 def _validate_duplicate_start_time(
     df: pd.DataFrame, schedule_datetime_type: ScheduledAt, error_msg: str
 ) -> OperationResult:
@@ -163,6 +202,7 @@ def _validate_edited_df(
     return r1, r2
 
 
+@profiled()
 def edit_orders(
     orders: OrderDataFrameModel,
     order_types: OrderTypeDataFrameModel,
@@ -237,11 +277,15 @@ def edit_orders(
     """
 
     scheduled_format = datetime_format if schedule_datetime_type == 'datetime' else date_format
+    technician_options = technicians.get_column(technicians.c_displayname)
+    order_status_options = order_statuses.get_column(order_statuses.c_name)
+    order_type_options = order_types.get_column(order_types.c_name)
+
     column_config = {
         '_index': NumberColumn(label=trans.c_order_id, disabled=True),
         orders.c_assigned_to_displayname: SelectboxColumn(
             label=trans.c_assigned_to_displayname,
-            options=technicians.get_column(technicians.c_displayname),
+            options=technician_options,
         ),
         orders.c_scheduled_start_at: DatetimeColumn(
             label=trans.c_scheduled_start_at, format=scheduled_format, pinned=False
@@ -251,12 +295,12 @@ def edit_orders(
         ),
         orders.c_order_status_name: SelectboxColumn(
             label=trans.c_order_status_name,
-            options=order_statuses.get_column(order_statuses.c_name),
+            options=order_status_options,
             required=True,
         ),
         orders.c_order_type_name: SelectboxColumn(
             label=trans.c_order_type_name,
-            options=order_types.get_column(order_types.c_name),
+            options=order_type_options,
             required=True,
         ),
         orders.c_facility_ean: SelectboxColumn(
@@ -291,24 +335,36 @@ def edit_orders(
     )
 
     banner_container = st.container(key='edit-orders-banner-container')
-    edited_df = st.data_editor(
-        orders.df,
-        hide_index=False,
-        column_config=column_config,
-        column_order=column_order,
-        disabled=not editable,
-        num_rows='dynamic' if allow_insert_and_delete else 'fixed',
-        key=key,
-    )
+    with stage('pandas: add categories'):
+        df = _add_categories(
+            orders.df,
+            options={
+                orders.c_assigned_to_displayname: technician_options,
+                orders.c_order_status_name: order_status_options,
+                orders.c_order_type_name: order_type_options,
+            },
+        )
+
+    with stage('st.data_editor'):
+        edited_df = st.data_editor(
+            df,
+            hide_index=False,
+            column_config=column_config,
+            column_order=column_order,
+            disabled=not editable,
+            num_rows='dynamic' if allow_insert_and_delete else 'fixed',
+            key=key,
+        )
 
     if not editable:
         return True, OrderDataFrameModel(df=edited_df)
 
-    results = _validate_edited_df(
-        df=edited_df,
-        schedule_datetime_type=schedule_datetime_type,
-        trans=trans.validation_messages,
-    )
+    with stage('validation'):
+        results = _validate_edited_df(
+            df=edited_df,
+            schedule_datetime_type=schedule_datetime_type,
+            trans=trans.validation_messages,
+        )
 
     is_valid = True
     for r in results:
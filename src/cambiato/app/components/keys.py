@@ -16,4 +16,12 @@ CREATE_ORDER_FORM_SCHEDULED_END_TIME_INPUT = 'create-order-form-scheduled-end-ti
 
 EDIT_ORDERS_DATAFRAME_EDITOR = 'edit-orders-dataframe-editor'
 
+EDIT_ORDERS_VIEW_ORDER_STATUS_FILTER = 'edit-orders-view-order-status-filter'
+EDIT_ORDERS_VIEW_ORDER_TYPE_FILTER = 'edit-orders-view-order-type-filter'
+EDIT_ORDERS_VIEW_TECHNICIAN_FILTER = 'edit-orders-view-technician-filter'
+EDIT_ORDERS_VIEW_SCHEDULED_FILTER = 'edit-orders-view-scheduled-filter'
+EDIT_ORDERS_VIEW_PAGING = 'edit-orders-view-paging'
+
+LANGUAGE_SELECTOR = 'language-selector'
+
 UTILITY_PILLS_SELECTOR = 'utility-pills-selector'
@@ -1,14 +1,66 @@
 r"""Components for selecting objects from a collection, e.g. selectboxes."""
 
+# Standard library
+from collections.abc import Sequence
+
 # Third party
 import streamlit as st
 
 # Local
+from cambiato.config import Language
 from cambiato.models import UtilityDataFrameModel
 
 from . import keys
 from .core import LabelVisibility
 
+# The names of the languages in their own language.
+LANGUAGE_NAMES: dict[Language, str] = {Language.EN: 'English', Language.SV: 'Svenska'}
+
+
+def language_selector(
+    label: str,
+    languages: Sequence[Language],
+    default: Language,
+    label_visibility: LabelVisibility = 'visible',
+    key: str = keys.LANGUAGE_SELECTOR,
+) -> Language:
+    r"""Select the language of the app for the session of the user.
+
+    Parameters
+    ----------
+    label : str
+        The label of the selectbox.
+
+    languages : Sequence[cambiato.config.Language]
+        The languages to select from.
+
+    default : cambiato.config.Language
+        The language that is selected when the session starts. If not in
+        `languages` the first language is selected.
+
+    label_visibility : Literal['visible', 'hidden', 'collapsed']
+        The visibility of the label. The default is 'visible'.
+
+    key : str, default cambiato.app.components.keys.LANGUAGE_SELECTOR
+        The unique identifier of the selector in the session state.
+
+    Returns
+    -------
+    cambiato.config.Language
+        The selected language.
+    """
+
+    selected = st.selectbox(
+        label=label,
+        options=languages,
+        index=languages.index(default) if default in languages else 0,
+        format_func=lambda language: LANGUAGE_NAMES.get(language, language),
+        label_visibility=label_visibility,
+        key=key,
+    )
+
+    return default if selected is None else selected
+
 
 def utility_pills_selector(
     label: str,
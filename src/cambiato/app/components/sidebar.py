@@ -1,10 +1,18 @@
 r"""Sidebar components."""
 
+# Standard library
+from collections.abc import Sequence
+
 # Third party
+import pandas as pd
 import streamlit as st
 
 # Local
 from cambiato.app.components.buttons import sign_out_button
+from cambiato.app.components.selectors import language_selector
+from cambiato.app.profiling import RenderProfile
+from cambiato.app.session_state import LANGUAGE
+from cambiato.config import Language
 from cambiato.models import User
 
 
@@ -25,3 +33,60 @@ def sidebar(is_authenticated: bool, user: User | None = None) -> None:
 
     with st.sidebar:
         sign_out_button(user=user)
+
+
+def sidebar_language_selector(
+    languages: Sequence[Language], default_language: Language
+) -> Language:
+    r"""Render the language selector in the sidebar and keep the language of the session.
+
+    The selected language is stored in the session state and is kept when
+    the user navigates between pages.
+
+    Parameters
+    ----------
+    languages : Sequence[cambiato.config.Language]
+        The languages the user can select from. The selector is
+        only rendered if there are multiple languages.
+
+    default_language : cambiato.config.Language
+        The language that is selected when the session of the user starts.
+
+    Returns
+    -------
+    cambiato.config.Language
+        The language of the session of the user.
+    """
+
+    language = Language(st.session_state.get(LANGUAGE, default_language))
+
+    if len(languages) > 1:
+        with st.sidebar:
+            language = language_selector(label='Language', languages=languages, default=language)
+
+    st.session_state[LANGUAGE] = language
+
+    return language
+
+
+def sidebar_render_profile(profile: RenderProfile) -> None:
+    r"""Render the wall time of the stages of a profiled rerun in the sidebar.
+
+    Parameters
+    ----------
+    profile : cambiato.app.profiling.RenderProfile
+        The profile of the rerun.
+    """
+
+    with st.sidebar.expander('Render profile'):
+        st.metric('Total [ms]', f'{profile.seconds * 1000:.1f}')
+        st.dataframe(
+            pd.DataFrame(
+                {
+                    'Stage': ['\u2003' * s.depth + s.name for s in profile.stages],
+                    'Time [ms]': [s.seconds * 1000 for s in profile.stages],
+                }
+            ),
+            hide_index=True,
+            column_config={'Time [ms]': st.column_config.NumberColumn(format='%.1f')},
+        )
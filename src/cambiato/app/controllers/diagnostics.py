@@ -0,0 +1,30 @@
+r"""The page controller of the diagnostics page."""
+
+# Third party
+import streamlit as st
+
+# Local
+from cambiato.app.views.diagnostics import (
+    cache_memory_view,
+    cache_stats_view,
+    cache_warm_up_view,
+)
+from cambiato.database import CacheRegistry, WarmUpStatus
+
+
+def controller(registry: CacheRegistry, warm_up_status: WarmUpStatus) -> None:
+    r"""Render the diagnostics page.
+
+    Parameters
+    ----------
+    registry : cambiato.db.CacheRegistry
+        The registry of the objects cached in the memory of the web app process.
+
+    warm_up_status : cambiato.db.WarmUpStatus
+        The status of the cache warm-up of the web app process.
+    """
+
+    st.title('Diagnostics')
+    cache_warm_up_view(status=warm_up_status)
+    cache_stats_view(registry=registry)
+    cache_memory_view(registry=registry)
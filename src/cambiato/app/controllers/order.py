@@ -13,22 +13,22 @@ from cambiato.app.database import (
     get_all_facilities_cached,
     get_all_order_statuses_cached,
     get_all_order_types_cached,
-    get_all_orders_cached,
     get_all_technicians_cached,
     get_all_utilities_cached,
 )
+from cambiato.app.profiling import profiled, stage
 from cambiato.app.views import edit_orders_view
+from cambiato.config import Language
 from cambiato.database import Session
 from cambiato.models.dataframe import ChecklistDataFrameModel, FacilityDataFrameModel
-from cambiato.translations import (
-    OrderPage,
-    create_translation_mapping,
-)
+from cambiato.translations import OrderPage
 
 
+@profiled('order_controller')
 def controller(
     session: Session,
     trans: OrderPage,
+    language: Language,
     tz: ZoneInfo,
     user_id: str,
     has_edit_permission: bool = True,
@@ -43,6 +43,9 @@ def controller(
     trans : cambiato.translations.OrderPage
         The translations for the order page.
 
+    language : cambiato.config.Language
+        The language of the page. The names of the utilities, order types and order
+        statuses are translated into the language by the database.
 
     tz : zoneinfo.ZoneInfo
         The timezone where the application is used.
@@ -57,9 +60,8 @@ def controller(
     if page_title := trans.controller.page_title:
         st.title(page_title)
 
-    utilities = get_all_utilities_cached(
-        _session=session, translation=create_translation_mapping(trans.db.utility)
-    )
+    with stage('database: utilities'):
+        utilities = get_all_utilities_cached(_session=session, language=language)
 
     left_col, right_col, _ = st.columns((3, 1, 6), vertical_alignment='center')
     with left_col:
@@ -67,28 +69,26 @@ def controller(
             label='Utility', utilities=utilities, default=0, label_visibility='collapsed'
         )
 
-    technicians = get_all_technicians_cached(_session=session)
-
-    if selected_utility:
-        utility_ids = (selected_utility,)
-        facilities = get_all_facilities_cached(_session=session, utility_ids=utility_ids)
-        checklists = get_all_checklists_cached(_session=session, utility_ids=utility_ids)
-        create_order_button_disabled = False
-    else:
-        utility_ids = None
-        facilities = FacilityDataFrameModel()
-        checklists = ChecklistDataFrameModel()
-        create_order_button_disabled = True
-
-    order_type_trans = create_translation_mapping(trans.db.order_type)
-    order_types = get_all_order_types_cached(
-        _session=session, utility_ids=utility_ids, translation=order_type_trans
-    )
-
-    order_status_trans = create_translation_mapping(trans.db.order_status)
-    order_statuses = get_all_order_statuses_cached(
-        _session=session, utility_ids=utility_ids, translation=order_status_trans
-    )
+    with stage('database: reference data'):
+        technicians = get_all_technicians_cached(_session=session)
+
+        if selected_utility:
+            utility_ids = (selected_utility,)
+            facilities = get_all_facilities_cached(_session=session, utility_ids=utility_ids)
+            checklists = get_all_checklists_cached(_session=session, utility_ids=utility_ids)
+            create_order_button_disabled = False
+        else:
+            utility_ids = None
+            facilities = FacilityDataFrameModel()
+            checklists = ChecklistDataFrameModel()
+            create_order_button_disabled = True
+
+        order_types = get_all_order_types_cached(
+            _session=session, utility_ids=utility_ids, language=language
+        )
+        order_statuses = get_all_order_statuses_cached(
+            _session=session, utility_ids=utility_ids, language=language
+        )
 
     with right_col:
         create_order_button(
@@ -112,16 +112,9 @@ def controller(
         st.info(trans.controller.select_utility_info_message, icon=ICON_INFO)
         return
 
-    orders = get_all_orders_cached(
-        _session=session,
-        utility_ids=utility_ids,
-        order_type_trans=order_type_trans,
-        order_status_trans=order_status_trans,
-        tz=tz,
-    )
     edit_orders_view(
         session=session,
-        orders=orders,
+        utility_ids=utility_ids,
         order_types=order_types,
         order_statuses=order_statuses,
         facilities=facilities,
@@ -129,6 +122,7 @@ def controller(
         trans=trans.edit_orders_view,
         edit_orders_df_trans=trans.edit_orders_df,
         tz=tz,
+        language=language,
         user_id=user_id,
         has_edit_permission=has_edit_permission,
     )
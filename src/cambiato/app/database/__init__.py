@@ -1,11 +1,11 @@
 r"""Database functionality for the web app."""
 
 from .cache import (
+    get_active_orders_page_cached,
     get_all_checklists_cached,
     get_all_facilities_cached,
     get_all_order_statuses_cached,
     get_all_order_types_cached,
-    get_all_orders_cached,
     get_all_technicians_cached,
     get_all_utilities_cached,
 )
@@ -13,11 +13,11 @@ from .cache import (
 # The Public API
 __all__ = [
     # cache
+    'get_active_orders_page_cached',
     'get_all_checklists_cached',
     'get_all_facilities_cached',
     'get_all_order_statuses_cached',
     'get_all_order_types_cached',
-    'get_all_orders_cached',
     'get_all_technicians_cached',
     'get_all_utilities_cached',
 ]
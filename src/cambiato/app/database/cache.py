@@ -1,28 +1,129 @@
-r"""Cached database functions."""
+r"""Cached database functions.
 
-# Standard library
-from datetime import timedelta
+The results are cached by the result cache of the web app in the memory of each process and
+tracked by the cache registry of the process, which accounts for their memory usage and evicts
+the least recently used results if the byte budget of the cache is exceeded. If the arrow cache
+backend is configured the DataFrame models of facilities, checklists and technicians are
+loaded from memory-mapped Arrow IPC files, which are shared between all processes of the
+web app using the same cache directory.
+
+The results are tagged with the versions of the tables they are loaded from. The invalidation
+events emitted by the functions writing to the database bump the versions of the changed tables
+for the changed utilities, while the results of the other utilities stay cached.
+
+The calls of the cached functions made by the order page for all utilities and configured
+languages are created by :func:`create_warm_up_calls`, which is used by the cache warm-up that
+is started by :mod:`cambiato.app.setup` when the process starts.
+"""
 
-# Third party
-import streamlit as st
+# Standard library
+from collections.abc import Iterator
 
 # Local
+from cambiato.app.setup import cm, result_cache
 from cambiato.database import (
-    get_all_active_orders,
+    DEFAULT_PAGE_SIZE,
+    Session,
+    WarmUpCall,
+    get_active_orders_page,
+    get_all_checklists,
+    get_all_facilities,
+    get_all_order_statuses,
+    get_all_order_types,
+    get_all_technicians,
+    get_all_utilities,
+)
+from cambiato.database.models import (
+    Checklist,
+    CustomRole,
+    Facility,
+    Location,
+    Order,
+    OrderStatus,
+    OrderType,
+    Translation,
+    User,
+    Utility,
+)
+from cambiato.models import (
+    ChecklistDataFrameModel,
+    FacilityDataFrameModel,
+    UserDataFrameModel,
+)
+
+get_all_checklists_cached = result_cache.cached(
     get_all_checklists,
+    namespace='checklists',
+    tables=(Checklist.__tablename__,),
+    model=ChecklistDataFrameModel,
+)
+get_all_facilities_cached = result_cache.cached(
     get_all_facilities,
+    namespace='facilities',
+    tables=(Facility.__tablename__, Location.__tablename__),
+    model=FacilityDataFrameModel,
+)
+get_all_order_statuses_cached = result_cache.cached(
     get_all_order_statuses,
+    namespace='order_statuses',
+    tables=(OrderStatus.__tablename__, Translation.__tablename__),
+)
+get_all_order_types_cached = result_cache.cached(
     get_all_order_types,
+    namespace='order_types',
+    tables=(OrderType.__tablename__, Translation.__tablename__),
+)
+get_active_orders_page_cached = result_cache.cached(
+    get_active_orders_page,
+    namespace='order_pages',
+    tables=(
+        Order.__tablename__,
+        OrderType.__tablename__,
+        OrderStatus.__tablename__,
+        Facility.__tablename__,
+        Location.__tablename__,
+        User.__tablename__,
+        Translation.__tablename__,
+    ),
+)
+get_all_technicians_cached = result_cache.cached(
     get_all_technicians,
+    namespace='technicians',
+    tables=(User.__tablename__, CustomRole.__tablename__),
+    model=UserDataFrameModel,
+)
+get_all_utilities_cached = result_cache.cached(
     get_all_utilities,
+    namespace='utilities',
+    tables=(Utility.__tablename__, Translation.__tablename__),
 )
 
-hour_1 = timedelta(hours=1)
 
-get_all_checklists_cached = st.cache_resource(ttl=hour_1)(get_all_checklists)
-get_all_facilities_cached = st.cache_resource(ttl=hour_1)(get_all_facilities)
-get_all_order_statuses_cached = st.cache_resource(ttl=hour_1)(get_all_order_statuses)
-get_all_order_types_cached = st.cache_resource(ttl=hour_1)(get_all_order_types)
-get_all_orders_cached = st.cache_resource(ttl=hour_1)(get_all_active_orders)
-get_all_technicians_cached = st.cache_resource(ttl=hour_1)(get_all_technicians)
-get_all_utilities_cached = st.cache_resource(ttl=hour_1)(get_all_utilities)
+def create_warm_up_calls(session: Session) -> Iterator[WarmUpCall]:
+    r"""Create the calls of the cached functions made by the order page for all utilities."""
+
+    utilities = get_all_utilities_cached(_session=session, language=cm.default_language)
+    utility_ids = [(int(utility_id),) for utility_id in utilities.index]
+
+    yield WarmUpCall(func=get_all_technicians_cached, kwargs={})
+
+    for language in cm.languages:
+        yield WarmUpCall(func=get_all_utilities_cached, kwargs={'language': language})
+        for ids in (None, *utility_ids):
+            kwargs = {'utility_ids': ids, 'language': language}
+            yield WarmUpCall(func=get_all_order_types_cached, kwargs=kwargs)
+            yield WarmUpCall(func=get_all_order_statuses_cached, kwargs=kwargs)
+        for ids in utility_ids:
+            yield WarmUpCall(
+                func=get_active_orders_page_cached,
+                kwargs={
+                    'limit': DEFAULT_PAGE_SIZE,
+                    'utility_ids': ids,
+                    'tz': cm.timezone,
+                    'language': language,
+                },
+            )
+
+    for ids in utility_ids:
+        yield WarmUpCall(func=get_all_facilities_cached, kwargs={'utility_ids': ids})
+        yield WarmUpCall(func=get_all_checklists_cached, kwargs={'utility_ids': ids})
@@ -9,7 +9,7 @@ import streamlit_passwordless as stp
 
 # Local
 from cambiato.app._pages import Pages
-from cambiato.app.auth import get_current_user, is_authenticated
+from cambiato.app.auth import Permission, get_current_user, has_permission, is_authenticated
 from cambiato.app.components.sidebar import sidebar
 
 APP_PATH = Path(__file__)
@@ -27,6 +27,13 @@ def main() -> None:
         st.Page(page=Pages.SIGN_IN, title='Sign in and register', default=True),
         st.Page(page=Pages.ORDER, title='Order'),
     ]
+    if (
+        _is_authenticated
+        and user is not None
+        and has_permission(user=user, permission=Permission.DIAGNOSTICS_VIEW)
+    ):
+        pages.append(st.Page(page=Pages.DIAGNOSTICS, title='Diagnostics'))
+
     page = st.navigation(pages, position='top' if _is_authenticated else 'hidden')
 
     sidebar(is_authenticated=_is_authenticated, user=user)
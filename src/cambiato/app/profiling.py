@@ -0,0 +1,246 @@
+r"""Profile the wall time of the stages of rendering the pages of the web app.
+
+The profiling is opt-in and enabled by :func:`enable_profiling`. A rerun of a page is profiled
+by :class:`RenderProfiler` and its stages, e.g. loading data from the database or rendering
+the data editor, are timed by the context manager :func:`stage` or the decorator :func:`profiled`.
+Stages can be nested and are no-ops when no rerun is profiled. The profile of each rerun is
+logged as a JSON line to the logger "cambiato.profiling".
+
+A function decorated with :func:`profiled` that is called outside of a profiled rerun, e.g. a
+fragment that reruns on its own, is profiled as a rerun of its own when profiling is enabled.
+"""
+
+# Standard library
+import json
+import logging
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from datetime import UTC, datetime
+from functools import wraps
+from types import TracebackType
+from typing import NamedTuple, ParamSpec, Self, TypeVar
+
+PROFILING_LOGGER_NAME = 'cambiato.profiling'
+
+profiling_logger = logging.getLogger(PROFILING_LOGGER_NAME)
+
+P = ParamSpec('P')
+T = TypeVar('T')
+
+_enabled = False
+
+
+def enable_profiling(enabled: bool = True) -> None:
+    r"""Enable or disable the profiling of the reruns of the pages.
+
+    Parameters
+    ----------
+    enabled : bool, default True
+        True to enable the profiling and False to disable it.
+    """
+
+    global _enabled  # noqa: PLW0603
+    _enabled = enabled
+
+
+def is_profiling_enabled() -> bool:
+    r"""Check if the profiling of the reruns of the pages is enabled."""
+
+    return _enabled
+
+
+class StageTiming(NamedTuple):
+    r"""The wall time of a stage of a rerun.
+
+    Parameters
+    ----------
+    name : str
+        The name of the stage.
+
+    seconds : float
+        The wall time of the stage in seconds.
+
+    depth : int
+        The nesting depth of the stage. The top level stages have depth 0.
+    """
+
+    name: str
+    seconds: float
+    depth: int
+
+
+class RenderProfile(NamedTuple):
+    r"""The profile of a rerun of a page.
+
+    Parameters
+    ----------
+    name : str
+        The name of the profiled rerun, e.g. the name of the page.
+
+    started_at : datetime.datetime
+        When the rerun started (UTC).
+
+    seconds : float
+        The total wall time of the rerun in seconds.
+
+    stages : tuple[cambiato.app.profiling.StageTiming, ...]
+        The timed stages of the rerun in the order they started.
+    """
+
+    name: str
+    started_at: datetime
+    seconds: float
+    stages: tuple[StageTiming, ...]
+
+    def to_json(self) -> str:
+        r"""Serialize the profile into a JSON line with the wall times in milliseconds."""
+
+        return json.dumps(
+            {
+                'name': self.name,
+                'started_at': self.started_at.isoformat(),
+                'ms': round(self.seconds * 1000, 2),
+                'stages': [
+                    {'name': s.name, 'ms': round(s.seconds * 1000, 2), 'depth': s.depth}
+                    for s in self.stages
+                ],
+            },
+            ensure_ascii=False,
+        )
+
+
+class _Recording:
+    r"""The stages recorded during a profiled rerun."""
+
+    def __init__(self) -> None:
+        self.stages: list[StageTiming] = []
+        self.depth = 0
+
+
+_recording: ContextVar[_Recording | None] = ContextVar('cambiato_profiling', default=None)
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    r"""Time a stage of the profiled rerun.
+
+    The stage is not timed if no rerun is profiled.
+
+    Parameters
+    ----------
+    name : str
+        The name of the stage.
+    """
+
+    recording = _recording.get()
+    if recording is None:
+        yield
+        return
+
+    depth = recording.depth
+    position = len(recording.stages)
+    recording.stages.append(StageTiming(name=name, seconds=0.0, depth=depth))
+    recording.depth += 1
+    start = time.perf_counter()
+
+    try:
+        yield
+    finally:
+        recording.stages[position] = StageTiming(
+            name=name, seconds=time.perf_counter() - start, depth=depth
+        )
+        recording.depth = depth
+
+
+class RenderProfiler:
+    r"""Profile a rerun of a page.
+
+    The profiler is a context manager that records the stages timed within its block.
+    The profile is logged and available from the attribute `profile` when the block exits.
+    If profiling is disabled or a rerun is already profiled the profiler does nothing.
+
+    Parameters
+    ----------
+    name : str
+        The name of the profiled rerun, e.g. the name of the page.
+
+    logger : logging.Logger, default cambiato.app.profiling.profiling_logger
+        The logger of the profiles.
+    """
+
+    def __init__(self, name: str, logger: logging.Logger = profiling_logger) -> None:
+        self.name = name
+        self.logger = logger
+        self.profile: RenderProfile | None = None
+        self._token: Token[_Recording | None] | None = None
+        self._started_at = datetime.now(UTC)
+        self._start = 0.0
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}(name={self.name!r})'
+
+    def __enter__(self) -> Self:
+        if not _enabled or _recording.get() is not None:
+            return self
+
+        self._token = _recording.set(_Recording())
+        self._started_at = datetime.now(UTC)
+        self._start = time.perf_counter()
+
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if self._token is None:
+            return
+
+        seconds = time.perf_counter() - self._start
+        recording = _recording.get()
+        _recording.reset(self._token)
+        self._token = None
+
+        self.profile = RenderProfile(
+            name=self.name,
+            started_at=self._started_at,
+            seconds=seconds,
+            stages=() if recording is None else tuple(recording.stages),
+        )
+        self.logger.info(self.profile.to_json())
+
+
+def profiled(name: str | None = None) -> Callable[[Callable[P, T]], Callable[P, T]]:
+    r"""Time the calls of a function as a stage of the profiled rerun.
+
+    A call outside of a profiled rerun is profiled as a rerun of its own.
+
+    Parameters
+    ----------
+    name : str or None, default None
+        The name of the stage. If None the name of the function is used.
+
+    Returns
+    -------
+    Callable[[Callable[P, T]], Callable[P, T]]
+        The decorator of the function.
+    """
+
+    def decorator(func: Callable[P, T]) -> Callable[P, T]:
+        stage_name = func.__name__ if name is None else name
+
+        @wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            if not _enabled:
+                return func(*args, **kwargs)
+
+            with RenderProfiler(name=stage_name), stage(stage_name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -20,3 +20,6 @@ USER_UNAUTHORIZED_PERMISSIONS = 'user-unauthorized-permissions'
 
 # The validation errors for the create order form.
 CREATE_ORDER_FORM_VALIDATION_ERRORS = 'create-order-form-validation-errors'
+
+# The language selected by the user, which the pages render in.
+LANGUAGE = 'language'
@@ -1,7 +1,9 @@
 r"""Setup the resources needed by the Cambiato web app."""
 
 # Standard library
+import importlib
 import logging
+from collections.abc import Callable, Iterable
 
 # Third party
 import streamlit as st
@@ -10,14 +12,37 @@ import streamlit_passwordless as stp
 # Local
 from cambiato import exceptions
 from cambiato.app.components.icons import ICON_ERROR
-from cambiato.config import load_config
-from cambiato.database import create_session_factory
-from cambiato.log import setup_logging
-from cambiato.translations import load_translation
+from cambiato.app.profiling import enable_profiling, profiling_logger
+from cambiato.config import CacheBackend, LogHanderType, load_config
+from cambiato.database import (
+    ArrowIPCCache,
+    CacheRegistry,
+    CacheWarmUp,
+    ResultCache,
+    Session,
+    WarmUpCall,
+    create_session_factory,
+)
+from cambiato.log import add_handlers, setup_logging
+from cambiato.models import set_default_backend
+from cambiato.translations import TranslationRegistry
 
 logger = logging.getLogger(__name__)
 
 
+def _create_warm_up_calls(session: Session) -> Iterable[WarmUpCall]:
+    r"""Create the calls of the cache warm-up.
+
+    The cached functions are declared by :mod:`cambiato.app.database.cache`, which depends on
+    the resources of this module, and are therefore imported by the warm-up thread when it runs.
+    """
+
+    module = importlib.import_module('cambiato.app.database.cache')
+    create_calls: Callable[[Session], Iterable[WarmUpCall]] = module.create_warm_up_calls
+
+    return create_calls(session)
+
+
 try:
     cm = load_config()
 except exceptions.ConfigError as e:
@@ -27,6 +52,21 @@ except exceptions.ConfigError as e:
 
 setup_logging(config=cm.logging)
 
+if cm.profiling.enabled:
+    profiling_logger.setLevel(logging.INFO)
+    if cm.profiling.file is not None:
+        profiling_logger.propagate = False
+        add_handlers(
+            logger=profiling_logger,
+            handler_type=LogHanderType.FILE,
+            config={'profiling': cm.profiling.file},
+            exclude=None,
+            default_format=cm.logging.format,
+            default_datetime_format=cm.logging.datetime_format,
+        )
+enable_profiling(cm.profiling.enabled)
+set_default_backend(cm.dataframe.backend)
+
 try:
     session_factory = create_session_factory(
         url=cm.database.url,
@@ -45,4 +85,22 @@ bwp_client = stp.BitwardenPasswordlessClient(
     public_key=cm.bwp.public_key, private_key=cm.bwp.private_key
 )
 
-translations = {lang: load_translation(lang) for lang in cm.languages}
+translations = TranslationRegistry(languages=cm.languages)
+
+shared_cache: ArrowIPCCache | None = None
+
+if cm.cache.backend == CacheBackend.ARROW:
+    try:
+        shared_cache = ArrowIPCCache(directory=cm.cache.directory, ttl=cm.cache.ttl)
+    except OSError as e:
+        logger.warning(
+            f'Could not create the cache directory "{cm.cache.directory}". '
+            f'Falling back to the in-memory cache.\n{e!s}'
+        )
+
+cache_registry = CacheRegistry(max_bytes=cm.cache.max_memory, ttl=cm.cache.ttl)
+result_cache = ResultCache(registry=cache_registry, shared_cache=shared_cache)
+cache_warm_up = CacheWarmUp(session_factory=session_factory, ready_file=cm.cache.ready_file)
+
+if cm.cache.warm_up:
+    cache_warm_up.start(calls=_create_warm_up_calls)
@@ -0,0 +1,147 @@
+r"""The views of the diagnostics page."""
+
+# Third party
+import pandas as pd
+import streamlit as st
+
+# Local
+from cambiato.database import CacheRegistry, WarmUpStatus
+
+_MIB = 1024**2
+_MS = 1000
+
+
+def _to_mib(nbytes: int) -> float:
+    r"""Convert bytes into mebibytes."""
+
+    return nbytes / _MIB
+
+
+def cache_warm_up_view(status: WarmUpStatus) -> None:
+    r"""Render the status of the cache warm-up of the process.
+
+    Parameters
+    ----------
+    status : cambiato.db.WarmUpStatus
+        The status of the cache warm-up.
+    """
+
+    st.subheader('Cache warm-up')
+
+    left_col, middle_col, right_col = st.columns(3)
+    left_col.metric('Ready', 'Yes' if status.ready else 'No')
+    middle_col.metric('Calls', f'{status.done}/{status.total}')
+    right_col.metric('Failed calls', status.failed)
+    st.caption(f'Duration: {status.duration:.2f} s')
+
+
+def cache_stats_view(registry: CacheRegistry) -> None:
+    r"""Render the statistics of the cached functions of the cache registry of the process.
+
+    Parameters
+    ----------
+    registry : cambiato.db.CacheRegistry
+        The registry of the objects cached in the memory of the web app process.
+    """
+
+    st.subheader('Cache statistics')
+    st.caption(
+        'The lookups, removed entries and loads of each cached function of this web app process '
+        'since it started or the statistics were reset. A load is the call of the function after '
+        'a miss, which may be served by the cache files shared between the web app processes.'
+    )
+
+    stats = list(registry.stats().values())
+    st.dataframe(
+        pd.DataFrame(
+            {
+                'Function': [s.namespace for s in stats],
+                'Hits': [s.hits for s in stats],
+                'Misses': [s.misses for s in stats],
+                'Hit ratio': [s.hit_ratio for s in stats],
+                'Evictions': [s.evictions for s in stats],
+                'Expirations': [s.expirations for s in stats],
+                'Invalidations': [s.invalidations for s in stats],
+                'Loads': [s.loads for s in stats],
+                'Mean load [ms]': [
+                    None if s.mean_load_seconds is None else s.mean_load_seconds * _MS
+                    for s in stats
+                ],
+                'Max load [ms]': [s.max_load_seconds * _MS for s in stats],
+                'Entries': [s.entries for s in stats],
+                'Memory [MiB]': [_to_mib(s.nbytes) for s in stats],
+                'Largest entry [MiB]': [_to_mib(s.max_nbytes) for s in stats],
+            }
+        ),
+        hide_index=True,
+        column_config={
+            'Hit ratio': st.column_config.NumberColumn(format='percent'),
+            'Mean load [ms]': st.column_config.NumberColumn(format='%.1f'),
+            'Max load [ms]': st.column_config.NumberColumn(format='%.1f'),
+            'Memory [MiB]': st.column_config.NumberColumn(format='%.2f'),
+            'Largest entry [MiB]': st.column_config.NumberColumn(format='%.2f'),
+        },
+    )
+
+    if st.button('Reset statistics', help='Reset the counters of the cache statistics.'):
+        registry.reset_stats()
+        st.rerun()
+
+
+def cache_memory_view(registry: CacheRegistry) -> None:
+    r"""Render the memory usage of the entries of the cache registry of the process.
+
+    Parameters
+    ----------
+    registry : cambiato.db.CacheRegistry
+        The registry of the objects cached in the memory of the web app process.
+    """
+
+    st.subheader('Cache memory usage')
+    st.caption(
+        'The memory usage of the data cached by this web app process. Shared entries '
+        'are memory-mapped from cache files shared between the web app processes.'
+    )
+
+    entries = registry.entries()
+    max_bytes = registry.max_bytes
+
+    left_col, middle_col, right_col = st.columns(3)
+    left_col.metric('Memory usage [MiB]', f'{_to_mib(registry.total_bytes):.1f}')
+    middle_col.metric(
+        'Byte budget [MiB]', 'Unlimited' if max_bytes is None else f'{_to_mib(max_bytes):.1f}'
+    )
+    right_col.metric('Entries', len(entries))
+
+    usage = registry.usage_by_namespace()
+    st.dataframe(
+        pd.DataFrame(
+            {
+                'Function': list(usage),
+                'Entries': [nr_entries for nr_entries, _ in usage.values()],
+                'Memory [MiB]': [_to_mib(nbytes) for _, nbytes in usage.values()],
+            }
+        ),
+        hide_index=True,
+        column_config={'Memory [MiB]': st.column_config.NumberColumn(format='%.2f')},
+    )
+
+    st.markdown('**Entries from most to least recently used**')
+    st.dataframe(
+        pd.DataFrame(
+            {
+                'Function': [e.namespace for e in reversed(entries)],
+                'Arguments': [e.description for e in reversed(entries)],
+                'Memory [MiB]': [_to_mib(e.nbytes) for e in reversed(entries)],
+                'Shared': [e.shared for e in reversed(entries)],
+                'Loaded at (UTC)': [e.loaded_at for e in reversed(entries)],
+                'Last accessed (UTC)': [e.accessed_at for e in reversed(entries)],
+            }
+        ),
+        hide_index=True,
+        column_config={'Memory [MiB]': st.column_config.NumberColumn(format='%.2f')},
+    )
+
+    if st.button('Clear cache', help='Remove all entries cached in the memory of this process.'):
+        registry.invalidate()
+        st.rerun()
@@ -19,8 +19,8 @@ def title() -> None:
 def initialize(_session: db.Session, db_url: db.URL) -> None:
     r"""Render the initialize view of the init page.
 
-    Initialize the database with the default data and
-    warn the user if the database is already initialized.
+    Initialize the database with the default data. Default data that
+    already exists in the database is left untouched.
 
     Parameters
     ----------
@@ -34,8 +34,8 @@ def initialize(_session: db.Session, db_url: db.URL) -> None:
     error, error_msg = db.init(session=_session)
 
     if error:
-        message = f'Database "{db_url}" already initialized! {error_msg}'
-        st.warning(message, icon=stp.ICON_WARNING)
+        message = f'Error initializing database "{db_url}"! {error_msg}'
+        st.error(message, icon=stp.ICON_ERROR)
     else:
         st.success(f'Successfully initialized database : "{db_url}"!', icon=stp.ICON_SUCCESS)
 
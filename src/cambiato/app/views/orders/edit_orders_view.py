@@ -2,24 +2,40 @@ r"""The view `edit_orders_view` to edit multiple orders in DataFrame mode."""
 
 # Standard library
 from collections.abc import Callable
-from datetime import UTC, datetime, time
+from datetime import UTC, datetime, time, timedelta
 from functools import partial
-from time import sleep
+from typing import Any, NamedTuple, cast
 from zoneinfo import ZoneInfo
 
 # Third party
+import pandas as pd
 import streamlit as st
 
 # Local
+from cambiato import exceptions
 from cambiato.app.components import (
     EDIT_ORDERS_DATAFRAME_EDITOR,
+    EDIT_ORDERS_VIEW_ORDER_STATUS_FILTER,
+    EDIT_ORDERS_VIEW_ORDER_TYPE_FILTER,
+    EDIT_ORDERS_VIEW_PAGING,
+    EDIT_ORDERS_VIEW_SCHEDULED_FILTER,
+    EDIT_ORDERS_VIEW_TECHNICIAN_FILTER,
     ICON_SUCCESS,
     ChangedDataFrameRows,
     edit_orders,
 )
-from cambiato.app.database import get_all_orders_cached
-from cambiato.database import ChangedDatabaseRows, Session, process_changed_orders
+from cambiato.app.database import get_active_orders_page_cached
+from cambiato.app.profiling import profiled, stage
+from cambiato.config import Language
+from cambiato.database import (
+    DEFAULT_PAGE_SIZE,
+    ChangedDatabaseRows,
+    Session,
+    get_active_orders_page,
+    process_changed_orders,
+)
 from cambiato.models import (
+    BaseDataFrameModel,
     FacilityDataFrameModel,
     OrderDataFrameModel,
     OrderStatusDataFrameModel,
@@ -112,49 +128,238 @@ def _process_edited_orders(
 
     to_utc = partial(_str_to_utc_timestamp, tz=tz, is_date=scheduled_is_date)
 
-    column_converters: dict[
-        str, tuple[str, Callable]
-    ] = {  # column name : (column name to update, conversion function)
+    column_lookups: dict[
+        str, tuple[str, BaseDataFrameModel, str]
+    ] = {  # column name : (column name to update, model to lookup the ID in, column to lookup)
         orders.c_assigned_to_displayname: (
             orders.c_assigned_to_user_id,
-            partial(technicians.get_index, column=technicians.c_displayname),
+            technicians,
+            technicians.c_displayname,
         ),
-        orders.c_scheduled_start_at: (orders.c_scheduled_start_at, to_utc),
-        orders.c_scheduled_end_at: (orders.c_scheduled_end_at, to_utc),
         orders.c_order_status_name: (
             orders.c_order_status_id,
-            partial(order_statuses.get_index, column=order_statuses.c_name),
-        ),
-        orders.c_order_type_name: (
-            orders.c_order_type_id,
-            partial(order_types.get_index, column=order_types.c_name),
-        ),
-        orders.c_facility_ean: (
-            orders.c_facility_id,
-            partial(facilities.get_index, column=facilities.c_ean),
+            order_statuses,
+            order_statuses.c_name,
         ),
+        orders.c_order_type_name: (orders.c_order_type_id, order_types, order_types.c_name),
+        orders.c_facility_ean: (orders.c_facility_id, facilities, facilities.c_ean),
+    }
+    column_converters: dict[
+        str, tuple[str, Callable]
+    ] = {  # column name : (column name to update, conversion function)
+        orders.c_scheduled_start_at: (orders.c_scheduled_start_at, to_utc),
+        orders.c_scheduled_end_at: (orders.c_scheduled_end_at, to_utc),
         orders.c_ext_id: (orders.c_ext_id, _get_self),
         orders.c_description: (orders.c_description, _get_self),
     }
 
-    orders_to_update = [
-        {'order_id': orders.get_index_by_row_nr(row_nr=int(row_nr))}
+    edited_rows = edited_orders['edited_rows']
+    orders_to_update = {
+        row_nr: {'order_id': orders.get_index_by_row_nr(row_nr=int(row_nr))}
         | {
             conv[0]: conv[1](value)
             for col, value in row_content.items()
             if (conv := column_converters.get(col))
         }
         | {orders.c_updated_by: user_id}
-        for row_nr, row_content in edited_orders['edited_rows'].items()
-    ]
+        for row_nr, row_content in edited_rows.items()
+    }
+
+    for col, (update_col, model, lookup_col) in column_lookups.items():
+        row_nrs = [row_nr for row_nr, row_content in edited_rows.items() if col in row_content]
+        if not row_nrs:
+            continue
+
+        values = pd.Series([edited_rows[r][col] for r in row_nrs], dtype=object)
+        lookup = model.get_indices(values=values, column=lookup_col)
+        if lookup.ambiguous.any():
+            raise exceptions.MultipleRowsForColumnValueError(
+                f'Multiple rows match column "{lookup_col}" for values: '
+                f'{values[lookup.ambiguous].tolist()}!'
+            )
 
-    return ChangedDatabaseRows(edited_rows=orders_to_update)
+        for row_nr, idx in zip(
+            row_nrs, lookup.indices.to_numpy(dtype=object, na_value=None), strict=True
+        ):
+            orders_to_update[row_nr][update_col] = None if idx is None else model.index_type(idx)
+
+    return ChangedDatabaseRows(edited_rows=list(orders_to_update.values()))
+
+
+class _OrderFilters(NamedTuple):
+    r"""The filters of the orders selected by the user.
+
+    The filters are the keyword arguments of :func:`cambiato.db.get_active_orders_page`.
+    Empty filters are None or empty tuples.
+    """
+
+    utility_ids: tuple[int, ...] | None = None
+    order_statuses: tuple[int, ...] = ()
+    order_types: tuple[int, ...] = ()
+    technicians: tuple[str, ...] = ()
+    scheduled_from: datetime | None = None
+    scheduled_to: datetime | None = None
+
+
+class _Paging(NamedTuple):
+    r"""The state of the paging of the orders.
+
+    Parameters
+    ----------
+    filters : _OrderFilters
+        The filters of the paged orders. The paging restarts at the first page
+        when the filters change.
+
+    cursors : tuple[int or None, ...]
+        The stack of the keyset cursors of the visited pages. The last
+        cursor is the cursor of the current page.
+
+    saves : int
+        The number of saves of the edited orders. A save resets the data editor.
+    """
+
+    filters: _OrderFilters
+    cursors: tuple[int | None, ...] = (None,)
+    saves: int = 0
+
+    @property
+    def page_nr(self) -> int:
+        r"""The number of the current page starting from 1."""
+
+        return len(self.cursors)
+
+    @property
+    def editor_key(self) -> str:
+        r"""The key of the data editor of the current page.
+
+        The edits of the data editor refer to row numbers of the current page
+        and the editor is therefore reset when another page is loaded or the
+        edits are saved.
+        """
+
+        return f'{EDIT_ORDERS_DATAFRAME_EDITOR}-{hash(self):x}'
+
+
+def _get_paging(filters: _OrderFilters) -> _Paging:
+    r"""Get the paging state of `filters` from the session state."""
+
+    paging = st.session_state.get(EDIT_ORDERS_VIEW_PAGING)
+    if paging is None or paging.filters != filters:
+        paging = _Paging(filters=filters)
+        st.session_state[EDIT_ORDERS_VIEW_PAGING] = paging
+
+    return paging
+
+
+def _go_to_next_page(cursor: int) -> None:
+    r"""Push the cursor of the next page onto the stack of visited pages."""
+
+    paging = st.session_state[EDIT_ORDERS_VIEW_PAGING]
+    st.session_state[EDIT_ORDERS_VIEW_PAGING] = paging._replace(cursors=(*paging.cursors, cursor))
+
+
+def _go_to_previous_page() -> None:
+    r"""Pop the cursor of the current page from the stack of visited pages."""
+
+    paging = st.session_state[EDIT_ORDERS_VIEW_PAGING]
+    st.session_state[EDIT_ORDERS_VIEW_PAGING] = paging._replace(cursors=paging.cursors[:-1])
+
+
+def _order_filters(
+    order_types: OrderTypeDataFrameModel,
+    order_statuses: OrderStatusDataFrameModel,
+    technicians: UserDataFrameModel,
+    trans: EditOrdersView,
+    tz: ZoneInfo,
+) -> _OrderFilters:
+    r"""Render the filters of the orders and return the selected filters.
+
+    The selected days of the scheduled filter are converted into a half-open
+    UTC interval of the scheduled start time of the orders.
+    """
+
+    status_col, type_col, technician_col, scheduled_col = st.columns(4)
+
+    with status_col:
+        selected_statuses = st.multiselect(
+            label=trans.order_status_filter_label,
+            options=order_statuses.index,
+            format_func=order_statuses.format_func,
+            key=EDIT_ORDERS_VIEW_ORDER_STATUS_FILTER,
+        )
+
+    with type_col:
+        selected_types = st.multiselect(
+            label=trans.order_type_filter_label,
+            options=order_types.index,
+            format_func=order_types.format_func,
+            key=EDIT_ORDERS_VIEW_ORDER_TYPE_FILTER,
+        )
+
+    with technician_col:
+        selected_technicians = st.multiselect(
+            label=trans.technician_filter_label,
+            options=technicians.index,
+            format_func=technicians.format_func,
+            key=EDIT_ORDERS_VIEW_TECHNICIAN_FILTER,
+        )
+
+    with scheduled_col:
+        scheduled = st.date_input(
+            label=trans.scheduled_filter_label,
+            value=[],
+            help=trans.scheduled_filter_help,
+            key=EDIT_ORDERS_VIEW_SCHEDULED_FILTER,
+        )
+
+    scheduled_from, scheduled_to = None, None
+    if isinstance(scheduled, tuple) and scheduled:
+        scheduled_from = datetime.combine(scheduled[0], time(0, 0), tzinfo=tz).astimezone(UTC)
+        if len(scheduled) > 1:
+            scheduled_to = datetime.combine(
+                scheduled[1] + timedelta(days=1), time(0, 0), tzinfo=tz
+            ).astimezone(UTC)
+
+    return _OrderFilters(
+        order_statuses=tuple(int(i) for i in selected_statuses),
+        order_types=tuple(int(i) for i in selected_types),
+        technicians=tuple(str(i) for i in selected_technicians),
+        scheduled_from=scheduled_from,
+        scheduled_to=scheduled_to,
+    )
+
+
+def _paging_controls(paging: _Paging, next_cursor: int | None, trans: EditOrdersView) -> None:
+    r"""Render the buttons to go to the previous and next page of orders."""
+
+    previous_col, caption_col, next_col, _ = st.columns([1, 1, 1, 8], vertical_alignment='center')
+
+    with previous_col:
+        st.button(
+            label=trans.previous_page_button_label,
+            disabled=paging.page_nr == 1,
+            on_click=_go_to_previous_page,
+            key='edit-orders-view-previous-page-button',
+        )
+
+    with caption_col:
+        st.caption(trans.page_caption.format(page=paging.page_nr))
+
+    with next_col:
+        st.button(
+            label=trans.next_page_button_label,
+            disabled=next_cursor is None,
+            on_click=_go_to_next_page,
+            args=(next_cursor,),
+            key='edit-orders-view-next-page-button',
+        )
 
 
 @st.fragment
+@profiled()
 def edit_orders_view(
     session: Session,
-    orders: OrderDataFrameModel,
+    utility_ids: tuple[int, ...] | None,
     order_types: OrderTypeDataFrameModel,
     order_statuses: OrderStatusDataFrameModel,
     facilities: FacilityDataFrameModel,
@@ -162,16 +367,25 @@ def edit_orders_view(
     trans: EditOrdersView,
     edit_orders_df_trans: EditOrdersDataFrame,
     tz: ZoneInfo,
+    language: Language,
     user_id: str,
     has_edit_permission: bool = False,
     schedule_entire_day_default: bool = True,
+    page_size: int = DEFAULT_PAGE_SIZE,
 ) -> None:
     r"""The view for listing and editing available orders.
 
+    The orders are filtered by status, type, technician and scheduled days and loaded one
+    page at a time. The filters and the page are applied by the database query, which
+    only loads and renders the orders of the current page.
+
     Parameters
     ----------
-    orders : cambiato.models.OrderDataFrameModel
-        The orders that can be edited.
+    session : cambiato.db.Session
+        An active database session.
+
+    utility_ids : tuple[int, ...] or None
+        The ID:s of the utilities of the orders. If None the orders of all utilities are listed.
 
     order_types : cambiato.models.OrderTypeDataFrameModel
         The selectable order types that can be assigned to an order.
@@ -194,6 +408,9 @@ def edit_orders_view(
     tz : zoneinfo.ZoneInfo
         The timezone of the datetime columns that the user can edit.
 
+    language : cambiato.config.Language
+        The language to translate the names of the order types and order statuses into.
+
     user_id : str
         The ID of the user editing the orders.
 
@@ -205,11 +422,35 @@ def edit_orders_view(
         (i.e. schedule the entire day) and False to select a timestamp for the
         scheduled start and end time.
 
+    page_size : int, default cambiato.db.DEFAULT_PAGE_SIZE
+        The number of orders of a page.
+
     Returns
     -------
     None
     """
 
+    filters = _order_filters(
+        order_types=order_types,
+        order_statuses=order_statuses,
+        technicians=technicians,
+        trans=trans,
+        tz=tz,
+    )._replace(utility_ids=utility_ids)
+    paging = _get_paging(filters=filters)
+
+    # Only the filters in use are passed to make the first page of a utility without filters
+    # share its cache entry with the page loaded by the warm-up of the cache.
+    filter_kwargs: dict[str, Any] = {k: v for k, v in filters._asdict().items() if v}
+    filter_kwargs |= {'tz': tz, 'language': language}
+    kwargs = filter_kwargs | {'limit': page_size}
+    if (cursor := paging.cursors[-1]) is not None:
+        kwargs['cursor'] = cursor
+
+    with stage('database: page of orders'):
+        page = get_active_orders_page_cached(_session=session, **kwargs)
+    orders = page.orders
+
     banner_container = st.empty()
 
     left_col, right_col, _ = st.columns([1, 2, 8])
@@ -232,9 +473,12 @@ def edit_orders_view(
         trans=edit_orders_df_trans,
         schedule_datetime_type='date' if schedule_entire_day else 'datetime',
         editable=has_edit_permission,
+        key=paging.editor_key,
     )
 
-    modified_state = st.session_state.get(EDIT_ORDERS_DATAFRAME_EDITOR, {})
+    _paging_controls(paging=paging, next_cursor=page.next_cursor, trans=trans)
+
+    modified_state = st.session_state.get(paging.editor_key, {})
     rows_have_changed = any(v for v in modified_state.values())
 
     clicked = save_changed_button_container.button(
@@ -247,25 +491,44 @@ def edit_orders_view(
     if not clicked or not edited_orders_are_valid:
         return
 
-    changed_orders = _process_edited_orders(
-        edited_orders=modified_state,
-        orders=orders,
-        order_types=order_types,
-        order_statuses=order_statuses,
-        facilities=facilities,
-        technicians=technicians,
-        tz=tz,
-        scheduled_is_date=schedule_entire_day,
-        user_id=user_id,
-    )
+    with stage('pandas: process edited orders'):
+        changed_orders = _process_edited_orders(
+            edited_orders=modified_state,
+            orders=orders,
+            order_types=order_types,
+            order_statuses=order_statuses,
+            facilities=facilities,
+            technicians=technicians,
+            tz=tz,
+            scheduled_is_date=schedule_entire_day,
+            user_id=user_id,
+        )
 
-    result = process_changed_orders(session=session, changed_orders=changed_orders)
+    with stage('database: save orders'):
+        result = process_changed_orders(session=session, changed_orders=changed_orders)
 
     if not result.ok:
         banner_container.error(result.short_msg)
         return
 
-    banner_container.success(trans.update_orders_success_message, icon=ICON_SUCCESS)
-    get_all_orders_cached.clear()  # type: ignore[attr-defined]
-    sleep(1)
-    st.rerun(scope='app')
+    # The saved orders are reloaded by their primary key to get the values generated by the
+    # database, e.g. the time of the update, and patched into the cached page, which replaces
+    # the page invalidated by the save. Orders that no longer match the filters are removed.
+    edited_rows = cast(list[dict[str, Any]], changed_orders.edited_rows)
+    order_ids: list[int] = [int(row[orders.c_order_id]) for row in edited_rows]
+    with stage('database: reload saved orders'):
+        saved = get_active_orders_page(
+            _session=session, limit=len(order_ids), order_ids=order_ids, **filter_kwargs
+        )
+
+    with stage('pandas: patch saved orders'):
+        patched_orders = orders.update_rows(
+            saved.orders, drop=set(order_ids).difference(saved.orders.index)
+        )
+        get_active_orders_page_cached.put(  # type: ignore[attr-defined]
+            page._replace(orders=patched_orders), **kwargs
+        )
+
+    st.session_state[EDIT_ORDERS_VIEW_PAGING] = paging._replace(saves=paging.saves + 1)
+    st.toast(trans.update_orders_success_message, icon=ICON_SUCCESS)
+    st.rerun(scope='fragment')
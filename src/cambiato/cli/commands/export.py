@@ -0,0 +1,145 @@
+r"""The entry point of the sub-command export.
+
+Export tables of the Cambiato database to files.
+"""
+
+# Standard library
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+# Third party
+import click
+
+# Local
+from cambiato import exceptions
+from cambiato.config import load_config
+from cambiato.database import (
+    DEFAULT_BATCH_SIZE,
+    ExportFormat,
+    ExportTable,
+    create_session_factory,
+    export_table,
+)
+
+
+def export_options(func: Callable[..., Any]) -> Callable[..., Any]:
+    r"""Add the common options of the export commands."""
+
+    options = (
+        click.option(
+            '-f',
+            '--format',
+            'format_',
+            type=click.Choice(tuple(ExportFormat), case_sensitive=False),
+            default=ExportFormat.PARQUET,
+            show_default=True,
+            help='The file format to export to.',
+        ),
+        click.option(
+            '-o',
+            '--output',
+            type=click.Path(dir_okay=False, writable=True, path_type=Path),
+            default=None,
+            help='The file to export to. Defaults to "<table>.<format>" in the current directory.',
+        ),
+        click.option(
+            '-b',
+            '--batch-size',
+            type=click.IntRange(min=1),
+            default=DEFAULT_BATCH_SIZE,
+            show_default=True,
+            help='The number of rows to fetch and write at a time.',
+        ),
+        click.option(
+            '-c',
+            '--config',
+            'config_path',
+            type=click.Path(dir_okay=False, path_type=Path),
+            default=None,
+            help='The config file of Cambiato with the database to export from.',
+        ),
+    )
+
+    for option in reversed(options):
+        func = option(func)
+
+    return func
+
+
+def _export(
+    table: ExportTable,
+    format_: str,
+    output: Path | None,
+    batch_size: int,
+    config_path: Path | None,
+) -> None:
+    r"""Export `table` and report the throughput."""
+
+    export_format = ExportFormat(format_.lower())
+    path = Path(f'{table}.{export_format}') if output is None else output
+
+    try:
+        cm = load_config(path=config_path)
+        session_factory = create_session_factory(
+            url=cm.database.url, connect_args=cm.database.connect_args, **cm.database.engine_config
+        )
+        with session_factory() as session:
+            result = export_table(
+                session=session,
+                table=table,
+                path=path,
+                format=export_format,
+                batch_size=batch_size,
+            )
+    except exceptions.CambiatoError as e:
+        raise click.ClickException(e.detailed_message) from None
+
+    click.echo(
+        f'Exported {result.nr_rows} rows ({result.nr_bytes / 1e6:.2f} MB) of table "{table}" '
+        f'to "{result.path}" in {result.duration:.2f} s\n'
+        f'Throughput: {result.rows_per_second:.0f} rows/s, '
+        f'{result.bytes_per_second / 1e6:.2f} MB/s'
+    )
+
+
+@click.group()
+def export() -> None:
+    """Export tables of the Cambiato database to Parquet or CSV files.
+
+    The rows are streamed from the database in batches, which are written to the file
+    one at a time. The memory usage is thus constant regardless of the size of the table.
+
+    \b
+    Examples
+    --------
+    Export all orders to the Parquet file orders.parquet:
+        $ cambiato export orders
+
+    Export all facilities to a CSV file in batches of 10000 rows:
+        $ cambiato export facilities --format csv --output /data/facilities.csv --batch-size 10000
+    """
+
+
+@export.command()
+@export_options
+def orders(**kwargs: Any) -> None:
+    """Export all orders."""
+
+    _export(table=ExportTable.ORDERS, **kwargs)
+
+
+@export.command()
+@export_options
+def facilities(**kwargs: Any) -> None:
+    """Export all facilities."""
+
+    _export(table=ExportTable.FACILITIES, **kwargs)
+
+
+@export.command()
+@export_options
+def checklists(**kwargs: Any) -> None:
+    """Export all checklists."""
+
+    _export(table=ExportTable.CHECKLISTS, **kwargs)
@@ -4,10 +4,11 @@ r"""The entry point of the Cambiato CLI."""
 import click
 
 # Local
+from cambiato.cli.commands.export import export
 from cambiato.cli.commands.run import run
 from cambiato.metadata import __releasedate__
 
-COMMANDS = (run,)
+COMMANDS = (export, run)
 
 
 @click.group(
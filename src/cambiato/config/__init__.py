@@ -3,6 +3,7 @@ r"""The configuration of Cambiato."""
 from cambiato.config.config import ConfigManager, load_config
 from cambiato.config.core import (
     BITWARDEN_PASSWORDLESS_API_URL,
+    CACHE_DEFAULT_DIR,
     CONFIG_DIR,
     CONFIG_FILE_ENV_VAR,
     CONFIG_FILE_PATH,
@@ -10,7 +11,10 @@ from cambiato.config.core import (
     PROG_NAME,
     BaseConfigModel,
     BitwardenPasswordlessConfig,
+    CacheBackend,
+    CacheConfig,
     DatabaseConfig,
+    DataFrameConfig,
     Language,
 )
 from cambiato.config.log import (
@@ -26,6 +30,7 @@ from cambiato.config.log import (
     LogHanderType,
     LogHandler,
     LogLevel,
+    ProfilingConfig,
     Stream,
     StreamLogHandler,
 )
@@ -37,6 +42,7 @@ __all__ = [
     'load_config',
     # core
     'BITWARDEN_PASSWORDLESS_API_URL',
+    'CACHE_DEFAULT_DIR',
     'CONFIG_DIR',
     'CONFIG_FILE_ENV_VAR',
     'CONFIG_FILE_PATH',
@@ -44,7 +50,10 @@ __all__ = [
     'PROG_NAME',
     'BaseConfigModel',
     'BitwardenPasswordlessConfig',
+    'CacheBackend',
+    'CacheConfig',
     'DatabaseConfig',
+    'DataFrameConfig',
     'Language',
     # log
     'LOGGING_DEFAULT_DATETIME_FORMAT',
@@ -59,6 +68,7 @@ __all__ = [
     'LogHanderType',
     'LogHandler',
     'LogLevel',
+    'ProfilingConfig',
     'Stream',
     'StreamLogHandler',
 ]
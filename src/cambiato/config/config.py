@@ -18,10 +18,12 @@ from cambiato.config.core import (
     CONFIG_FILE_PATH,
     BaseConfigModel,
     BitwardenPasswordlessConfig,
+    CacheConfig,
     DatabaseConfig,
+    DataFrameConfig,
     Language,
 )
-from cambiato.config.log import LoggingConfig
+from cambiato.config.log import LoggingConfig, ProfilingConfig
 
 
 class ConfigManager(BaseConfigModel):
@@ -51,6 +53,15 @@ class ConfigManager(BaseConfigModel):
 
     logging : cambiato.LoggingConfig
         The logging configuration.
+
+    cache : cambiato.CacheConfig
+        The configuration of the cache for the data loaded from the database.
+
+    dataframe : cambiato.DataFrameConfig
+        The configuration of the DataFrame models.
+
+    profiling : cambiato.ProfilingConfig
+        The configuration of the render profiling of the web app.
     """
 
     model_config = ConfigDict(frozen=True)
@@ -64,6 +75,9 @@ class ConfigManager(BaseConfigModel):
         validation_alias=AliasChoices('bwp', 'bitwarden_passwordless', 'bitwarden_passwordless_dev')
     )
     logging: LoggingConfig = Field(default_factory=LoggingConfig)
+    cache: CacheConfig = Field(default_factory=CacheConfig)
+    dataframe: DataFrameConfig = Field(default_factory=DataFrameConfig)
+    profiling: ProfilingConfig = Field(default_factory=ProfilingConfig)
 
     @field_validator('timezone', mode='before')
     @classmethod
@@ -2,17 +2,19 @@ r"""The core config models."""
 
 # Standard library
 import logging
+from datetime import timedelta
 from enum import StrEnum
 from pathlib import Path
 from typing import Any
 
 # Third party
 import streamlit_passwordless as stp
-from pydantic import AnyHttpUrl, Field, field_validator
+from pydantic import AnyHttpUrl, ByteSize, Field, field_validator
 from sqlalchemy import URL
 
 # Local
 from cambiato import exceptions
+from cambiato.models.backend import DataFrameBackend, import_polars
 from cambiato.models.core import BaseModel
 
 logger = logging.getLogger(__name__)
@@ -28,6 +30,8 @@ CONFIG_FILE_PATH = CONFIG_DIR / CONFIG_FILENAME
 
 CONFIG_FILE_ENV_VAR = 'CAMBIATO_CONFIG_FILE'
 
+CACHE_DEFAULT_DIR = Path.home() / '.cache' / PROG_NAME
+
 BITWARDEN_PASSWORDLESS_API_URL = stp.BITWARDEN_PASSWORDLESS_API_URL
 
 
@@ -41,6 +45,19 @@ class Language(StrEnum):
     SV = 'sv'
 
 
+class CacheBackend(StrEnum):
+    r"""The available backends for caching the data loaded from the database.
+
+    - memory : Each process of the web app keeps its own copy of the cached data in memory.
+
+    - arrow : The cached data is stored as Arrow IPC files, which are memory-mapped by each process
+              of the web app. Processes on the same host thus share one copy of the data.
+    """
+
+    MEMORY = 'memory'
+    ARROW = 'arrow'
+
+
 class BaseConfigModel(BaseModel):
     r"""The base model that all configuration models inherit from."""
 
@@ -118,3 +135,69 @@ class BitwardenPasswordlessConfig(BaseConfigModel):
     public_key: str
     private_key: str
     url: AnyHttpUrl = stp.BITWARDEN_PASSWORDLESS_API_URL
+
+
+class CacheConfig(BaseConfigModel):
+    r"""The configuration of the cache for the data loaded from the database.
+
+    Parameters
+    ----------
+    backend : cambiato.CacheBackend, default cambiato.CacheBackend.MEMORY
+        The backend to use for caching the data.
+
+    directory : pathlib.Path, default pathlib.Path.home() / '.cache' / 'Cambiato'
+        The directory where the cache files are stored by the arrow backend. All web app
+        processes that should share the cache must use the same directory.
+
+    ttl : datetime.timedelta, default datetime.timedelta(hours=1)
+        The time to live of the cached data. Can be specified as seconds or as an
+        ISO 8601 duration, e.g. 'PT30M' for 30 minutes.
+
+    max_memory : pydantic.ByteSize or None, default None
+        The byte budget of the data cached in the memory of each web app process. When the
+        cached data exceeds the budget the least recently used entries are evicted. Can be
+        specified as bytes or with a unit, e.g. '512MiB'. If None no entries are evicted.
+
+    warm_up : bool, default True
+        True if each web app process should load the reference data and orders of all
+        utilities and languages into the cache in a background thread when it starts.
+
+    ready_file : pathlib.Path or None, default None
+        The file that is created when the warm-up of the cache has completed and removed when
+        it starts, e.g. for the readiness probe of a load balancer. The id of the process is
+        appended to the name of the file, e.g. "ready.1234", such that each process of the
+        web app signals its own readiness. If None no file is created.
+    """
+
+    backend: CacheBackend = CacheBackend.MEMORY
+    directory: Path = CACHE_DEFAULT_DIR
+    ttl: timedelta = timedelta(hours=1)
+    max_memory: ByteSize | None = None
+    warm_up: bool = True
+    ready_file: Path | None = None
+
+
+class DataFrameConfig(BaseConfigModel):
+    r"""The configuration of the DataFrame models.
+
+    Parameters
+    ----------
+    backend : cambiato.models.DataFrameBackend, default cambiato.models.DataFrameBackend.PANDAS
+        The backend that processes the DataFrames of the DataFrame models. The polars
+        backend requires the optional dependency polars.
+    """
+
+    backend: DataFrameBackend = DataFrameBackend.PANDAS
+
+    @field_validator('backend')
+    @classmethod
+    def validate_backend(cls, backend: DataFrameBackend) -> DataFrameBackend:
+        r"""Validate that the dependencies of the backend are installed."""
+
+        if backend == DataFrameBackend.POLARS:
+            try:
+                import_polars()
+            except exceptions.DataFrameError as e:
+                raise ValueError(str(e)) from None
+
+        return backend
@@ -292,3 +292,22 @@ class LoggingConfig(BaseConfigModel):
     stream: dict[str, StreamLogHandler] | None = None
     file: dict[str, FileLogHandler] | None = None
     email: dict[str, EmailLogHandler] | None = None
+
+
+class ProfilingConfig(BaseConfigModel):
+    r"""The configuration of the render profiling of the web app.
+
+    Parameters
+    ----------
+    enabled : bool, default False
+        True if the wall time of the stages of each rerun of the pages should be profiled.
+        The profiles are logged to the logger "cambiato.profiling" and admins can view the
+        profile of the last rerun in the sidebar.
+
+    file : cambiato.FileLogHandler or None, default None
+        The configuration of the rolling log file of the profiles. If None the
+        profiles are logged by the log handlers of the logging configuration.
+    """
+
+    enabled: bool = False
+    file: FileLogHandler | None = None
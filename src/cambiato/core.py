@@ -1,7 +1,8 @@
 r"""The core functionality of the package."""
 
 # Standard library
-from typing import NamedTuple
+from collections.abc import Sequence
+from typing import Any, NamedTuple, TypeAlias
 
 # Third party
 from streamlit_passwordless import get_current_user as get_current_user
@@ -30,3 +31,28 @@ class OperationResult(NamedTuple):
     ok: bool = True
     short_msg: str = ''
     long_msg: str = ''
+
+
+Row: TypeAlias = dict[str, Any]
+PrimaryKey: TypeAlias = int | str
+
+
+class ChangedDatabaseRows(NamedTuple):
+    r"""Information about rows that have changed for a table.
+
+    Parameters
+    ----------
+    edited_rows : Sequence[dict[str, Any]] or dict[str, Any] or None, default None
+        Rows that have been edited and should be updated in the database.
+
+    added_rows : Sequence[dict[str, Any]] or dict[str, Any] or None, default None
+        Rows that have been added and should be added to the database.
+
+    deleted_rows : Sequence[int | str] or None, default None
+        Rows that have been deleted and should be deleted from the database.
+        The sequence should contain the primary keys of the rows to delete.
+    """
+
+    edited_rows: Sequence[Row] | Row | None = None
+    added_rows: Sequence[Row] | Row | None = None
+    deleted_rows: Sequence[PrimaryKey] | None = None
@@ -2,7 +2,10 @@ r"""The database of Cambiato."""
 
 # Local
 from cambiato.database.crud import (
+    DEFAULT_PAGE_SIZE,
+    OrderPage,
     create_order,
+    get_active_orders_page,
     get_all_active_orders,
     get_all_checklists,
     get_all_facilities,
@@ -15,12 +18,49 @@ from cambiato.database.crud import (
 )
 
 from . import models
+from .cache import (
+    ALL_SCOPE,
+    ArrowIPCCache,
+    CacheEntry,
+    CacheRegistry,
+    CacheStats,
+    InvalidationEvent,
+    InvalidationListener,
+    add_invalidation_listener,
+    create_cache_key,
+    create_scopes,
+    emit_invalidation,
+    remove_invalidation_listener,
+)
 from .core import URL, ChangedDatabaseRows, Session, SessionFactory, commit, create_session_factory
+from .export import (
+    DEFAULT_BATCH_SIZE,
+    ExportFormat,
+    ExportResult,
+    ExportTable,
+    create_arrow_schema,
+    export_table,
+    iter_record_batches,
+)
 from .init import init
+from .result_cache import CacheWarmUp, ResultCache, TableVersions, WarmUpCall, WarmUpStatus
 
 # The Public API
 __all__ = [
     'models',
+    # cache
+    'ALL_SCOPE',
+    'ArrowIPCCache',
+    'CacheEntry',
+    'CacheRegistry',
+    'CacheStats',
+    'InvalidationEvent',
+    'InvalidationListener',
+    'add_invalidation_listener',
+    'create_cache_key',
+    'create_scopes',
+    'emit_invalidation',
+    'remove_invalidation_listener',
     # core
     'URL',
     'ChangedDatabaseRows',
@@ -29,7 +69,10 @@ __all__ = [
     'commit',
     'create_session_factory',
     # crud
+    'DEFAULT_PAGE_SIZE',
+    'OrderPage',
     'create_order',
+    'get_active_orders_page',
     'get_all_active_orders',
     'get_all_checklists',
     'get_all_facilities',
@@ -39,6 +82,20 @@ __all__ = [
     'get_all_utilities',
     'get_customer_id_by_facility_id',
     'process_changed_orders',
+    # export
+    'DEFAULT_BATCH_SIZE',
+    'ExportFormat',
+    'ExportResult',
+    'ExportTable',
+    'create_arrow_schema',
+    'export_table',
+    'iter_record_batches',
     # init
     'init',
+    # result_cache
+    'CacheWarmUp',
+    'ResultCache',
+    'TableVersions',
+    'WarmUpCall',
+    'WarmUpStatus',
 ]
@@ -0,0 +1,889 @@
+r"""Cache DataFrames loaded from the database in files shared between processes.
+
+The DataFrames are stored as Arrow IPC files, which are memory-mapped when loaded.
+The data of a memory-mapped file is not copied into the memory of the process, but
+read directly from the page cache of the operating system. Multiple processes on the
+same host that load the same file thus share one copy of the data.
+
+The cached DataFrames are grouped into namespaces, e.g. "orders". Each namespace has a
+version stamp stored in a file of the cache directory. The version stamp is part of
+the filename of the cached DataFrames and bumping it invalidates all cached DataFrames
+of the namespace for all processes.
+
+A namespace can be partitioned into scopes, e.g. the utilities, which have version stamps
+of their own. A cached DataFrame of a set of scopes is only invalidated when one of its scopes
+is invalidated, which leaves the cached DataFrames of the other scopes intact. The scope
+:data:`ALL_SCOPE` is used by the cached DataFrames that depend on all scopes.
+
+The objects cached in the memory of a process are tracked by a :class:`CacheRegistry`,
+which accounts for the memory usage of each entry and optionally evicts the least
+recently used entries when the total memory usage exceeds a byte budget. The registry
+records the hits, misses, evictions and load latency of each namespace as :class:`CacheStats`.
+
+The functions writing to the database emit an :class:`InvalidationEvent` with the changed
+tables and utilities through :func:`emit_invalidation`. The caches subscribe to the events
+with :func:`add_invalidation_listener` and invalidate the affected entries.
+"""
+
+# Standard library
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Callable, Collection, Iterable
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any, NamedTuple
+
+# Third party
+import pandas as pd
+import pyarrow as pa
+
+logger = logging.getLogger(__name__)
+
+INITIAL_VERSION = '0'
+
+# The scope of the cached DataFrames that depend on all scopes of their namespace.
+ALL_SCOPE = 'all'
+
+# The schema metadata key of the cache files with the index, string and categorical columns.
+_METADATA_KEY = b'cambiato'
+
+
+def create_cache_key(**kwargs: Any) -> str:
+    r"""Create a cache key from keyword arguments.
+
+    Parameters
+    ----------
+    **kwargs : Any
+        The keyword arguments to create the key from. The representation of the values
+        should be deterministic between processes.
+
+    Returns
+    -------
+    str
+        The cache key as a hexadecimal hash digest.
+    """
+
+    return hashlib.blake2b(repr(sorted(kwargs.items())).encode(), digest_size=8).hexdigest()
+
+
+def create_scopes(utility_ids: Iterable[int] | None) -> tuple[str, ...]:
+    r"""Create the scopes of a cached object from the utilities it was loaded for.
+
+    Parameters
+    ----------
+    utility_ids : Iterable[int] or None
+        The ID:s of the utilities. If None or empty the object depends on all utilities.
+
+    Returns
+    -------
+    tuple[str, ...]
+        The sorted scopes of the utilities or :data:`ALL_SCOPE`.
+    """
+
+    scopes = tuple(sorted({str(utility_id) for utility_id in utility_ids or ()}))
+
+    return scopes or (ALL_SCOPE,)
+
+
+class InvalidationEvent(NamedTuple):
+    r"""An event of data changed in the database that invalidates the cached data.
+
+    Parameters
+    ----------
+    tables : frozenset[str]
+        The names of the changed tables.
+
+    utility_ids : frozenset[int] or None
+        The ID:s of the utilities of the changed rows. If None the changes
+        may affect all utilities.
+    """
+
+    tables: frozenset[str]
+    utility_ids: frozenset[int] | None
+
+    def affects(self, tables: Collection[str]) -> bool:
+        r"""Check if the event affects data loaded from any of `tables`."""
+
+        return not self.tables.isdisjoint(tables)
+
+
+InvalidationListener = Callable[[InvalidationEvent], None]
+
+_invalidation_listeners: list[InvalidationListener] = []
+_invalidation_listeners_lock = threading.Lock()
+
+
+def add_invalidation_listener(listener: InvalidationListener) -> None:
+    r"""Subscribe a listener to the invalidation events emitted by :func:`emit_invalidation`.
+
+    Parameters
+    ----------
+    listener : Callable[[cambiato.db.InvalidationEvent], None]
+        The function to call with each event. A listener is only added once.
+    """
+
+    with _invalidation_listeners_lock:
+        if listener not in _invalidation_listeners:
+            _invalidation_listeners.append(listener)
+
+
+def remove_invalidation_listener(listener: InvalidationListener) -> None:
+    r"""Unsubscribe a listener added by :func:`add_invalidation_listener`.
+
+    Parameters
+    ----------
+    listener : Callable[[cambiato.db.InvalidationEvent], None]
+        The listener to remove. A listener that is not subscribed is ignored.
+    """
+
+    with _invalidation_listeners_lock:
+        if listener in _invalidation_listeners:
+            _invalidation_listeners.remove(listener)
+
+
+def emit_invalidation(
+    tables: Iterable[str], utility_ids: Iterable[int] | None = None
+) -> InvalidationEvent:
+    r"""Notify the subscribed listeners that data in the database has changed.
+
+    The listeners are called in the order they were added. An exception raised by a
+    listener is logged and does not prevent the other listeners from being called.
+
+    Parameters
+    ----------
+    tables : Iterable[str]
+        The names of the changed tables.
+
+    utility_ids : Iterable[int] or None, default None
+        The ID:s of the utilities of the changed rows. If None the
+        changes may affect all utilities.
+
+    Returns
+    -------
+    cambiato.db.InvalidationEvent
+        The emitted event.
+    """
+
+    event = InvalidationEvent(
+        tables=frozenset(tables),
+        utility_ids=None if utility_ids is None else frozenset(utility_ids),
+    )
+
+    with _invalidation_listeners_lock:
+        listeners = list(_invalidation_listeners)
+
+    for listener in listeners:
+        try:
+            listener(event)
+        except Exception:
+            logger.exception(f'Error calling invalidation listener {listener!r} with {event!r}!')
+
+    return event
+
+
+def _types_mapper(type_: pa.DataType) -> pd.ArrowDtype | None:
+    r"""Map Arrow types to pyarrow backed dtypes except dictionaries, which become categoricals."""
+
+    return None if pa.types.is_dictionary(type_) else pd.ArrowDtype(type_)
+
+
+def _dtype_name(dtype: Any) -> str:
+    r"""The name of a dtype including the storage of string dtypes."""
+
+    return f'string[{dtype.storage}]' if isinstance(dtype, pd.StringDtype) else str(dtype)
+
+
+class ArrowIPCCache:
+    r"""A cache of DataFrames stored as memory-mapped Arrow IPC files.
+
+    Parameters
+    ----------
+    directory : pathlib.Path
+        The directory where the cache files are stored. It is created if it does not exist.
+
+    ttl : datetime.timedelta or None, default None
+        The time to live of the cached DataFrames. A cached DataFrame that was stored longer
+        ago than `ttl` is considered missing. If None the cached DataFrames never expire and
+        are only invalidated by bumping the version stamp of their namespace.
+    """
+
+    def __init__(self, directory: Path, ttl: timedelta | None = None) -> None:
+        self.directory = directory
+        self.ttl = ttl
+        directory.mkdir(parents=True, exist_ok=True)
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}(directory={self.directory!r}, ttl={self.ttl!r})'
+
+    def _version_path(self, namespace: str, scope: str | None = None) -> Path:
+        r"""The path to the version stamp file of `namespace` or of a scope of `namespace`."""
+
+        return self.directory / (
+            f'{namespace}.version' if scope is None else f'{namespace}@{scope}.version'
+        )
+
+    def _read_version(self, path: Path) -> str:
+        r"""Read a version stamp file."""
+
+        try:
+            return path.read_text().strip() or INITIAL_VERSION
+        except FileNotFoundError:
+            return INITIAL_VERSION
+
+    def _data_path(self, namespace: str, key: str, version: str) -> Path:
+        r"""The path to the Arrow IPC file of a cached DataFrame."""
+
+        return self.directory / f'{namespace}-{key}-{version}.arrow'
+
+    def _write_atomic(self, path: Path, data: pa.Table | str) -> None:
+        r"""Write `data` to a temporary file and atomically move it to `path`."""
+
+        tmp_path = path.with_name(f'.{path.name}.{os.getpid()}.{uuid.uuid4().hex}.tmp')
+
+        try:
+            if isinstance(data, str):
+                tmp_path.write_text(data)
+            else:
+                with (
+                    pa.OSFile(str(tmp_path), 'wb') as sink,
+                    pa.ipc.new_file(sink, data.schema) as writer,
+                ):
+                    writer.write_table(data)
+            os.replace(tmp_path, path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+    def _remove_files(self, pattern: str, keep: Path | None = None) -> None:
+        r"""Remove the cache files matching `pattern` except for `keep`.
+
+        Files that cannot be removed, e.g. because they are still memory-mapped by
+        another process on Windows, are left to be removed by a later call.
+        """
+
+        for path in self.directory.glob(pattern):
+            if path == keep:
+                continue
+            try:
+                path.unlink(missing_ok=True)
+            except OSError:
+                logger.debug(f'Could not remove stale cache file "{path}".')
+
+    @staticmethod
+    def _read(path: Path) -> pd.DataFrame:
+        r"""Read a DataFrame from a memory-mapped Arrow IPC file."""
+
+        table = pa.ipc.open_file(pa.memory_map(str(path), 'r')).read_all()
+        metadata = json.loads((table.schema.metadata or {}).get(_METADATA_KEY, b'{}'))
+        df = table.to_pandas(types_mapper=_types_mapper)
+
+        for col in metadata.get('string_cols', []):  # Wrapping the Arrow data is zero-copy.
+            df[col] = pd.arrays.ArrowStringArray(table.column(col))
+
+        for col, dtype in metadata.get('categories_dtypes', {}).items():
+            s = df[col]
+            df[col] = s.cat.rename_categories(s.cat.categories.astype(dtype))
+
+        index_cols = metadata.get('index_cols', [])
+
+        return df.set_index(index_cols) if index_cols else df
+
+    def get_version(self, namespace: str, scopes: Collection[str] = ()) -> str:
+        r"""Get the current version stamp of a namespace.
+
+        Parameters
+        ----------
+        namespace : str
+            The namespace of the cached DataFrames.
+
+        scopes : Collection[str], default ()
+            The scopes of the cached DataFrame. If specified the version stamp
+            combines the version stamps of the namespace and of `scopes`.
+
+        Returns
+        -------
+        str
+            The version stamp. If the namespace has not been invalidated yet
+            and no scopes are specified the initial version "0" is returned.
+        """
+
+        version = self._read_version(self._version_path(namespace))
+
+        if not scopes:
+            return version
+
+        versions = [
+            version,
+            *(self._read_version(self._version_path(namespace, s)) for s in scopes),
+        ]
+
+        return hashlib.blake2b(' '.join(versions).encode(), digest_size=8).hexdigest()
+
+    def invalidate(self, namespace: str, scopes: Collection[str] | None = None) -> str:
+        r"""Invalidate the cached DataFrames of a namespace by bumping its version stamp.
+
+        Parameters
+        ----------
+        namespace : str
+            The namespace of the cached DataFrames to invalidate.
+
+        scopes : Collection[str] or None, default None
+            The scopes to invalidate. The cached DataFrames of other scopes are kept, except
+            for the cached DataFrames of :data:`ALL_SCOPE`, which are always invalidated.
+            Stale files of invalidated scopes are removed when their key is stored again.
+            If None all cached DataFrames of the namespace are invalidated.
+
+        Returns
+        -------
+        str
+            The new version stamp of the namespace or of the last invalidated scope.
+        """
+
+        version = uuid.uuid4().hex
+
+        if scopes is None:
+            self._write_atomic(self._version_path(namespace), version)
+            self._remove_files(f'{namespace}-*.arrow')
+            logger.debug(f'Invalidated cache namespace "{namespace}" with new version {version}.')
+            return version
+
+        for scope in {*scopes, ALL_SCOPE}:
+            version = uuid.uuid4().hex
+            self._write_atomic(self._version_path(namespace, scope), version)
+
+        logger.debug(f'Invalidated scopes {sorted(scopes)} of cache namespace "{namespace}".')
+
+        return version
+
+    def load(self, namespace: str, key: str, version: str) -> pd.DataFrame | None:
+        r"""Load a cached DataFrame by memory-mapping its Arrow IPC file.
+
+        Parameters
+        ----------
+        namespace : str
+            The namespace of the cached DataFrame.
+
+        key : str
+            The key of the cached DataFrame within `namespace`.
+
+        version : str
+            The version stamp of `namespace`.
+
+        Returns
+        -------
+        pandas.DataFrame or None
+            The cached DataFrame with columns backed by the memory-mapped Arrow data.
+            None is returned if the DataFrame is not cached or has expired.
+        """
+
+        path = self._data_path(namespace=namespace, key=key, version=version)
+
+        try:
+            if (
+                self.ttl is not None
+                and time.time() - path.stat().st_mtime > self.ttl.total_seconds()
+            ):
+                return None
+            return self._read(path)
+        except FileNotFoundError:
+            return None
+
+    def store(self, namespace: str, key: str, version: str, df: pd.DataFrame) -> pd.DataFrame:
+        r"""Store a DataFrame in the cache.
+
+        Cached DataFrames of `key` with other versions are removed.
+
+        Parameters
+        ----------
+        namespace : str
+            The namespace of the DataFrame.
+
+        key : str
+            The key of the DataFrame within `namespace`.
+
+        version : str
+            The version stamp of `namespace`.
+
+        df : pandas.DataFrame
+            The DataFrame to cache. The index is stored along with the columns.
+
+        Returns
+        -------
+        pandas.DataFrame
+            The stored DataFrame loaded from the memory-mapped cache file.
+        """
+
+        path = self._data_path(namespace=namespace, key=key, version=version)
+        index_cols = [c for c in df.index.names if c is not None]
+        df = df.reset_index() if index_cols else df
+        metadata = {
+            'index_cols': index_cols,
+            'string_cols': [
+                c for c, dtype in df.dtypes.items() if isinstance(dtype, pd.StringDtype)
+            ],
+            'categories_dtypes': {
+                c: _dtype_name(dtype.categories.dtype)
+                for c, dtype in df.dtypes.items()
+                if isinstance(dtype, pd.CategoricalDtype)
+            },
+        }
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        table = table.replace_schema_metadata({_METADATA_KEY: json.dumps(metadata).encode()})
+        self._write_atomic(path, table)
+        self._remove_files(f'{namespace}-{key}-*.arrow', keep=path)
+
+        return self._read(path)
+
+    def get_or_store(
+        self, namespace: str, key: str, version: str, func: Callable[[], pd.DataFrame]
+    ) -> pd.DataFrame:
+        r"""Load a cached DataFrame and store the result of `func` if it is not cached.
+
+        Parameters
+        ----------
+        namespace : str
+            The namespace of the DataFrame.
+
+        key : str
+            The key of the DataFrame within `namespace`.
+
+        version : str
+            The version stamp of `namespace`.
+
+        func : Callable[[], pandas.DataFrame]
+            The function that loads the DataFrame, e.g. from the database, if it is not cached.
+
+        Returns
+        -------
+        pandas.DataFrame
+            The cached DataFrame loaded from the memory-mapped cache file.
+        """
+
+        if (df := self.load(namespace=namespace, key=key, version=version)) is not None:
+            return df
+
+        logger.debug(f'Cache miss for "{namespace}-{key}" with version {version}.')
+
+        return self.store(namespace=namespace, key=key, version=version, df=func())
+
+
+class CacheEntry(NamedTuple):
+    r"""An object cached in the memory of the process.
+
+    Parameters
+    ----------
+    namespace : str
+        The namespace of the entry, e.g. the name of the cached function.
+
+    key : str
+        The key of the entry within `namespace`.
+
+    value : Any
+        The cached object.
+
+    nbytes : int
+        The memory usage of `value` in bytes.
+
+    version : str
+        The version stamp of `namespace` when `value` was loaded.
+
+    description : str
+        A description of the entry, e.g. the arguments of the cached function.
+
+    shared : bool
+        True if the data of `value` is memory-mapped from a cache file shared between
+        processes and False if it is owned by the process.
+
+    loaded_at : datetime.datetime
+        When `value` was loaded (UTC).
+
+    accessed_at : datetime.datetime
+        When the entry was last accessed (UTC).
+
+    scopes : tuple[str, ...], default ()
+        The scopes of `namespace` that `value` was loaded for. An entry without scopes
+        depends on all scopes.
+    """
+
+    namespace: str
+    key: str
+    value: Any
+    nbytes: int
+    version: str
+    description: str
+    shared: bool
+    loaded_at: datetime
+    accessed_at: datetime
+    scopes: tuple[str, ...] = ()
+
+
+class CacheStats(NamedTuple):
+    r"""The statistics of a namespace of a :class:`CacheRegistry`.
+
+    Parameters
+    ----------
+    namespace : str
+        The namespace of the statistics.
+
+    hits : int, default 0
+        The number of lookups that found a valid entry.
+
+    misses : int, default 0
+        The number of lookups that did not find a valid entry.
+
+    evictions : int, default 0
+        The number of entries evicted to fit the byte budget of the registry.
+
+    expirations : int, default 0
+        The number of entries removed because their time to live had expired.
+
+    invalidations : int, default 0
+        The number of entries removed by an invalidation.
+
+    loads : int, default 0
+        The number of objects loaded into the registry after a miss.
+
+    load_seconds : float, default 0.0
+        The total duration of the loads in seconds.
+
+    max_load_seconds : float, default 0.0
+        The duration of the slowest load in seconds.
+
+    entries : int, default 0
+        The number of entries of the namespace.
+
+    nbytes : int, default 0
+        The total memory usage of the entries of the namespace in bytes.
+
+    max_nbytes : int, default 0
+        The memory usage of the largest entry of the namespace in bytes.
+    """
+
+    namespace: str
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+    loads: int = 0
+    load_seconds: float = 0.0
+    max_load_seconds: float = 0.0
+    entries: int = 0
+    nbytes: int = 0
+    max_nbytes: int = 0
+
+    @property
+    def hit_ratio(self) -> float | None:
+        r"""The ratio of the lookups that were hits or None if there have been no lookups."""
+
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else None
+
+    @property
+    def mean_load_seconds(self) -> float | None:
+        r"""The mean duration of the loads in seconds or None if there have been no loads."""
+
+        return self.load_seconds / self.loads if self.loads else None
+
+
+class CacheRegistry:
+    r"""A registry of the objects cached in the memory of the process.
+
+    The registry accounts for the memory usage of each cached object and keeps the
+    entries in least recently used order. The registry is thread-safe.
+
+    Parameters
+    ----------
+    max_bytes : int or None, default None
+        The byte budget of the cached objects. When the total memory usage of the entries
+        exceeds `max_bytes` the least recently used entries are evicted. The most recently
+        stored entry is never evicted. If None the entries are never evicted.
+
+    ttl : datetime.timedelta or None, default None
+        The time to live of the entries. An entry that was loaded longer ago than `ttl` is
+        considered missing. If None the entries never expire.
+    """
+
+    def __init__(self, max_bytes: int | None = None, ttl: timedelta | None = None) -> None:
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries: OrderedDict[tuple[str, str], CacheEntry] = OrderedDict()
+        self._total_bytes = 0
+        self._stats: dict[str, CacheStats] = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}(max_bytes={self.max_bytes!r}, ttl={self.ttl!r})'
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def total_bytes(self) -> int:
+        r"""The total memory usage of the cached objects in bytes."""
+
+        return self._total_bytes
+
+    def _remove(self, id_: tuple[str, str]) -> CacheEntry | None:
+        r"""Remove an entry. The lock must be held by the caller."""
+
+        entry = self._entries.pop(id_, None)
+        if entry is not None:
+            self._total_bytes -= entry.nbytes
+
+        return entry
+
+    def _count(self, namespace: str, **counts: int) -> None:
+        r"""Add to the counters of the statistics of a namespace.
+
+        The lock must be held by the caller.
+        """
+
+        stats = self._stats.get(namespace) or CacheStats(namespace=namespace)
+        self._stats[namespace] = stats._replace(
+            **{name: getattr(stats, name) + count for name, count in counts.items()}
+        )
+
+    def get(
+        self,
+        namespace: str,
+        key: str,
+        version: str = INITIAL_VERSION,
+        *,
+        record_stats: bool = True,
+    ) -> Any | None:
+        r"""Get a cached object and mark it as most recently used.
+
+        Parameters
+        ----------
+        namespace : str
+            The namespace of the entry.
+
+        key : str
+            The key of the entry within `namespace`.
+
+        version : str, default '0'
+            The current version stamp of `namespace`. An entry loaded for
+            another version is considered missing.
+
+        record_stats : bool, default True
+            True if the lookup should be counted as a hit or miss in the statistics of
+            `namespace` and False otherwise, e.g. for a repeated lookup under a lock.
+
+        Returns
+        -------
+        Any or None
+            The cached object or None if it is missing or has expired.
+        """
+
+        id_ = (namespace, key)
+        now = datetime.now(UTC)
+
+        with self._lock:
+            entry = self._entries.get(id_)
+            if entry is None:
+                if record_stats:
+                    self._count(namespace, misses=1)
+                return None
+
+            expired = self.ttl is not None and now - entry.loaded_at > self.ttl
+            if entry.version != version or expired:
+                self._remove(id_)
+                if expired:
+                    self._count(namespace, expirations=1)
+                if record_stats:
+                    self._count(namespace, misses=1)
+                return None
+
+            if record_stats:
+                self._count(namespace, hits=1)
+            self._entries[id_] = entry._replace(accessed_at=now)
+            self._entries.move_to_end(id_)
+
+        return entry.value
+
+    def put(
+        self,
+        namespace: str,
+        key: str,
+        value: Any,
+        nbytes: int,
+        *,
+        version: str = INITIAL_VERSION,
+        description: str = '',
+        shared: bool = False,
+        scopes: Iterable[str] = (),
+    ) -> list[CacheEntry]:
+        r"""Store an object in the registry as the most recently used entry.
+
+        If the total memory usage exceeds the byte budget the least recently used entries
+        are evicted until it fits within the budget or only the new entry remains.
+
+        Parameters
+        ----------
+        namespace : str
+            The namespace of the entry.
+
+        key : str
+            The key of the entry within `namespace`. An existing entry is replaced.
+
+        value : Any
+            The object to cache.
+
+        nbytes : int
+            The memory usage of `value` in bytes.
+
+        version : str, default '0'
+            The version stamp of `namespace` when `value` was loaded.
+
+        description : str, default ''
+            A description of the entry, e.g. the arguments of the cached function.
+
+        shared : bool, default False
+            True if the data of `value` is memory-mapped from a shared cache file.
+
+        scopes : Iterable[str], default ()
+            The scopes of `namespace` that `value` was loaded for.
+
+        Returns
+        -------
+        list[cambiato.db.CacheEntry]
+            The evicted entries.
+        """
+
+        id_ = (namespace, key)
+        now = datetime.now(UTC)
+        entry = CacheEntry(
+            namespace=namespace,
+            key=key,
+            value=value,
+            nbytes=nbytes,
+            version=version,
+            description=description,
+            shared=shared,
+            loaded_at=now,
+            accessed_at=now,
+            scopes=tuple(scopes),
+        )
+        evicted: list[CacheEntry] = []
+
+        with self._lock:
+            self._remove(id_)
+            self._entries[id_] = entry
+            self._total_bytes += nbytes
+
+            if self.max_bytes is not None:
+                while self._total_bytes > self.max_bytes and len(self._entries) > 1:
+                    _, lru_entry = self._entries.popitem(last=False)
+                    self._total_bytes -= lru_entry.nbytes
+                    self._count(lru_entry.namespace, evictions=1)
+                    evicted.append(lru_entry)
+
+        for e in evicted:
+            logger.debug(
+                f'Evicted cache entry "{e.namespace}-{e.key}" of {e.nbytes} bytes to fit '
+                f'the byte budget of {self.max_bytes} bytes.'
+            )
+
+        return evicted
+
+    def invalidate(self, namespace: str | None = None, scopes: Iterable[str] | None = None) -> None:
+        r"""Remove the entries of a namespace.
+
+        Parameters
+        ----------
+        namespace : str or None, default None
+            The namespace to remove. If None all entries are removed.
+
+        scopes : Iterable[str] or None, default None
+            Only remove the entries of `namespace` loaded for any of `scopes`, for
+            :data:`ALL_SCOPE` or without scopes. If None all entries of `namespace`
+            are removed.
+        """
+
+        invalid_scopes = None if scopes is None else {*scopes, ALL_SCOPE}
+
+        with self._lock:
+            for id_, entry in list(self._entries.items()):
+                if namespace is None or (
+                    id_[0] == namespace
+                    and (
+                        invalid_scopes is None
+                        or not entry.scopes
+                        or not invalid_scopes.isdisjoint(entry.scopes)
+                    )
+                ):
+                    self._remove(id_)
+                    self._count(entry.namespace, invalidations=1)
+
+    def entries(self) -> list[CacheEntry]:
+        r"""Get the entries of the registry from least to most recently used."""
+
+        with self._lock:
+            return list(self._entries.values())
+
+    def usage_by_namespace(self) -> dict[str, tuple[int, int]]:
+        r"""Get the number of entries and their total memory usage in bytes per namespace."""
+
+        usage: dict[str, tuple[int, int]] = {}
+        for entry in self.entries():
+            nr_entries, nbytes = usage.get(entry.namespace, (0, 0))
+            usage[entry.namespace] = (nr_entries + 1, nbytes + entry.nbytes)
+
+        return usage
+
+    def record_load(self, namespace: str, seconds: float) -> None:
+        r"""Record the duration of loading an object of a namespace after a miss.
+
+        Parameters
+        ----------
+        namespace : str
+            The namespace of the loaded object.
+
+        seconds : float
+            The duration of the load in seconds.
+        """
+
+        with self._lock:
+            self._count(namespace, loads=1)
+            stats = self._stats[namespace]
+            self._stats[namespace] = stats._replace(
+                load_seconds=stats.load_seconds + seconds,
+                max_load_seconds=max(stats.max_load_seconds, seconds),
+            )
+
+    def stats(self) -> dict[str, CacheStats]:
+        r"""Get the statistics of each namespace of the registry.
+
+        Returns
+        -------
+        dict[str, cambiato.db.CacheStats]
+            The statistics of each namespace sorted by namespace. The counters accumulate
+            since the registry was created or the statistics were last reset, while the
+            entries and memory usage are those of the current entries.
+        """
+
+        with self._lock:
+            stats = dict(self._stats)
+            entries = list(self._entries.values())
+
+        for entry in entries:
+            s = stats.get(entry.namespace) or CacheStats(namespace=entry.namespace)
+            stats[entry.namespace] = s._replace(
+                entries=s.entries + 1,
+                nbytes=s.nbytes + entry.nbytes,
+                max_nbytes=max(s.max_nbytes, entry.nbytes),
+            )
+
+        return dict(sorted(stats.items()))
+
+    def reset_stats(self) -> None:
+        r"""Reset the counters of the statistics of all namespaces."""
+
+        with self._lock:
+            self._stats.clear()
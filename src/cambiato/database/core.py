@@ -3,9 +3,11 @@ r"""The core database functionality."""
 # Standard library
 import logging
 from collections.abc import Sequence
-from typing import Any, NamedTuple, TypeAlias
 
 # Third party
+from sqlalchemy import Table, insert, select
+from sqlalchemy.dialects import mysql, postgresql, sqlite
+from sqlalchemy.sql.dml import Insert
 from streamlit_passwordless.database import URL as URL
 from streamlit_passwordless.database import Session as Session
 from streamlit_passwordless.database import SessionFactory as SessionFactory
@@ -13,34 +15,13 @@ from streamlit_passwordless.database import create_session_factory as create_ses
 
 # Local
 from cambiato import exceptions
+from cambiato.core import ChangedDatabaseRows as ChangedDatabaseRows
 from cambiato.core import OperationResult
+from cambiato.core import PrimaryKey as PrimaryKey
+from cambiato.core import Row as Row
 
 logger = logging.getLogger(__name__)
 
-Row: TypeAlias = dict[str, Any]
-PrimaryKey: TypeAlias = int | str
-
-
-class ChangedDatabaseRows(NamedTuple):
-    r"""Information about rows that have changed for a table.
-
-    Parameters
-    ----------
-    edited_rows : Sequence[dict[str, Any]] or dict[str, Any] or None, default None
-        Rows that have been edited and should be updated in the database.
-
-    added_rows : Sequence[dict[str, Any]] or dict[str, Any] or None, default None
-        Rows that have been added and should be added to the database.
-
-    deleted_rows : Sequence[int | str] or None, default None
-        Rows that have been deleted and should be deleted from the database.
-        The sequence should contain the primary keys of the rows to delete.
-    """
-
-    edited_rows: Sequence[Row] | Row | None = None
-    added_rows: Sequence[Row] | Row | None = None
-    deleted_rows: Sequence[PrimaryKey] | None = None
-
 
 def commit(session: Session, error_msg: str = 'Error committing transaction!') -> OperationResult:
     r"""Commit a database transaction.
@@ -68,3 +49,46 @@ def commit(session: Session, error_msg: str = 'Error committing transaction!') -
         result = OperationResult()
 
     return result
+
+
+def insert_or_ignore(session: Session, table: Table, rows: Sequence[Row]) -> None:
+    r"""Bulk insert rows into a table and skip the rows that already exist.
+
+    The rows are inserted with a single executemany statement using the native
+    "insert or ignore" construct of the database dialect (SQLite, PostgreSQL, MySQL
+    and MariaDB). For other dialects the rows whose primary key already exists in
+    `table` are filtered out before the insert. The transaction is not committed.
+
+    Parameters
+    ----------
+    session : cambiato.db.Session
+        An active database session.
+
+    table : sqlalchemy.Table
+        The table to insert the rows into.
+
+    rows : Sequence[dict[str, Any]]
+        The rows to insert. All rows must have the same keys.
+    """
+
+    if not rows:
+        return
+
+    dialect = session.get_bind().dialect.name
+
+    stmt: Insert
+    if dialect == 'sqlite':
+        stmt = sqlite.insert(table).on_conflict_do_nothing()
+    elif dialect == 'postgresql':
+        stmt = postgresql.insert(table).on_conflict_do_nothing()
+    elif dialect in {'mysql', 'mariadb'}:
+        stmt = mysql.insert(table).prefix_with('IGNORE')
+    else:
+        pk_cols = tuple(table.primary_key.columns)
+        existing = set(session.execute(select(*pk_cols)).tuples())
+        rows = [r for r in rows if tuple(r.get(c.key) for c in pk_cols) not in existing]
+        if not rows:
+            return
+        stmt = insert(table)
+
+    session.execute(stmt, rows)
@@ -5,7 +5,10 @@ from .checklist import get_all_checklists
 from .customer import get_customer_id_by_facility_id
 from .facility import get_all_facilities
 from .order import (
+    DEFAULT_PAGE_SIZE,
+    OrderPage,
     create_order,
+    get_active_orders_page,
     get_all_active_orders,
     get_all_order_statuses,
     get_all_order_types,
@@ -23,7 +26,10 @@ __all__ = [
     # facility
     'get_all_facilities',
     # order
+    'DEFAULT_PAGE_SIZE',
+    'OrderPage',
     'create_order',
+    'get_active_orders_page',
     'get_all_active_orders',
     'get_all_order_statuses',
     'get_all_order_types',
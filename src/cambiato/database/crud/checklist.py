@@ -46,7 +46,7 @@ def get_all_checklists(
 
     df = pd.read_sql_query(
         sql=query,
-        con=_session.bind,  # type: ignore[arg-type]
+        con=_session.bind,
         dtype={col: ChecklistDataFrameModel.dtypes[col] for col in (c_checklist_id, c_name)},
     ).set_index(ChecklistDataFrameModel.index_cols)
 
@@ -1,11 +1,14 @@
 r"""Core functions to build SQL statements."""
 
 # Third party
-from sqlalchemy import String, case, cast, func, literal
+from sqlalchemy import String, and_, case, cast, func, literal
+from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.orm.util import AliasedClass
 from sqlalchemy.sql import ColumnElement
 
 # Local
-from cambiato.database.models import Location
+from cambiato.config import Language
+from cambiato.database.models import Location, Translation
 
 
 def build_full_address_column(apartment_nr_prefix: str = '') -> ColumnElement[str]:
@@ -50,3 +53,70 @@ def build_full_address_column(apartment_nr_prefix: str = '') -> ColumnElement[st
         .concat(space)
         .concat(func.coalesce(Location.city, ''))
     )
+
+
+def build_translated_column(
+    column: InstrumentedAttribute[str],
+    translation: type[Translation] | AliasedClass[Translation],
+    language: Language | None,
+) -> ColumnElement[str]:
+    r"""Construct a column with the translations of a column of a reference table.
+
+    Rows without a translation fall back to the value of `column`. The translations
+    should be joined onto the query with :func:`build_translation_join_condition`.
+
+    Parameters
+    ----------
+    column : sqlalchemy.orm.InstrumentedAttribute[str]
+        The column to translate. Either the name or description column of a reference table.
+
+    translation : type[cambiato.db.models.Translation] or sqlalchemy.orm.util.AliasedClass[cambiato.db.models.Translation]
+        The alias of the translation table that is joined onto the reference table.
+
+    language : cambiato.config.Language or None
+        The language to translate into. If None `column` is returned untranslated.
+
+    Returns
+    -------
+    sqlalchemy.sql.ColumnElement[str]
+        The translated column.
+    """
+
+    if language is None:
+        return column.expression
+
+    return func.coalesce(getattr(translation, column.key), column)
+
+
+def build_translation_join_condition(
+    translation: type[Translation] | AliasedClass[Translation],
+    id_column: InstrumentedAttribute[int],
+    language: Language,
+) -> ColumnElement[bool]:
+    r"""Construct the condition for joining the translations onto a reference table.
+
+    The translations should be joined with a left outer join such that
+    rows without a translation are kept.
+
+    Parameters
+    ----------
+    translation : type[cambiato.db.models.Translation] or sqlalchemy.orm.util.AliasedClass[cambiato.db.models.Translation]
+        The alias of the translation table to join.
+
+    id_column : sqlalchemy.orm.InstrumentedAttribute[int]
+        The primary key column of the reference table to translate.
+
+    language : cambiato.config.Language
+        The language of the translations to join.
+
+    Returns
+    -------
+    sqlalchemy.sql.ColumnElement[bool]
+        The join condition.
+    """
+
+    return and_(
+        translation.table_name == id_column.class_.__tablename__,
+        translation.row_id == id_column,
+        translation.language == str(language),
+    )
@@ -50,7 +50,7 @@ def get_all_facilities(
     if utility_ids:
         query = query.where(Facility.utility_id.in_(utility_ids))
 
-    df = pd.read_sql_query(  # type: ignore[call-overload]
+    df = pd.read_sql_query(
         sql=query,
         con=_session.bind,
         dtype={
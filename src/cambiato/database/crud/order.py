@@ -1,31 +1,41 @@
 r"""Functions for working with order related models."""
 
 # Standard library
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
+from datetime import datetime
+from typing import NamedTuple
 from zoneinfo import ZoneInfo
 
 # Third party
 import pandas as pd
-from sqlalchemy import delete, insert, or_, select, update
+from sqlalchemy import Select, delete, insert, or_, select, update
 from sqlalchemy.orm import aliased
 
 # Local
+from cambiato.config import Language
 from cambiato.core import OperationResult
+from cambiato.database.cache import emit_invalidation
 from cambiato.database.core import ChangedDatabaseRows, Session, commit
-from cambiato.database.crud.core import build_full_address_column
-from cambiato.database.models import Facility, Order, OrderStatus, OrderType, User
+from cambiato.database.crud.core import (
+    build_full_address_column,
+    build_translated_column,
+    build_translation_join_condition,
+)
+from cambiato.database.models import Facility, Order, OrderStatus, OrderType, Translation, User
 from cambiato.models.dataframe import (
     OrderDataFrameModel,
     OrderStatusDataFrameModel,
     OrderTypeDataFrameModel,
 )
-from cambiato.translations import TranslationMapping, translate_dataframe
+
+# The default number of orders of a page of orders.
+DEFAULT_PAGE_SIZE = 100
 
 
 def get_all_order_types(
     _session: Session,
     utility_ids: Sequence[int] | None = None,
-    translation: TranslationMapping | None = None,
+    language: Language | None = None,
 ) -> OrderTypeDataFrameModel:
     r"""Get all order types from the database.
 
@@ -38,8 +48,9 @@ def get_all_order_types(
         The ID:s of the utilities to filter by in addition to the non-utility specific
         order types. If None all order types without a specified utility are included.
 
-    translation : Mapping[int, str] or None, default None
-        The translations for the names of the default order types.
+    language : cambiato.config.Language or None, default None
+        The language to translate the names of the order types into. The order types
+        without a translation keep their name. If None no translation is performed.
 
     Returns
     -------
@@ -50,10 +61,19 @@ def get_all_order_types(
     c_order_type_id = OrderTypeDataFrameModel.c_order_type_id
     c_name = OrderTypeDataFrameModel.c_name
 
+    translation = aliased(Translation, name='order_type_translation')
+
     query = select(
-        OrderType.order_type_id.label(c_order_type_id), OrderType.name.label(c_name)
+        OrderType.order_type_id.label(c_order_type_id),
+        build_translated_column(OrderType.name, translation, language).label(c_name),
     ).order_by(OrderType.order_type_id)
 
+    if language is not None:
+        query = query.outerjoin(
+            translation,
+            build_translation_join_condition(translation, OrderType.order_type_id, language),
+        )
+
     if utility_ids:
         query = query.where(
             or_(OrderType.utility_id.in_(utility_ids), OrderType.utility_id.is_(None))
@@ -63,20 +83,17 @@ def get_all_order_types(
 
     df = pd.read_sql_query(
         sql=query,
-        con=_session.bind,  # type: ignore[arg-type]
+        con=_session.bind,
         dtype={col: OrderTypeDataFrameModel.dtypes[col] for col in (c_order_type_id, c_name)},
     ).set_index(OrderTypeDataFrameModel.index_cols)
 
-    if translation:
-        df = translate_dataframe(df=df, translation=translation, columns=[c_name])
-
     return OrderTypeDataFrameModel(df=df)
 
 
 def get_all_order_statuses(
     _session: Session,
     utility_ids: Sequence[int] | None = None,
-    translation: TranslationMapping | None = None,
+    language: Language | None = None,
 ) -> OrderStatusDataFrameModel:
     r"""Get all order statuses from the database.
 
@@ -89,8 +106,9 @@ def get_all_order_statuses(
         The ID:s of the utilities to filter by in addition to the non-utility specific
         order statuses. If None all order statues without a specified utility are included.
 
-    translation : Mapping[int, str] or None, default None
-        The translations for the names of the default order statuses.
+    language : cambiato.config.Language or None, default None
+        The language to translate the names of the order statuses into. The order statuses
+        without a translation keep their name. If None no translation is performed.
 
     Returns
     -------
@@ -101,10 +119,19 @@ def get_all_order_statuses(
     c_order_status_id = OrderStatusDataFrameModel.c_order_status_id
     c_name = OrderStatusDataFrameModel.c_name
 
+    translation = aliased(Translation, name='order_status_translation')
+
     query = select(
-        OrderStatus.order_status_id.label(c_order_status_id), OrderStatus.name.label(c_name)
+        OrderStatus.order_status_id.label(c_order_status_id),
+        build_translated_column(OrderStatus.name, translation, language).label(c_name),
     ).order_by(OrderStatus.order_status_id)
 
+    if language is not None:
+        query = query.outerjoin(
+            translation,
+            build_translation_join_condition(translation, OrderStatus.order_status_id, language),
+        )
+
     if utility_ids:
         query = query.where(
             or_(OrderStatus.utility_id.in_(utility_ids), OrderStatus.utility_id.is_(None))
@@ -112,66 +139,33 @@ def get_all_order_statuses(
     else:
         query = query.where(OrderStatus.utility_id.is_(None))
 
-    df = pd.read_sql_query(  # type: ignore[call-overload]
+    df = pd.read_sql_query(
         sql=query,
         con=_session.bind,
         dtype={col: OrderStatusDataFrameModel.dtypes[col] for col in (c_order_status_id, c_name)},
         dtype_backend='pyarrow',
     ).set_index(OrderStatusDataFrameModel.index_cols)
 
-    if translation:
-        df = translate_dataframe(df=df, translation=translation, columns=[c_name])
-
     return OrderStatusDataFrameModel(df=df)
 
 
-def get_all_active_orders(
-    _session: Session,
-    utility_ids: Sequence[int] | None = None,
-    order_types: Sequence[int] | None = None,
-    order_statuses: Sequence[int] | None = None,
-    tz: ZoneInfo | None = None,
-    order_type_trans: TranslationMapping | None = None,
-    order_status_trans: TranslationMapping | None = None,
-) -> OrderDataFrameModel:
-    r"""Get all active orders from the database.
-
-    An active order is defined as an order with a status that is not of state "completed".
+def _build_active_orders_query(language: Language | None = None) -> Select:
+    r"""Build the query of the active orders without filters and sort order.
 
     Parameters
     ----------
-    _session : cambiato.db.Session
-        An active database session.
-
-    utility_ids : Sequence[int] or None, default None
-        The ID:s of the utilities to filter by. If None filtering by
-        column utility_id is omitted.
-
-    order_types : Sequence[int] or None, default None
-        The ID:s of the order types to filter by. If None filtering by
-        column order_type_id is omitted.
-
-    order_statuses : Sequence[int] or None, default None
-        The ID:s of the order statuses to filter by. If None filtering by
-        column order_status_id is omitted.
-
-    tz : zoneinfo.ZoneInfo or None, default None
-        The timezone to convert the datetime columns into. If None conversion from
-        the database UTC timezone is omitted.
-
-    order_type_trans : cambiato.translations.TranslationMapping or None, default None
-        Translations for the names of the order types. If None no translation is performed.
-
-    order_status_trans: cambiato.translations.TranslationMapping or None, default None
-        Translations for the names of the order statuses. If None no translation is performed.
+    language : cambiato.config.Language or None, default None
+        The language to translate the names of the order types and order statuses into.
+        If None no translation is performed.
 
     Returns
     -------
-    cambiato.models.OrderDataFrameModel
-        The orders retrieved from the database.
+    sqlalchemy.Select
+        The query of the columns of :class:`cambiato.models.OrderDataFrameModel`.
     """
 
     c_order_id = OrderDataFrameModel.c_order_id
+    c_utility_id = OrderDataFrameModel.c_utility_id
     c_order_type_id = OrderDataFrameModel.c_order_type_id
     c_order_type_name = OrderDataFrameModel.c_order_type_name
     c_order_status_id = OrderDataFrameModel.c_order_status_id
@@ -190,14 +184,21 @@ def get_all_active_orders(
 
     created_by_alias = aliased(User, name='created_by_user')
     updated_by_alias = aliased(User, name='updated_by_user')
+    order_type_translation = aliased(Translation, name='order_type_translation')
+    order_status_translation = aliased(Translation, name='order_status_translation')
 
     query = (
         select(
             Order.order_id.label(c_order_id),
+            Order.utility_id.label(c_utility_id),
             OrderType.order_type_id.label(c_order_type_id),
-            OrderType.name.label(c_order_type_name),
+            build_translated_column(OrderType.name, order_type_translation, language).label(
+                c_order_type_name
+            ),
             OrderStatus.order_status_id.label(c_order_status_id),
-            OrderStatus.name.label(c_order_status_name),
+            build_translated_column(OrderStatus.name, order_status_translation, language).label(
+                c_order_status_name
+            ),
             Facility.ean.label(c_facility_ean),
             build_full_address_column().label(c_address),
             Order.ext_id.label(c_ext_id),
@@ -219,45 +220,276 @@ def get_all_active_orders(
         .join(created_by_alias, created_by_alias.user_id == Order.created_by)
         .join(updated_by_alias, updated_by_alias.user_id == Order.updated_by, isouter=True)
         .where(OrderStatus.is_completed == False)  # noqa: E712
-        .order_by(OrderStatus.order_status_id, Order.created_at.desc())
     )
 
-    if utility_ids:
-        query = query.where(Order.utility_id.in_(utility_ids))
+    if language is not None:
+        query = query.outerjoin(
+            order_type_translation,
+            build_translation_join_condition(
+                order_type_translation, OrderType.order_type_id, language
+            ),
+        ).outerjoin(
+            order_status_translation,
+            build_translation_join_condition(
+                order_status_translation, OrderStatus.order_status_id, language
+            ),
+        )
 
-    if order_types:
-        query = query.where(Order.order_type_id.in_(order_types))
+    return query
 
-    if order_statuses:
-        query = query.where(Order.order_status_id.in_(order_statuses))
+
+def _read_orders(session: Session, query: Select, tz: ZoneInfo | None) -> OrderDataFrameModel:
+    r"""Load the orders of a query built by :func:`_build_active_orders_query`.
+
+    Parameters
+    ----------
+    session : cambiato.db.Session
+        An active database session.
+
+    query : sqlalchemy.Select
+        The query of the orders.
+
+    tz : zoneinfo.ZoneInfo or None
+        The timezone to convert the datetime columns into. If None conversion from
+        the database UTC timezone is omitted.
+
+    Returns
+    -------
+    cambiato.models.OrderDataFrameModel
+        The orders retrieved from the database.
+    """
 
     df = pd.read_sql_query(
         sql=query,
-        con=_session.get_bind(),
+        con=session.get_bind(),
+        dtype=OrderDataFrameModel.dtypes,
         dtype_backend='pyarrow',
     ).set_index(OrderDataFrameModel.index_cols)
 
-    if order_type_trans and order_status_trans:
-        df = translate_dataframe(
-            df=df,
-            translation=(order_type_trans, order_status_trans),
-            columns=(c_order_type_name, c_order_status_name),
-            id_column=(c_order_type_id, c_order_status_id),
+    orders = OrderDataFrameModel(
+        df=df.drop(
+            columns=[OrderDataFrameModel.c_order_type_id, OrderDataFrameModel.c_order_status_id]
         )
-
-    orders = OrderDataFrameModel(df=df.drop(columns=[c_order_type_id, c_order_status_id]))
+    )
     orders.localize_and_convert_timezone(
         target_tz=tz if tz is None else str(tz),
-        ensure_datetime_cols=(c_scheduled_start_at, c_scheduled_end_at, c_created_at, c_updated_at),
+        ensure_datetime_cols=(
+            OrderDataFrameModel.c_scheduled_start_at,
+            OrderDataFrameModel.c_scheduled_end_at,
+            OrderDataFrameModel.c_created_at,
+            OrderDataFrameModel.c_updated_at,
+        ),
         copy=False,
     )
 
     return orders
 
 
+def get_all_active_orders(
+    _session: Session,
+    utility_ids: Sequence[int] | None = None,
+    order_types: Sequence[int] | None = None,
+    order_statuses: Sequence[int] | None = None,
+    tz: ZoneInfo | None = None,
+    language: Language | None = None,
+) -> OrderDataFrameModel:
+    r"""Get all active orders from the database.
+
+    An active order is defined as an order with a status that is not of state "completed".
+
+    Parameters
+    ----------
+    _session : cambiato.db.Session
+        An active database session.
+
+    utility_ids : Sequence[int] or None, default None
+        The ID:s of the utilities to filter by. If None filtering by
+        column utility_id is omitted.
+
+    order_types : Sequence[int] or None, default None
+        The ID:s of the order types to filter by. If None filtering by
+        column order_type_id is omitted.
+
+    order_statuses : Sequence[int] or None, default None
+        The ID:s of the order statuses to filter by. If None filtering by
+        column order_status_id is omitted.
+
+    tz : zoneinfo.ZoneInfo or None, default None
+        The timezone to convert the datetime columns into. If None conversion from
+        the database UTC timezone is omitted.
+
+    language : cambiato.config.Language or None, default None
+        The language to translate the names of the order types and order statuses into.
+        The translations are joined in the query and names without a translation are kept.
+        If None no translation is performed.
+
+    Returns
+    -------
+    cambiato.models.OrderDataFrameModel
+        The orders retrieved from the database.
+    """
+
+    query = _build_active_orders_query(language=language).order_by(
+        OrderStatus.order_status_id, Order.created_at.desc()
+    )
+
+    if utility_ids:
+        query = query.where(Order.utility_id.in_(utility_ids))
+
+    if order_types:
+        query = query.where(Order.order_type_id.in_(order_types))
+
+    if order_statuses:
+        query = query.where(Order.order_status_id.in_(order_statuses))
+
+    return _read_orders(session=_session, query=query, tz=tz)
+
+
+class OrderPage(NamedTuple):
+    r"""A page of orders loaded with a keyset cursor.
+
+    Parameters
+    ----------
+    orders : cambiato.models.OrderDataFrameModel
+        The orders of the page sorted by descending order ID.
+
+    next_cursor : int or None, default None
+        The cursor of the next page, which is the order ID of the last order of the page.
+        None if there are no more orders.
+    """
+
+    orders: OrderDataFrameModel
+    next_cursor: int | None = None
+
+    def memory_usage(self) -> int:
+        r"""The memory usage of the orders of the page in bytes."""
+
+        return self.orders.memory_usage()
+
+
+def get_active_orders_page(
+    _session: Session,
+    *,
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: int | None = None,
+    order_ids: Sequence[int] | None = None,
+    utility_ids: Sequence[int] | None = None,
+    order_types: Sequence[int] | None = None,
+    order_statuses: Sequence[int] | None = None,
+    technicians: Sequence[str] | None = None,
+    scheduled_from: datetime | None = None,
+    scheduled_to: datetime | None = None,
+    tz: ZoneInfo | None = None,
+    language: Language | None = None,
+) -> OrderPage:
+    r"""Get a page of the active orders from the database.
+
+    The filters and the page are applied by the query, which only loads the rows of the
+    page. The pages are sorted by descending order ID and the next page is selected by
+    the keyset cursor of the current page, i.e. the orders with an ID less than the
+    cursor, which uses the primary key index instead of skipping the rows of the
+    previous pages.
+
+    Parameters
+    ----------
+    _session : cambiato.db.Session
+        An active database session.
+
+    limit : int, default cambiato.db.DEFAULT_PAGE_SIZE
+        The maximum number of orders of the page.
+
+    cursor : int or None, default None
+        The cursor of the page from the :attr:`OrderPage.next_cursor` of the previous page.
+        If None the first page is loaded.
+
+    order_ids : Sequence[int] or None, default None
+        The ID:s of the orders to filter by, e.g. to reload orders that were saved.
+        If None filtering by column order_id is omitted.
+
+    utility_ids : Sequence[int] or None, default None
+        The ID:s of the utilities to filter by. If None filtering by
+        column utility_id is omitted.
+
+    order_types : Sequence[int] or None, default None
+        The ID:s of the order types to filter by. If None filtering by
+        column order_type_id is omitted.
+
+    order_statuses : Sequence[int] or None, default None
+        The ID:s of the order statuses to filter by. If None filtering by
+        column order_status_id is omitted.
+
+    technicians : Sequence[str] or None, default None
+        The user ID:s of the technicians assigned to the orders to filter by.
+        If None filtering by column assigned_to_user_id is omitted.
+
+    scheduled_from : datetime.datetime or None, default None
+        Only include orders scheduled to start at or after this time. If None
+        filtering by the start of the scheduled start time is omitted.
+
+    scheduled_to : datetime.datetime or None, default None
+        Only include orders scheduled to start before this time. If None
+        filtering by the end of the scheduled start time is omitted.
+
+    tz : zoneinfo.ZoneInfo or None, default None
+        The timezone to convert the datetime columns into. If None conversion from
+        the database UTC timezone is omitted.
+
+    language : cambiato.config.Language or None, default None
+        The language to translate the names of the order types and order statuses into.
+        If None no translation is performed.
+
+    Returns
+    -------
+    cambiato.db.OrderPage
+        The orders of the page and the cursor of the next page.
+    """
+
+    query = (
+        _build_active_orders_query(language=language)
+        .order_by(Order.order_id.desc())
+        .limit(limit + 1)  # The extra row tells if there is a next page.
+    )
+
+    if cursor is not None:
+        query = query.where(Order.order_id < cursor)
+
+    if order_ids:
+        query = query.where(Order.order_id.in_(order_ids))
+
+    if utility_ids:
+        query = query.where(Order.utility_id.in_(utility_ids))
+
+    if order_types:
+        query = query.where(Order.order_type_id.in_(order_types))
+
+    if order_statuses:
+        query = query.where(Order.order_status_id.in_(order_statuses))
+
+    if technicians:
+        query = query.where(Order.assigned_to_user_id.in_(technicians))
+
+    if scheduled_from is not None:
+        query = query.where(Order.scheduled_start_at >= scheduled_from)
+
+    if scheduled_to is not None:
+        query = query.where(Order.scheduled_start_at < scheduled_to)
+
+    orders = _read_orders(session=_session, query=query, tz=tz)
+
+    if orders.row_count <= limit:
+        return OrderPage(orders=orders)
+
+    page = OrderDataFrameModel(df=orders.df.iloc[:limit])
+
+    return OrderPage(orders=page, next_cursor=int(page.index[-1]))
+
+
 def create_order(session: Session, order: Order) -> OperationResult:
     r"""Create a new order in the database.
 
+    The cached orders of the utility of the order are invalidated
+    through :func:`cambiato.db.emit_invalidation`.
+
     Parameters
     ----------
     session : cambiato.db.Session
@@ -272,8 +504,52 @@ def create_order(session: Session, order: Order) -> OperationResult:
         The result of saving the order to the database.
     """
 
+    utility_id = order.utility_id
     session.add(order)
-    return commit(session=session, error_msg='Unexpected error when saving order to database!')
+    result = commit(session=session, error_msg='Unexpected error when saving order to database!')
+
+    if result.ok:
+        emit_invalidation(
+            tables=(Order.__tablename__,), utility_ids=None if utility_id is None else (utility_id,)
+        )
+
+    return result
+
+
+def _get_changed_order_utility_ids(
+    session: Session, changed_orders: ChangedDatabaseRows
+) -> set[int] | None:
+    r"""Get the ID:s of the utilities of the changed orders before the changes are applied.
+
+    Returns None if the utility of an added order is unknown.
+    """
+
+    c_order_id = Order.order_id.key
+    c_utility_id = Order.utility_id.key
+    edited, added = (
+        () if rows is None else (rows,) if isinstance(rows, Mapping) else rows
+        for rows in (changed_orders.edited_rows, changed_orders.added_rows)
+    )
+    utility_ids: set[int] = set()
+
+    for row in added:
+        if (utility_id := row.get(c_utility_id)) is None:
+            return None
+        utility_ids.add(utility_id)
+
+    for row in edited:  # An order can be moved to another utility.
+        if (utility_id := row.get(c_utility_id)) is not None:
+            utility_ids.add(utility_id)
+
+    order_ids = [*(row[c_order_id] for row in edited), *(changed_orders.deleted_rows or ())]
+    if order_ids:
+        utility_ids.update(
+            session.scalars(
+                select(Order.utility_id).where(Order.order_id.in_(order_ids)).distinct()
+            )
+        )
+
+    return utility_ids
 
 
 def process_changed_orders(
@@ -281,6 +557,9 @@ def process_changed_orders(
 ) -> OperationResult:
     r"""Process the changes (update, insert or delete) for selected orders.
 
+    The cached orders of the utilities of the changed orders are invalidated
+    through :func:`cambiato.db.emit_invalidation`.
+
     Parameters
     ----------
     session : cambiato.db.Session
@@ -295,6 +574,8 @@ def process_changed_orders(
         The result of processing the changed orders in the database.
     """
 
+    utility_ids = _get_changed_order_utility_ids(session=session, changed_orders=changed_orders)
+
     if updated := changed_orders.edited_rows:
         session.execute(update(Order), updated)
     if added := changed_orders.added_rows:
@@ -302,4 +583,9 @@ def process_changed_orders(
     if deleted := changed_orders.deleted_rows:
         session.execute(delete(Order).where(Order.order_id.in_(deleted)))
 
-    return commit(session=session, error_msg='Error performing order updates!')
+    result = commit(session=session, error_msg='Error performing order updates!')
+
+    if result.ok:
+        emit_invalidation(tables=(Order.__tablename__,), utility_ids=utility_ids)
+
+    return result
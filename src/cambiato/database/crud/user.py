@@ -35,7 +35,7 @@ def get_all_technicians(_session: Session) -> UserDataFrameModel:
         .order_by(User.displayname)
     )
 
-    df = pd.read_sql_query(  # type: ignore[call-overload]
+    df = pd.read_sql_query(
         sql=query,
         con=_session.bind,
         dtype={col: UserDataFrameModel.dtypes[col] for col in (c_user_id, c_displayname)},
@@ -3,17 +3,17 @@ r"""Functions for working with the Utility model."""
 # Third party
 import pandas as pd
 from sqlalchemy import select
+from sqlalchemy.orm import aliased
 
 # Local
+from cambiato.config import Language
 from cambiato.database.core import Session
-from cambiato.database.models import Utility
+from cambiato.database.crud.core import build_translated_column, build_translation_join_condition
+from cambiato.database.models import Translation, Utility
 from cambiato.models import UtilityDataFrameModel
-from cambiato.translations import TranslationMapping, translate_dataframe
 
 
-def get_all_utilities(
-    _session: Session, translation: TranslationMapping | None = None
-) -> UtilityDataFrameModel:
+def get_all_utilities(_session: Session, language: Language | None = None) -> UtilityDataFrameModel:
     r"""Get all utilities from the database.
 
     Parameters
@@ -21,8 +21,9 @@ def get_all_utilities(
     _session : Session
         An active database session.
 
-    translation : Mapping[int, str] or None, default None
-        The translations for the names of the default utilities.
+    language : cambiato.config.Language or None, default None
+        The language to translate the names of the utilities into. Utilities without
+        a translation keep their name. If None no translation is performed.
 
     Returns
     -------
@@ -33,18 +34,23 @@ def get_all_utilities(
     c_utility_id = UtilityDataFrameModel.c_utility_id
     c_name = UtilityDataFrameModel.c_name
 
-    query = select(Utility.utility_id.label(c_utility_id), Utility.name.label(c_name)).order_by(
-        Utility.utility_id
-    )
+    translation = aliased(Translation, name='utility_translation')
 
-    df = pd.read_sql_query(  # type: ignore[call-overload]
+    query = select(
+        Utility.utility_id.label(c_utility_id),
+        build_translated_column(Utility.name, translation, language).label(c_name),
+    ).order_by(Utility.utility_id)
+
+    if language is not None:
+        query = query.outerjoin(
+            translation, build_translation_join_condition(translation, Utility.utility_id, language)
+        )
+
+    df = pd.read_sql_query(
         sql=query,
         con=_session.bind,
         dtype={col: UtilityDataFrameModel.dtypes[col] for col in (c_utility_id, c_name)},
         dtype_backend='pyarrow',
     ).set_index(UtilityDataFrameModel.index_cols)
 
-    if translation:
-        df = translate_dataframe(df=df, translation=translation, columns=[c_name])
-
     return UtilityDataFrameModel(df=df)
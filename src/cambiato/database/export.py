@@ -0,0 +1,243 @@
+r"""Export tables of the database to Parquet or CSV files.
+
+The rows are streamed from the database in batches and each batch is written
+to the file before the next one is fetched. The memory usage is thus bounded by
+the batch size and independent of the size of the exported table.
+"""
+
+# Standard library
+import logging
+from collections.abc import Iterator, Sequence
+from datetime import date, datetime
+from enum import StrEnum
+from pathlib import Path
+from time import perf_counter
+from typing import NamedTuple
+
+# Third party
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+from sqlalchemy import Column, Table, select
+
+# Local
+from cambiato import exceptions
+from cambiato.database.core import Session
+from cambiato.database.models import Checklist, Facility, Order
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 50_000
+
+_PYTHON_TYPE_TO_ARROW_TYPE: dict[type, pa.DataType] = {
+    bool: pa.bool_(),
+    int: pa.int64(),
+    float: pa.float64(),
+    str: pa.string(),
+    date: pa.date32(),
+    datetime: pa.timestamp('us'),
+}
+
+
+class ExportFormat(StrEnum):
+    r"""The available file formats to export to."""
+
+    PARQUET = 'parquet'
+    CSV = 'csv'
+
+
+class ExportTable(StrEnum):
+    r"""The tables that can be exported."""
+
+    ORDERS = 'orders'
+    FACILITIES = 'facilities'
+    CHECKLISTS = 'checklists'
+
+
+EXPORT_TABLES: dict[ExportTable, Table] = {
+    ExportTable.ORDERS: Order.__table__,  # type: ignore[dict-item]
+    ExportTable.FACILITIES: Facility.__table__,  # type: ignore[dict-item]
+    ExportTable.CHECKLISTS: Checklist.__table__,  # type: ignore[dict-item]
+}
+
+
+class ExportResult(NamedTuple):
+    r"""The result of exporting a table.
+
+    Parameters
+    ----------
+    path : pathlib.Path
+        The path to the exported file.
+
+    nr_rows : int
+        The number of exported rows.
+
+    nr_bytes : int
+        The size of the exported file in bytes.
+
+    duration : float
+        The duration of the export in seconds.
+    """
+
+    path: Path
+    nr_rows: int
+    nr_bytes: int
+    duration: float
+
+    @property
+    def rows_per_second(self) -> float:
+        r"""The row throughput of the export."""
+
+        return self.nr_rows / self.duration if self.duration > 0 else 0.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        r"""The byte throughput of the export."""
+
+        return self.nr_bytes / self.duration if self.duration > 0 else 0.0
+
+
+def _arrow_type(column: Column) -> pa.DataType:
+    r"""Get the Arrow data type of a column. Unknown types are exported as strings."""
+
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return pa.string()
+
+    return _PYTHON_TYPE_TO_ARROW_TYPE.get(python_type, pa.string())
+
+
+def create_arrow_schema(table: Table) -> pa.Schema:
+    r"""Create the Arrow schema of a table.
+
+    Parameters
+    ----------
+    table : sqlalchemy.Table
+        The table to create the schema from.
+
+    Returns
+    -------
+    pyarrow.Schema
+        The schema of `table`.
+    """
+
+    return pa.schema(
+        [pa.field(c.name, _arrow_type(c), nullable=bool(c.nullable)) for c in table.columns]
+    )
+
+
+def iter_record_batches(
+    session: Session, table: Table, schema: pa.Schema, batch_size: int = DEFAULT_BATCH_SIZE
+) -> Iterator[pa.RecordBatch]:
+    r"""Stream the rows of a table as Arrow record batches.
+
+    The rows are fetched from the database with a server side cursor, if
+    supported by the database driver, `batch_size` rows at a time.
+
+    Parameters
+    ----------
+    session : cambiato.db.Session
+        An active database session.
+
+    table : sqlalchemy.Table
+        The table to stream.
+
+    schema : pyarrow.Schema
+        The schema of the record batches. The fields should match the columns of `table`.
+
+    batch_size : int, default 50_000
+        The maximum number of rows of each record batch.
+
+    Yields
+    ------
+    pyarrow.RecordBatch
+        The next batch of rows of `table`.
+    """
+
+    query = select(table).execution_options(yield_per=batch_size)
+    result = session.execute(query)
+
+    for partition in result.partitions(batch_size):
+        columns: Sequence[tuple] = tuple(zip(*partition, strict=True))
+        yield pa.RecordBatch.from_arrays(
+            [pa.array(col, type=field.type) for col, field in zip(columns, schema, strict=True)],
+            schema=schema,
+        )
+
+
+def export_table(
+    session: Session,
+    table: ExportTable,
+    path: Path,
+    format: ExportFormat = ExportFormat.PARQUET,  # noqa: A002
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> ExportResult:
+    r"""Export a table of the database to a Parquet or CSV file.
+
+    Each batch of rows is written as a row group of the Parquet file or
+    as a chunk of the CSV file.
+
+    Parameters
+    ----------
+    session : cambiato.db.Session
+        An active database session.
+
+    table : cambiato.db.ExportTable
+        The table to export.
+
+    path : pathlib.Path
+        The path to the file to export to. An existing file is overwritten.
+
+    format : cambiato.db.ExportFormat, default ExportFormat.PARQUET
+        The file format to export to.
+
+    batch_size : int, default 50_000
+        The number of rows to fetch from the database and write to the file at a time.
+
+    Returns
+    -------
+    cambiato.db.ExportResult
+        The result of the export.
+
+    Raises
+    ------
+    cambiato.ExportError
+        If the table could not be exported.
+    """
+
+    db_table = EXPORT_TABLES[table]
+    schema = create_arrow_schema(db_table)
+    nr_rows = 0
+    start = perf_counter()
+
+    try:
+        if format == ExportFormat.PARQUET:
+            writer: pq.ParquetWriter | pa_csv.CSVWriter = pq.ParquetWriter(path, schema=schema)
+        else:
+            writer = pa_csv.CSVWriter(path, schema=schema)
+
+        with writer:
+            for batch in iter_record_batches(
+                session=session, table=db_table, schema=schema, batch_size=batch_size
+            ):
+                if isinstance(writer, pq.ParquetWriter):
+                    writer.write_batch(batch, row_group_size=batch_size)
+                else:
+                    writer.write_batch(batch)
+                nr_rows += batch.num_rows
+
+    except (exceptions.SQLAlchemyError, pa.ArrowException, OSError) as e:
+        raise exceptions.ExportError(
+            f'Error exporting table "{table}" to {format} file "{path}"!', e=e
+        ) from None
+
+    result = ExportResult(
+        path=path, nr_rows=nr_rows, nr_bytes=path.stat().st_size, duration=perf_counter() - start
+    )
+    logger.info(
+        f'Exported {result.nr_rows} rows of table "{table}" to "{path}" '
+        f'({result.nr_bytes} bytes) in {result.duration:.2f} s.'
+    )
+
+    return result
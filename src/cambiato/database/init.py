@@ -2,13 +2,12 @@ r"""Initialize a database with the default data."""
 
 # Standard library
 import logging
-
-# Third party
-import streamlit_passwordless as stp
+from time import perf_counter
 
 # Local
+from cambiato import exceptions
 from cambiato.database.core import Session, commit
-from cambiato.database.models import add_default_models_to_session
+from cambiato.database.models import insert_default_models
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +15,9 @@ logger = logging.getLogger(__name__)
 def init(session: Session) -> tuple[bool, str]:
     r"""Initialize a database with the default data models.
 
+    The default data is bulk inserted in a single transaction and rows that already
+    exist are skipped. It is thus safe to initialize an already initialized database.
+
     Parameters
     ----------
     session : sqlalchemy.orm.Session
@@ -24,26 +26,32 @@ def init(session: Session) -> tuple[bool, str]:
     Returns
     -------
     error : bool
-        True if a :exc:`streamlit_passwordless.DatabaseError` occurred and the database
-        could not be initialized correctly and False for no error.
+        True if an error occurred and the database could not be
+        initialized correctly and False for no error.
 
     error_msg : str
         An error message that is safe to display to the user. An empty
         string is returned if `error` is False.
     """
 
-    error = False
-    error_msg = ''
-
-    stp.db.create_default_roles(session=session, commit=False)
-    add_default_models_to_session(session=session)
+    error_msg = 'Error initializing database!'
+    start = perf_counter()
 
     try:
-        commit(session=session, error_msg='Error initializing database!')
-    except stp.DatabaseError as e:
-        error = True
-        error_msg = e.displayable_message
-        logger.warning(e.detailed_message)
+        timings = insert_default_models(session=session)
+    except exceptions.SQLAlchemyError as e:
+        logger.error(f'{error_msg}\n{e!s}')
         session.rollback()
+        return True, error_msg
+
+    result = commit(session=session, error_msg=error_msg)
+    total = perf_counter() - start
+
+    if not result.ok:
+        return True, result.short_msg
+
+    for table, duration in timings.items():
+        logger.debug(f'Inserted default rows into table "{table}" in {duration * 1000:.2f} ms.')
+    logger.info(f'Initialized database with the default data in {total * 1000:.2f} ms.')
 
-    return error, error_msg
+    return False, ''
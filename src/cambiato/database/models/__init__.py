@@ -14,6 +14,7 @@ from .core import (
     Manufacturer,
     ObjectType,
     Role,
+    Translation,
     TypeDescription,
     Unit,
     User,
@@ -21,7 +22,7 @@ from .core import (
     Utility,
     ValueColumnName,
 )
-from .default import add_default_models_to_session
+from .default import DEFAULT_MODELS, add_default_models_to_session, insert_default_models
 from .relations import (
     Checklist,
     ChecklistItem,
@@ -72,6 +73,7 @@ __all__ = [
     'Manufacturer',
     'ObjectType',
     'Role',
+    'Translation',
     'TypeDescription',
     'Unit',
     'User',
@@ -79,7 +81,9 @@ __all__ = [
     'Utility',
     'ValueColumnName',
     # default
+    'DEFAULT_MODELS',
     'add_default_models_to_session',
+    'insert_default_models',
     # relations
     'Checklist',
     'ChecklistItem',
@@ -275,6 +275,65 @@ class Utility(ModifiedAndCreatedColumnMixin, Base):
 Index(f'{Utility.__tablename__}_name_uix', Utility.name, unique=True)
 
 
+class Translation(ModifiedAndCreatedColumnMixin, Base):
+    r"""The translations of the names and descriptions of the rows of the reference tables.
+
+    The queries join the translations of a language onto the reference tables and fall back to
+    the untranslated name of a row without a translation, e.g. a user-defined order type.
+
+    Parameters
+    ----------
+    table_name : str
+        The name of the table of the translated row. Part of the primary key.
+
+    row_id : int
+        The primary key of the translated row. Part of the primary key.
+
+    language : str
+        The ISO 639 two letter abbreviation of the language of the translation.
+        Part of the primary key.
+
+    name : str
+        The translated name of the row.
+
+    description : str or None, default None
+        The translated description of the row.
+
+    updated_at : datetime or None
+        The timestamp at which the translation was last updated (UTC).
+
+    updated_by : str or None
+        The ID of the user that last updated the translation.
+
+    created_at : datetime
+        The timestamp at which the translation was created (UTC).
+        Defaults to current timestamp.
+
+    created_by : str or None
+        The ID of the user that created the translation.
+    """
+
+    columns__repr__: ClassVar[tuple[str, ...]] = (
+        'table_name',
+        'row_id',
+        'language',
+        'name',
+        'description',
+        'updated_at',
+        'updated_by',
+        'created_at',
+        'created_by',
+    )
+
+    __tablename__ = 'translation'
+
+    table_name: Mapped[str] = mapped_column(primary_key=True)
+    row_id: Mapped[int] = mapped_column(primary_key=True)
+    language: Mapped[str] = mapped_column(primary_key=True)
+    name: Mapped[str]
+    description: Mapped[str | None]
+
+
 class CoordinateSystem(ModifiedAndCreatedColumnMixin, Base):
     r"""The available coordinate systems.
 
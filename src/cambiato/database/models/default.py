@@ -1,12 +1,23 @@
 r"""The default data of the tables."""
 
+# Standard library
+from collections.abc import Sequence
+from time import perf_counter
+from typing import cast
+
+# Third party
+from sqlalchemy import Table, inspect
+
 # Local
-from cambiato.database.core import Session
+from cambiato.database.core import Row, Session, insert_or_ignore
 from cambiato.database.models.core import (
+    Base,
     CoordinateSystem,
     CustomRole,
     DType,
     KeyType,
+    Role,
+    Translation,
     Unit,
     Utility,
     ValueColumnName,
@@ -24,6 +35,7 @@ from cambiato.database.models.relations import (
     OrderType,
     PhoneType,
 )
+from cambiato.translations import load_database_translations
 
 # DType
 text_dtype = DType(dtype_id=1, name='TEXT')
@@ -305,6 +317,12 @@ completed_order_status = OrderStatus(
 )
 
 # Role
+viewer_role = Role.create_viewer()
+user_role = Role.create_user()
+superuser_role = Role.create_superuser()
+admin_role = Role.create_admin()
+
+# CustomRole
 technician = CustomRole(
     role_id=1,
     name='Technician',
@@ -318,10 +336,161 @@ coordinator = CustomRole(
     description='A coordinator manages orders and assigns them to technicians.',
 )
 
+# Translation
+_translated_tables: dict[str, str] = {
+    'order_status': OrderStatus.__tablename__,
+    'order_type': OrderType.__tablename__,
+    'role': CustomRole.__tablename__,
+    'utility': Utility.__tablename__,
+}
+translations = tuple(
+    Translation(
+        table_name=table_name,
+        row_id=row_id,
+        language=language,
+        name=translation.name,
+        description=translation.description,
+    )
+    for language, db_translation in sorted(load_database_translations().items())
+    for field, table_name in _translated_tables.items()
+    for row_id, translation in getattr(db_translation, field).items()
+)
+
+
+# The default models in the order in which they should be inserted.
+DEFAULT_MODELS: tuple[Base, ...] = (
+    # Role
+    viewer_role,
+    user_role,
+    superuser_role,
+    admin_role,
+    # DType
+    text_dtype,
+    float_dtype,
+    int_dtype,
+    bool_dtype,
+    timestamp_dtype,
+    # Unit
+    kWh_unit,
+    kVArh_unit,
+    MWh_unit,
+    m3_unit,
+    degrees_celsius_unit,
+    # ValueColumnName
+    text_column_name,
+    float_column_name,
+    int_column_name,
+    bool_column_name,
+    timestamp_column_name,
+    # Utility
+    el_utility,
+    dh_utility,
+    dc_utility,
+    water_utility,
+    gas_utility,
+    # CoordinateSystem
+    wgs84_coord_system,
+    sweref991200_coord_system,
+    # KeyType
+    analog_key_type,
+    tag_key_type,
+    card_key_type,
+    # LocationType
+    customer_loc_type,
+    house_loc_type,
+    apartment_loc_type,
+    multi_residential_loc_type,
+    receiver_loc_type,
+    grid_station_loc_type,
+    cable_cabinet_loc_type,
+    # CustomerType
+    private_person_customer_type,
+    company_customer_type,
+    small_business_customer_type,
+    school_customer_type,
+    # ContactMethod
+    sms_contact_method,
+    email_contact_method,
+    call_contact_method,
+    note_in_mailbox_contact_method,
+    # PhoneType
+    private_phone_type,
+    work_phone_type,
+    # DeviceType
+    electricity_meter_device_type,
+    # DeviceState
+    enabled_device_state,
+    disabled_device_state,
+    revision_device_state,
+    scrapped_device_state,
+    # DeviceLocationType
+    facade_meter_box_device_loc_type,
+    basement_loc_type,
+    meter_room_loc_type,
+    # FacilityAccessMethod
+    free_access_fa_method,
+    booked_access_fa_method,
+    # MountType
+    thread_mount_type,
+    flange_mount_type,
+    # OrderType
+    device_change_order_type,
+    enable_device_order_type,
+    disable_device_order_type,
+    comm_point_change_order_type,
+    manual_reading_order_type,
+    device_alarm_order_type,
+    # OrderStatus
+    to_do_order_status,
+    assigned_order_status,
+    in_progress_order_status,
+    on_hold_order_status,
+    completed_by_technician_order_status,
+    completed_order_status,
+    # CustomRole
+    technician,
+    coordinator,
+    # Translation
+    *translations,
+)
+
+
+def _model_to_row(model: Base) -> Row:
+    r"""Convert an ORM model into a row of the column values that are set on the model."""
+
+    state = inspect(model)
+    return {
+        attr.key: state.dict[attr.key]
+        for attr in state.mapper.column_attrs
+        if attr.key in state.dict
+    }
+
+
+def _group_rows_by_table(models: Sequence[Base]) -> dict[tuple[Table, frozenset[str]], list[Row]]:
+    r"""Group the rows of `models` by table and the columns that are set.
+
+    Rows with the same table and columns can be inserted with a single executemany
+    statement. The insertion order of `models` is preserved to respect foreign keys.
+    """
+
+    rows: dict[tuple[Table, frozenset[str]], list[Row]] = {}
+    for model in models:
+        row = _model_to_row(model)
+        rows.setdefault((cast(Table, model.__table__), frozenset(row)), []).append(row)
+
+    return rows
+
+
+# Snapshot of the rows taken before the models can be attached to and expired by a session.
+_default_rows = _group_rows_by_table(DEFAULT_MODELS)
+
 
 def add_default_models_to_session(session: Session) -> None:
     r"""Create the default models in the database.
 
+    Adds each model to the session and fails on commit if any of them already exist.
+    Prefer :func:`insert_default_models`, which is idempotent.
+
     Parameters
     ----------
     session : cambiato.db.Session
@@ -332,93 +501,31 @@ def add_default_models_to_session(session: Session) -> None:
     None
     """
 
-    session.add_all(
-        (
-            # DType
-            text_dtype,
-            float_dtype,
-            int_dtype,
-            bool_dtype,
-            timestamp_dtype,
-            # Unit
-            kWh_unit,
-            kVArh_unit,
-            MWh_unit,
-            m3_unit,
-            degrees_celsius_unit,
-            # ValueColumnName
-            text_column_name,
-            float_column_name,
-            int_column_name,
-            bool_column_name,
-            timestamp_column_name,
-            # Utility
-            el_utility,
-            dh_utility,
-            dc_utility,
-            water_utility,
-            gas_utility,
-            # CoordinateSystem
-            wgs84_coord_system,
-            sweref991200_coord_system,
-            # KeyType
-            analog_key_type,
-            tag_key_type,
-            card_key_type,
-            # LocationType
-            customer_loc_type,
-            house_loc_type,
-            apartment_loc_type,
-            multi_residential_loc_type,
-            receiver_loc_type,
-            grid_station_loc_type,
-            cable_cabinet_loc_type,
-            # CustomerType
-            private_person_customer_type,
-            company_customer_type,
-            small_business_customer_type,
-            school_customer_type,
-            # ContactMethod
-            sms_contact_method,
-            email_contact_method,
-            call_contact_method,
-            note_in_mailbox_contact_method,
-            # PhoneType
-            private_phone_type,
-            work_phone_type,
-            # DeviceType
-            electricity_meter_device_type,
-            # DeviceState
-            enabled_device_state,
-            disabled_device_state,
-            revision_device_state,
-            scrapped_device_state,
-            # DeviceLocationType
-            facade_meter_box_device_loc_type,
-            basement_loc_type,
-            meter_room_loc_type,
-            # FacilityAccessMethod
-            free_access_fa_method,
-            booked_access_fa_method,
-            # MountType
-            thread_mount_type,
-            flange_mount_type,
-            # OrderType
-            device_change_order_type,
-            enable_device_order_type,
-            disable_device_order_type,
-            comm_point_change_order_type,
-            manual_reading_order_type,
-            device_alarm_order_type,
-            # OrderStatus
-            to_do_order_status,
-            assigned_order_status,
-            in_progress_order_status,
-            on_hold_order_status,
-            completed_by_technician_order_status,
-            completed_order_status,
-            # Role
-            technician,
-            coordinator,
-        )
-    )
+    session.add_all(DEFAULT_MODELS)
+
+
+def insert_default_models(session: Session) -> dict[str, float]:
+    r"""Bulk insert the default models into the database and skip the existing ones.
+
+    The default rows are inserted with one insert-or-ignore statement per table,
+    which makes it safe to run on an already initialized database. The
+    transaction is not committed.
+
+    Parameters
+    ----------
+    session : cambiato.db.Session
+        An active database session.
+
+    Returns
+    -------
+    timings : dict[str, float]
+        The time [s] spent inserting the default rows of each table.
+    """
+
+    timings: dict[str, float] = {}
+    for (table, _), rows in _default_rows.items():
+        start = perf_counter()
+        insert_or_ignore(session=session, table=table, rows=rows)
+        timings[table.name] = timings.get(table.name, 0.0) + perf_counter() - start
+
+    return timings
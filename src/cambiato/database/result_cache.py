@@ -0,0 +1,632 @@
+r"""Cache the results of the functions that load data from the database.
+
+The results are cached by :class:`ResultCache`, which is independent of the web app and can
+be used by any application, e.g. the CLI or a batch job. A result is keyed by the namespace of
+the cached function and its keyword arguments and is tagged with the versions of the tables
+that the function reads, which are tracked by :class:`TableVersions`. When an invalidation event
+bumps the version of a table, the results that depend on the table are reloaded on next use.
+
+The results are cached in an in-memory least recently used cache, the :class:`CacheRegistry`,
+and optionally in an on-disk :class:`ArrowIPCCache`, whose memory-mapped files are shared between
+the processes using the same cache directory. The table versions of an on-disk cache are stored
+in the cache directory, which makes an invalidation in one process visible to all processes.
+
+The cache can be warmed up in a background thread by :class:`CacheWarmUp`, which calls the cached
+functions before they are first used and reports when the cache is ready.
+"""
+
+# Standard library
+import atexit
+import hashlib
+import logging
+import os
+import threading
+import time
+import uuid
+from collections.abc import Callable, Collection, Iterable, Iterator
+from contextlib import contextmanager
+from functools import wraps
+from pathlib import Path
+from typing import Any, NamedTuple, Protocol, TypeVar, cast
+
+# Local
+from cambiato import exceptions
+from cambiato.database.cache import (
+    ALL_SCOPE,
+    INITIAL_VERSION,
+    ArrowIPCCache,
+    CacheRegistry,
+    InvalidationEvent,
+    add_invalidation_listener,
+    create_cache_key,
+    create_scopes,
+    remove_invalidation_listener,
+)
+from cambiato.database.core import Session, SessionFactory
+from cambiato.models.core import BaseDataFrameModel
+
+logger = logging.getLogger(__name__)
+
+
+class SupportsMemoryUsage(Protocol):
+    r"""A result of a cached function that reports its memory usage in bytes."""
+
+    def memory_usage(self) -> int: ...
+
+
+ResultT = TypeVar('ResultT', bound=SupportsMemoryUsage)
+
+# The maximum length of the representation of an argument in the description of an entry.
+_MAX_ARG_REPR_LENGTH = 60
+
+
+def _describe(kwargs: dict[str, Any]) -> str:
+    r"""Describe the keyword arguments of a cached function call for the cache registry."""
+
+    args = []
+    for name, value in kwargs.items():
+        value_repr = repr(value)
+        if len(value_repr) > _MAX_ARG_REPR_LENGTH:
+            value_repr = f'{value_repr[: _MAX_ARG_REPR_LENGTH - 3]}...'
+        args.append(f'{name}={value_repr}')
+
+    return ', '.join(args)
+
+
+class _KeyLocks:
+    r"""The locks of the keys of the results of a cached function.
+
+    A key is locked while its result is loaded or stored, such that a result is loaded once
+    while the results of other keys are loaded concurrently. The lock of a key is removed
+    when no thread holds or waits for it.
+    """
+
+    def __init__(self) -> None:
+        self._locks: dict[str, threading.Lock] = {}
+        self._waiters: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def hold(self, key: str) -> Iterator[None]:
+        r"""Hold the lock of `key` within the block."""
+
+        with self._lock:
+            lock = self._locks.setdefault(key, threading.Lock())
+            self._waiters[key] = self._waiters.get(key, 0) + 1
+
+        try:
+            with lock:
+                yield
+        finally:
+            with self._lock:
+                self._waiters[key] -= 1
+                if self._waiters[key] == 0:
+                    del self._waiters[key]
+                    del self._locks[key]
+
+
+class TableVersions:
+    r"""The version stamps of the tables of the database.
+
+    Each table has a version stamp and a version stamp per scope, e.g. per utility.
+    Bumping the version of a scope of a table also bumps the version of its scope
+    :data:`cambiato.db.ALL_SCOPE`. The stamps are thread-safe.
+
+    Parameters
+    ----------
+    directory : pathlib.Path or None, default None
+        The directory where the version stamps are stored as files shared between processes.
+        It is created if it does not exist. If None the stamps are kept in the memory of the
+        process.
+    """
+
+    def __init__(self, directory: Path | None = None) -> None:
+        self.directory = directory
+        self._versions: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+        if directory is not None:
+            directory.mkdir(parents=True, exist_ok=True)
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}(directory={self.directory!r})'
+
+    @staticmethod
+    def _name(table: str, scope: str | None) -> str:
+        r"""The name of the version stamp of a table or of a scope of a table."""
+
+        return table if scope is None else f'{table}@{scope}'
+
+    def _read(self, name: str) -> str:
+        r"""Read a version stamp."""
+
+        if self.directory is None:
+            return self._versions.get(name, INITIAL_VERSION)
+
+        try:
+            return (self.directory / f'{name}.table-version').read_text().strip() or INITIAL_VERSION
+        except FileNotFoundError:
+            return INITIAL_VERSION
+
+    def _write(self, name: str) -> None:
+        r"""Write a new version stamp."""
+
+        version = uuid.uuid4().hex
+
+        if self.directory is None:
+            with self._lock:
+                self._versions[name] = version
+            return
+
+        path = self.directory / f'{name}.table-version'
+        tmp_path = path.with_name(f'.{path.name}.{os.getpid()}.{uuid.uuid4().hex}.tmp')
+
+        try:
+            tmp_path.write_text(version)
+            os.replace(tmp_path, path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+
+    def get_version(self, tables: Iterable[str], scopes: Collection[str] = ()) -> str:
+        r"""Get the combined version stamp of tables.
+
+        Parameters
+        ----------
+        tables : Iterable[str]
+            The names of the tables.
+
+        scopes : Collection[str], default ()
+            The scopes of the tables to include in the version stamp.
+
+        Returns
+        -------
+        str
+            The version stamp as a hexadecimal hash digest of the version stamps of `tables`.
+        """
+
+        versions = [
+            self._read(self._name(table, scope))
+            for table in sorted(set(tables))
+            for scope in (None, *scopes)
+        ]
+
+        return hashlib.blake2b(' '.join(versions).encode(), digest_size=8).hexdigest()
+
+    def bump(self, tables: Iterable[str], scopes: Collection[str] | None = None) -> None:
+        r"""Bump the version stamps of tables.
+
+        Parameters
+        ----------
+        tables : Iterable[str]
+            The names of the tables.
+
+        scopes : Collection[str] or None, default None
+            The scopes of the tables to bump along with :data:`cambiato.db.ALL_SCOPE`.
+            If None the version stamps of the tables are bumped, which changes the
+            version of all scopes.
+        """
+
+        for table in tables:
+            if scopes is None:
+                self._write(self._name(table, None))
+            else:
+                for scope in {*scopes, ALL_SCOPE}:
+                    self._write(self._name(table, scope))
+
+
+class ResultCache:
+    r"""A cache of the results of the functions that load data from the database.
+
+    Parameters
+    ----------
+    registry : cambiato.db.CacheRegistry or None, default None
+        The in-memory least recently used cache of the results. If None
+        a registry without a byte budget and time to live is created.
+
+    shared_cache : cambiato.db.ArrowIPCCache or None, default None
+        The on-disk cache of the DataFrames of the results shared between processes.
+        If None the results are only cached in memory.
+
+    versions : cambiato.db.TableVersions or None, default None
+        The version stamps of the tables. If None the stamps are stored in the directory
+        of `shared_cache` or in memory if `shared_cache` is None.
+
+    subscribe : bool, default True
+        True if the cache should subscribe to the invalidation events
+        emitted by :func:`cambiato.db.emit_invalidation`.
+    """
+
+    def __init__(
+        self,
+        registry: CacheRegistry | None = None,
+        shared_cache: ArrowIPCCache | None = None,
+        versions: TableVersions | None = None,
+        subscribe: bool = True,
+    ) -> None:
+        self.registry = CacheRegistry() if registry is None else registry
+        self.shared_cache = shared_cache
+        if versions is None:
+            versions = TableVersions(None if shared_cache is None else shared_cache.directory)
+        self.versions = versions
+        self._tables: dict[str, frozenset[str]] = {}
+
+        if subscribe:
+            add_invalidation_listener(self.invalidate)
+
+    def __repr__(self) -> str:
+        return (
+            f'{type(self).__name__}(registry={self.registry!r}, '
+            f'shared_cache={self.shared_cache!r}, versions={self.versions!r})'
+        )
+
+    @property
+    def namespaces(self) -> dict[str, frozenset[str]]:
+        r"""The namespaces of the cached functions and the tables they read."""
+
+        return dict(self._tables)
+
+    def cached(
+        self,
+        func: Callable[..., ResultT],
+        namespace: str,
+        tables: Collection[str],
+        model: type[BaseDataFrameModel] | None = None,
+    ) -> Callable[..., ResultT]:
+        r"""Cache a function that loads a DataFrame model from the database.
+
+        The cached function should be called with keyword arguments only and the first
+        argument should be the database session `_session`. The results are scoped by the
+        utilities of the keyword argument `utility_ids` and tagged with the versions of
+        `tables`. Calling the method `clear` of the cached function bumps the versions
+        of `tables`. The method `put` of the cached function stores a result for its keyword
+        arguments under the current versions of `tables`, e.g. a result updated with the
+        changes saved to the database, which replaces the result loaded by `func`.
+
+        Concurrent calls with the same keyword arguments load the result once, while the
+        results of different keyword arguments are loaded concurrently.
+
+        Parameters
+        ----------
+        func : Callable[..., ResultT]
+            The function to cache. The results should be DataFrame models if `model` is
+            specified and otherwise support the method `memory_usage`.
+
+        namespace : str
+            The unique namespace of the cached results of `func`.
+
+        tables : Collection[str]
+            The names of the tables that `func` reads.
+
+        model : type[cambiato.models.BaseDataFrameModel] or None, default None
+            The DataFrame model returned by `func`. If specified and the cache has a
+            shared cache the DataFrames of the results are cached in the shared cache.
+
+        Returns
+        -------
+        Callable[..., ResultT]
+            The cached function.
+
+        Raises
+        ------
+        cambiato.CambiatoError
+            If a function is already cached in `namespace`.
+        """
+
+        if namespace in self._tables:
+            raise exceptions.CambiatoError(f'A function is already cached in "{namespace}"!')
+
+        self._tables[namespace] = frozenset(tables)
+        shared_cache = None if model is None else self.shared_cache
+        registry = self.registry
+        locks = _KeyLocks()
+
+        def store(key: str, version: str, load: Callable[[], ResultT]) -> ResultT:
+            if shared_cache is None or model is None:
+                return load()
+
+            df = shared_cache.get_or_store(
+                namespace=namespace,
+                key=key,
+                version=version,
+                func=lambda: cast(BaseDataFrameModel, load()).df,
+            )
+            return cast(ResultT, model(df=df))
+
+        def register(
+            key: str, version: str, scopes: tuple[str, ...], kwargs: dict[str, Any], result: ResultT
+        ) -> None:
+            registry.put(
+                namespace=namespace,
+                key=key,
+                value=result,
+                nbytes=result.memory_usage(),
+                version=version,
+                description=_describe(kwargs),
+                shared=shared_cache is not None,
+                scopes=scopes,
+            )
+
+        @wraps(func)
+        def wrapper(_session: Session, **kwargs: Any) -> ResultT:
+            key = create_cache_key(**kwargs)
+            scopes = create_scopes(kwargs.get('utility_ids'))
+            version = self.versions.get_version(tables, scopes=scopes)
+
+            if (result := registry.get(namespace=namespace, key=key, version=version)) is not None:
+                return cast(ResultT, result)
+
+            with locks.hold(key):
+                result = registry.get(
+                    namespace=namespace, key=key, version=version, record_stats=False
+                )
+                if result is None:
+                    start = time.perf_counter()
+                    result = store(
+                        key=key, version=version, load=lambda: func(_session=_session, **kwargs)
+                    )
+                    registry.record_load(namespace, seconds=time.perf_counter() - start)
+                    register(key=key, version=version, scopes=scopes, kwargs=kwargs, result=result)
+
+            return result
+
+        def put(value: ResultT, **kwargs: Any) -> ResultT:
+            key = create_cache_key(**kwargs)
+            scopes = create_scopes(kwargs.get('utility_ids'))
+            version = self.versions.get_version(tables, scopes=scopes)
+
+            with locks.hold(key):
+                result = store(key=key, version=version, load=lambda: value)
+                register(key=key, version=version, scopes=scopes, kwargs=kwargs, result=result)
+
+            return result
+
+        wrapper.clear = lambda: self.clear(namespace)  # type: ignore[attr-defined]
+        wrapper.put = put  # type: ignore[attr-defined]
+
+        return wrapper
+
+    def invalidate(self, event: InvalidationEvent) -> None:
+        r"""Invalidate the results that depend on the tables and utilities of an event.
+
+        Parameters
+        ----------
+        event : cambiato.db.InvalidationEvent
+            The event of the changed tables and utilities.
+        """
+
+        scopes = None if event.utility_ids is None else create_scopes(event.utility_ids)
+        self.versions.bump(event.tables, scopes=scopes)
+        logger.debug(f'Bumped the versions of tables {sorted(event.tables)} for scopes {scopes}.')
+
+        for namespace, tables in self._tables.items():
+            if event.affects(tables):
+                self.registry.invalidate(namespace, scopes=scopes)
+
+    def clear(self, namespace: str | None = None) -> None:
+        r"""Invalidate all results of a namespace by bumping the versions of its tables.
+
+        The results of the other namespaces that read any of the tables are also invalidated.
+
+        Parameters
+        ----------
+        namespace : str or None, default None
+            The namespace to invalidate. If None the results of all namespaces are invalidated.
+        """
+
+        namespaces = self._tables if namespace is None else (namespace,)
+        tables = {t for ns in namespaces for t in self._tables.get(ns, ())}
+        self.invalidate(InvalidationEvent(tables=frozenset(tables), utility_ids=None))
+
+    def close(self) -> None:
+        r"""Unsubscribe the cache from the invalidation events."""
+
+        remove_invalidation_listener(self.invalidate)
+
+
+class WarmUpCall(NamedTuple):
+    r"""A call of a cached function to warm up the cache.
+
+    Parameters
+    ----------
+    func : Callable[..., Any]
+        The cached function to call with a database session as the keyword argument `_session`.
+
+    kwargs : dict[str, Any]
+        The keyword arguments of the call.
+    """
+
+    func: Callable[..., Any]
+    kwargs: dict[str, Any]
+
+
+class WarmUpStatus(NamedTuple):
+    r"""The status of a cache warm-up.
+
+    Parameters
+    ----------
+    total : int
+        The total number of calls of the warm-up.
+
+    done : int
+        The number of completed calls including the failed calls.
+
+    failed : int
+        The number of calls that raised an exception.
+
+    ready : bool
+        True if the warm-up has completed and False otherwise.
+
+    duration : float
+        The duration of the warm-up in seconds so far.
+    """
+
+    total: int = 0
+    done: int = 0
+    failed: int = 0
+    ready: bool = False
+    duration: float = 0.0
+
+
+class CacheWarmUp:
+    r"""Warm up a cache by calling its cached functions in a background thread.
+
+    The calls are made in the order they are given, each in a session of its own. A call that
+    raises an exception is logged and counted as failed, and the warm-up continues with the next
+    call. The cache is ready when all calls have completed.
+
+    Parameters
+    ----------
+    session_factory : cambiato.db.SessionFactory
+        The factory of the database sessions of the calls.
+
+    ready_file : pathlib.Path or None, default None
+        The file to create when the warm-up has completed. The id of the process is appended
+        to its name, e.g. "ready.1234", such that several processes can share the same path
+        without overwriting the readiness of each other. The file of the process is removed
+        when the warm-up starts and when the process exits. If None no file is created.
+    """
+
+    def __init__(self, session_factory: SessionFactory, ready_file: Path | None = None) -> None:
+        self.session_factory = session_factory
+        self.ready_file = ready_file
+        self._status = WarmUpStatus()
+        self._ready = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}(ready_file={self.ready_file!r}, status={self.status!r})'
+
+    @property
+    def status(self) -> WarmUpStatus:
+        r"""The status of the warm-up."""
+
+        return self._status
+
+    @property
+    def is_ready(self) -> bool:
+        r"""True if the warm-up has completed and False otherwise."""
+
+        return self._ready.is_set()
+
+    @property
+    def ready_path(self) -> Path | None:
+        r"""The ready file of the current process or None if no ready file is configured."""
+
+        if self.ready_file is None:
+            return None
+
+        return self.ready_file.with_name(f'{self.ready_file.name}.{os.getpid()}')
+
+    def _remove_ready_file(self) -> None:
+        r"""Remove the ready file of the current process."""
+
+        if (ready_path := self.ready_path) is not None:
+            ready_path.unlink(missing_ok=True)
+
+    def start(self, calls: Callable[[Session], Iterable[WarmUpCall]]) -> bool:
+        r"""Start the warm-up in a background thread.
+
+        Parameters
+        ----------
+        calls : Callable[[cambiato.db.Session], Iterable[cambiato.db.WarmUpCall]]
+            A function that creates the calls of the warm-up from a database session,
+            e.g. one call per utility of the database.
+
+        Returns
+        -------
+        bool
+            True if the warm-up was started and False if it has already been started.
+        """
+
+        with self._lock:
+            if self._thread is not None:
+                return False
+
+            if self.ready_file is not None:
+                self._remove_ready_file()
+                atexit.register(self._remove_ready_file)
+
+            self._thread = threading.Thread(
+                target=self.run, kwargs={'calls': calls}, name='cambiato-cache-warm-up', daemon=True
+            )
+            self._thread.start()
+
+        return True
+
+    def wait(self, timeout: float | None = None) -> bool:
+        r"""Wait for the warm-up to complete.
+
+        Parameters
+        ----------
+        timeout : float or None, default None
+            The maximum number of seconds to wait. If None wait until the warm-up has completed.
+
+        Returns
+        -------
+        bool
+            True if the warm-up has completed and False if the wait timed out.
+        """
+
+        return self._ready.wait(timeout)
+
+    def run(self, calls: Callable[[Session], Iterable[WarmUpCall]]) -> WarmUpStatus:
+        r"""Run the warm-up in the current thread.
+
+        Parameters
+        ----------
+        calls : Callable[[cambiato.db.Session], Iterable[cambiato.db.WarmUpCall]]
+            A function that creates the calls of the warm-up from a database session.
+
+        Returns
+        -------
+        cambiato.db.WarmUpStatus
+            The status of the completed warm-up.
+        """
+
+        start = time.perf_counter()
+
+        try:
+            with self.session_factory() as session:
+                warm_up_calls = list(calls(session))
+        except Exception:
+            logger.exception('Could not create the calls of the cache warm-up!')
+            warm_up_calls = []
+
+        total = len(warm_up_calls)
+        failed = 0
+        self._status = WarmUpStatus(total=total)
+        logger.info(f'Warming up the cache with {total} calls.')
+
+        for done, (func, kwargs) in enumerate(warm_up_calls, start=1):
+            name = getattr(func, '__name__', repr(func))
+            try:
+                with self.session_factory() as session:
+                    func(_session=session, **kwargs)
+            except Exception:
+                failed += 1
+                logger.exception(f'Cache warm-up call {name}({_describe(kwargs)}) failed!')
+            else:
+                logger.debug(f'Warmed up {name}({_describe(kwargs)}) ({done}/{total}).')
+
+            self._status = WarmUpStatus(
+                total=total, done=done, failed=failed, duration=time.perf_counter() - start
+            )
+
+        status = self._status._replace(ready=True, duration=time.perf_counter() - start)
+        self._status = status
+
+        if (ready_path := self.ready_path) is not None:
+            try:
+                ready_path.parent.mkdir(parents=True, exist_ok=True)
+                ready_path.touch()
+            except OSError as e:
+                logger.warning(f'Could not create the ready file "{ready_path}"!\n{e!s}')
+
+        self._ready.set()
+        logger.info(
+            f'Cache warm-up completed with {status.done - status.failed}/{total} successful '
+            f'calls in {status.duration:.2f} s.'
+        )
+
+        return status
@@ -50,7 +50,7 @@ class CambiatoError(Exception):
 
         if e is not None:
             self.parent_exception: Exception | None = e
-            self.parent_exception_name: str | None = f'{e.__module__}.{e.__class__.__name__}'
+            self.parent_exception_name: str | None = f'{type(e).__module__}.{type(e).__name__}'
             self.parent_full_message: str | None = str(e)
         else:
             self.parent_exception = None
@@ -118,3 +118,7 @@ class MissingRowError(DataFrameError):
 
 class MultipleRowsForColumnValueError(DataFrameError):
     """If a value of a column maps to multiple rows."""
+
+
+class ExportError(CambiatoError):
+    """If a table of the database could not be exported."""
@@ -1,6 +1,16 @@
 r"""The data models of Cambiato."""
 
-from cambiato.models.core import BaseDataFrameModel, BaseModel, User
+from cambiato.models.backend import (
+    FRAME_BACKENDS,
+    DataFrameBackend,
+    FrameBackend,
+    PandasFrameBackend,
+    PolarsFrameBackend,
+    get_default_backend,
+    import_polars,
+    set_default_backend,
+)
+from cambiato.models.core import BaseDataFrameModel, BaseModel, IndexLookup, IndexMap, User
 from cambiato.models.dataframe import (
     ChecklistDataFrameModel,
     FacilityDataFrameModel,
@@ -13,9 +23,20 @@ from cambiato.models.dataframe import (
 
 # The Public API
 __all__ = [
+    # backend
+    'FRAME_BACKENDS',
+    'DataFrameBackend',
+    'FrameBackend',
+    'PandasFrameBackend',
+    'PolarsFrameBackend',
+    'get_default_backend',
+    'import_polars',
+    'set_default_backend',
     # core
     'BaseDataFrameModel',
     'BaseModel',
+    'IndexLookup',
+    'IndexMap',
     'User',
     # dataframe
     'ChecklistDataFrameModel',
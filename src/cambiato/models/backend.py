@@ -0,0 +1,312 @@
+r"""The backends that process the DataFrames of the DataFrame models.
+
+The DataFrame of a model is always a :class:`pandas.DataFrame`, which is what the web app
+and Streamlit work with. The backend of a model performs the column operations of the model
+that scale with the number of rows, i.e. finding the unique and duplicated values of a column,
+extracting unique and sorted columns and localizing datetime columns.
+
+The pandas backend uses pandas and pyarrow compute kernels. The polars backend converts the
+columns it operates on into :class:`polars.Series`, which are cached by the backend, and
+processes them with the multi-threaded polars engine. The results are converted back into
+pandas by taking the matching row positions of the pandas DataFrame, which guarantees that
+both backends return the same index and datatypes. Polars is an optional dependency that can
+be installed with ``pip install cambiato[polars]``.
+"""
+
+# Standard library
+import importlib
+from abc import ABC, abstractmethod
+from enum import StrEnum
+from types import ModuleType
+from typing import Any, ClassVar
+
+# Third party
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+# Local
+from cambiato import exceptions
+
+
+class DataFrameBackend(StrEnum):
+    r"""The available backends for processing the DataFrames of the DataFrame models.
+
+    - pandas : The DataFrames are processed by pandas and pyarrow compute kernels.
+
+    - polars : The DataFrames are processed by the multi-threaded polars engine.
+               Requires the optional dependency polars.
+    """
+
+    PANDAS = 'pandas'
+    POLARS = 'polars'
+
+
+def import_polars() -> ModuleType:
+    r"""Import the optional dependency polars.
+
+    Returns
+    -------
+    types.ModuleType
+        The polars module.
+
+    Raises
+    ------
+    cambiato.DataFrameError
+        If polars is not installed.
+    """
+
+    try:
+        return importlib.import_module('polars')
+    except ImportError:
+        raise exceptions.DataFrameError(
+            'The polars backend requires the package polars. '
+            'Install it with: pip install cambiato[polars]'
+        ) from None
+
+
+_default_backend = DataFrameBackend.PANDAS
+
+
+def get_default_backend() -> DataFrameBackend:
+    r"""Get the backend of the DataFrame models that do not specify a backend."""
+
+    return _default_backend
+
+
+def set_default_backend(backend: DataFrameBackend) -> None:
+    r"""Set the backend of the DataFrame models that do not specify a backend.
+
+    Parameters
+    ----------
+    backend : cambiato.models.DataFrameBackend
+        The backend to use by default.
+
+    Raises
+    ------
+    cambiato.DataFrameError
+        If the dependencies of `backend` are not installed.
+    """
+
+    global _default_backend  # noqa: PLW0603
+
+    if backend == DataFrameBackend.POLARS:
+        import_polars()
+
+    _default_backend = DataFrameBackend(backend)
+
+
+def _to_timestamp_array(s: pd.Series) -> pa.Array | pa.ChunkedArray:
+    r"""Convert a Series into an Arrow timestamp array.
+
+    Arrow backed timestamp columns are returned without copying. Strings in ISO 8601 format
+    are parsed by Arrow and other datatypes are parsed by :func:`pandas.to_datetime`.
+    """
+
+    arr = pa.array(s, from_pandas=True)
+    type_ = arr.type
+
+    if pa.types.is_timestamp(type_):
+        return arr
+    if pa.types.is_null(type_):
+        return arr.cast(pa.timestamp('ns'))
+    if pa.types.is_string(type_) or pa.types.is_large_string(type_):
+        for timestamp_type in (pa.timestamp('ns'), pa.timestamp('ns', tz='UTC')):
+            try:
+                return arr.cast(timestamp_type)
+            except pa.ArrowInvalid:  # The strings have a UTC offset or another format.
+                continue
+
+    return pa.array(pd.to_datetime(s), from_pandas=True)
+
+
+class FrameBackend(ABC):
+    r"""The base class of the backends that process the DataFrame of a DataFrame model.
+
+    A backend is bound to a DataFrame and may cache data derived from it. The
+    DataFrame should thus not be modified inplace while the backend is in use.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        The DataFrame to process.
+    """
+
+    name: ClassVar[DataFrameBackend]
+
+    def __init__(self, df: pd.DataFrame) -> None:
+        self.df = df
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}(shape={self.df.shape!r})'
+
+    @abstractmethod
+    def split_unique(self, column: str) -> tuple[pd.Series, pd.Series]:
+        r"""Split the non-missing values of a column into unique and duplicated values.
+
+        Parameters
+        ----------
+        column : str
+            The column to split. Must exist in the DataFrame.
+
+        Returns
+        -------
+        unique : pandas.Series
+            The values that occur in exactly one row.
+
+        duplicated : pandas.Series
+            The values that occur in multiple rows.
+        """
+
+    @abstractmethod
+    def get_column(self, column: str, unique: bool, sort_ascending: bool | None) -> pd.Series:
+        r"""Get the values of a column with duplicates optionally removed and sorted.
+
+        Duplicates are removed by keeping the first occurrence and missing values
+        are sorted last. See :meth:`cambiato.models.BaseDataFrameModel.get_column`.
+        """
+
+    def localize_and_convert_timezone(
+        self, column: str, location_tz: str, target_tz: str | None
+    ) -> pa.Array | pa.ChunkedArray:
+        r"""Localize a datetime column and optionally convert it to timezone `target_tz`.
+
+        Parameters
+        ----------
+        column : str
+            The column to process. Must exist in the DataFrame.
+
+        location_tz : str
+            The timezone to localize naive datetimes into.
+
+        target_tz : str or None
+            The timezone to convert the localized datetimes into.
+            If None, only localization is applied.
+
+        Returns
+        -------
+        pyarrow.Array or pyarrow.ChunkedArray
+            The tz-aware Arrow timestamps of the column.
+        """
+
+        arr = _to_timestamp_array(self.df[column])
+
+        if arr.type.tz is None:
+            if location_tz.upper() == 'UTC':  # Only changes the type, the values are UTC.
+                arr = arr.cast(pa.timestamp(arr.type.unit, tz='UTC'))
+            else:
+                arr = self._assume_timezone(arr, timezone=location_tz)
+        if target_tz is not None:  # Arrow stores UTC values and only the type changes.
+            arr = arr.cast(pa.timestamp(arr.type.unit, tz=target_tz))
+
+        return arr
+
+    @abstractmethod
+    def _assume_timezone(
+        self, arr: pa.Array | pa.ChunkedArray, timezone: str
+    ) -> pa.Array | pa.ChunkedArray:
+        r"""Localize naive Arrow timestamps into `timezone` by converting them to UTC."""
+
+
+class PandasFrameBackend(FrameBackend):
+    r"""Process the DataFrame with pandas and pyarrow compute kernels."""
+
+    name = DataFrameBackend.PANDAS
+
+    def split_unique(self, column: str) -> tuple[pd.Series, pd.Series]:
+        s = self.df[column]
+        s = s[s.notna()]
+        duplicated = s.duplicated(keep=False)
+
+        return s[~duplicated], s[duplicated]
+
+    def get_column(self, column: str, unique: bool, sort_ascending: bool | None) -> pd.Series:
+        s = self.df[column].drop_duplicates() if unique else self.df[column]
+
+        return s if sort_ascending is None else s.sort_values(ascending=sort_ascending)
+
+    def _assume_timezone(
+        self, arr: pa.Array | pa.ChunkedArray, timezone: str
+    ) -> pa.Array | pa.ChunkedArray:
+        return pc.assume_timezone(arr, timezone=timezone)
+
+
+class PolarsFrameBackend(FrameBackend):
+    r"""Process the DataFrame with the multi-threaded polars engine.
+
+    The columns are converted into polars Series on first use and cached by the backend.
+
+    Raises
+    ------
+    cambiato.DataFrameError
+        If polars is not installed.
+    """
+
+    name = DataFrameBackend.POLARS
+
+    def __init__(self, df: pd.DataFrame) -> None:
+        super().__init__(df)
+        self._pl = import_polars()
+        self._columns: dict[str, Any] = {}
+
+    def _series(self, column: str) -> Any:
+        r"""Get a column as a :class:`polars.Series`.
+
+        Categorical columns are converted into their codes with missing values as null
+        such that they are sorted in the order of their categories like in pandas.
+        """
+
+        series = self._columns.get(column)
+
+        if series is None:
+            s = self.df[column]
+            if isinstance(s.dtype, pd.CategoricalDtype):
+                codes = s.cat.codes.to_numpy()
+                arr = pa.array(codes, mask=codes == -1)
+            else:
+                arr = pa.array(s, from_pandas=True)
+            series = self._columns[column] = self._pl.Series(column, arr)
+
+        return series
+
+    def split_unique(self, column: str) -> tuple[pd.Series, pd.Series]:
+        series = self._series(column)
+        not_null = series.is_not_null()
+        duplicated = series.is_duplicated()
+
+        unique_pos = (not_null & ~duplicated).arg_true().to_numpy()
+        duplicated_pos = (not_null & duplicated).arg_true().to_numpy()
+        s = self.df[column]
+
+        return s.take(unique_pos), s.take(duplicated_pos)
+
+    def get_column(self, column: str, unique: bool, sort_ascending: bool | None) -> pd.Series:
+        s = self.df[column]
+
+        if not unique and sort_ascending is None:
+            return s
+
+        pl = self._pl
+        frame = pl.DataFrame({column: self._series(column)}).with_row_index('pos')
+        if unique:
+            frame = frame.unique(subset=column, keep='first', maintain_order=True)
+        if sort_ascending is not None:
+            frame = frame.sort(
+                column, descending=not sort_ascending, nulls_last=True, maintain_order=True
+            )
+
+        return s.take(frame.get_column('pos').to_numpy())
+
+    def _assume_timezone(
+        self, arr: pa.Array | pa.ChunkedArray, timezone: str
+    ) -> pa.Array | pa.ChunkedArray:
+        if arr.type.unit == 's':  # Polars does not support timestamps in seconds.
+            arr = arr.cast(pa.timestamp('ms'))
+
+        return self._pl.from_arrow(arr, rechunk=False).dt.replace_time_zone(timezone).to_arrow()
+
+
+FRAME_BACKENDS: dict[DataFrameBackend, type[FrameBackend]] = {
+    DataFrameBackend.PANDAS: PandasFrameBackend,
+    DataFrameBackend.POLARS: PolarsFrameBackend,
+}
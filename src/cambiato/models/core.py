@@ -2,17 +2,29 @@ r"""The core data models of Cambiato."""
 
 # Standard library
 from abc import abstractmethod
-from collections.abc import Callable, Mapping, Sequence
-from typing import Any, ClassVar, Generic, TypeAlias, TypeVar
+from collections.abc import Callable, Collection, Mapping, Sequence
+from typing import Any, ClassVar, Generic, NamedTuple, Self, TypeAlias, TypeVar, cast
 
 # Third party
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+from pandas.api.extensions import ExtensionArray
 from pydantic import BaseModel as PydanticBaseModel
-from pydantic import ConfigDict, Field, ValidationError
+from pydantic import ConfigDict, Field, PrivateAttr, ValidationError
 from streamlit_passwordless import User as User
 
 # Local
 from cambiato import exceptions
+from cambiato.core import ChangedDatabaseRows, Row
+from cambiato.models.backend import (
+    FRAME_BACKENDS,
+    DataFrameBackend,
+    FrameBackend,
+    PandasFrameBackend,
+    get_default_backend,
+)
 
 StrMapping: TypeAlias = Mapping[str, str]
 ColumnList: TypeAlias = list[str]
@@ -32,6 +44,183 @@ class BaseModel(PydanticBaseModel):
 
 IndexT = TypeVar('IndexT', int, str)
 
+ARROW_STRING = pd.ArrowDtype(pa.string())
+
+
+def join_str_columns(*columns: pd.Series | pd.Index, sep: str = '|', prefix: str = '') -> pd.Series:
+    r"""Join columns into a string column in one vectorised Arrow compute operation.
+
+    Parameters
+    ----------
+    *columns : pandas.Series or pandas.Index
+        The columns to join. The columns are cast to strings and missing values
+        are replaced by an empty string.
+
+    sep : str, default '|'
+        The separator between the values of the columns.
+
+    prefix : str, default ''
+        A prefix to add to the joined values.
+
+    Returns
+    -------
+    pandas.Series
+        The joined string column. The index is the index of the first column
+        or the first column itself if it is an index.
+    """
+
+    first = columns[0]
+    index = first if isinstance(first, pd.Index) else first.index
+    arrays = [pc.cast(pa.array(c, from_pandas=True), pa.string()) for c in columns]
+    joined = pc.binary_join_element_wise(*arrays, sep, null_handling='replace', null_replacement='')
+    if prefix:
+        joined = pc.binary_join_element_wise(prefix, joined, '')
+
+    return pd.Series(joined, index=index, dtype=ARROW_STRING)
+
+
+def _arrow_buffers_nbytes(arr: pa.ChunkedArray | pa.Array, seen: set[int]) -> int:
+    r"""The total size of the Arrow buffers of `arr`, which are not already in `seen`.
+
+    The buffers are identified by their address, which is added to `seen`. Buffers shared
+    by multiple arrays, e.g. slices of the same array, are thus only counted once.
+    """
+
+    nbytes = 0
+    chunks = arr.chunks if isinstance(arr, pa.ChunkedArray) else [arr]
+
+    for chunk in chunks:
+        for buffer in chunk.buffers():
+            if buffer is not None and buffer.address not in seen:
+                seen.add(buffer.address)
+                nbytes += buffer.size
+        if pa.types.is_dictionary(chunk.type):
+            nbytes += _arrow_buffers_nbytes(chunk.dictionary, seen)
+
+    return nbytes
+
+
+def _is_timestamp_dtype(dtype: Any) -> bool:
+    r"""Check if `dtype` is a numpy or Arrow timestamp datatype with or without a timezone."""
+
+    if isinstance(dtype, pd.ArrowDtype):
+        return bool(pa.types.is_timestamp(dtype.pyarrow_dtype))
+
+    return isinstance(dtype, pd.DatetimeTZDtype) or (
+        isinstance(dtype, np.dtype) and dtype.kind == 'M'
+    )
+
+
+def _values_differ(new: pd.Series, old: pd.Series) -> np.ndarray:
+    r"""Compare two aligned columns element-wise in one vectorised operation.
+
+    Missing values are equal to each other. Categorical columns with the same categories
+    are compared by their codes and other categorical columns by their values.
+
+    Returns
+    -------
+    numpy.ndarray
+        A boolean mask that is True where the values of `new` and `old` differ.
+    """
+
+    new_dtype, old_dtype = new.dtype, old.dtype
+
+    if (
+        isinstance(new_dtype, pd.CategoricalDtype)
+        and isinstance(old_dtype, pd.CategoricalDtype)
+        and new_dtype.categories.equals(old_dtype.categories)
+    ):
+        return cast(np.ndarray, new.cat.codes.to_numpy() != old.cat.codes.to_numpy())
+    if isinstance(new_dtype, pd.CategoricalDtype):
+        new = new.astype(new_dtype.categories.dtype)
+    if isinstance(old_dtype, pd.CategoricalDtype):
+        old = old.astype(old_dtype.categories.dtype)
+
+    equal = pd.array(new.array == old.array, dtype='boolean').fillna(False)
+    both_missing = new.isna().to_numpy() & old.isna().to_numpy()
+
+    return cast(np.ndarray, ~equal.to_numpy(dtype=bool) & ~both_missing)
+
+
+def _to_objects(s: pd.Series | pd.Index) -> list[Any]:
+    r"""Convert the values of `s` into Python objects with missing values as None."""
+
+    return cast(list[Any], s.astype(object).where(s.notna(), None).tolist())
+
+
+class IndexMap(NamedTuple):
+    r"""A hash map from the values of a column of a DataFrame to the index of their row.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        The DataFrame the map was built from.
+
+    values : dict[Any, Any]
+        The mapping of the values, which uniquely identify a row, to the index of the row.
+
+    duplicates : frozenset[Any]
+        The values that occur in multiple rows of the column.
+
+    keys : pandas.Index
+        The keys of `values` for vectorised lookups with :meth:`pandas.Index.get_indexer`.
+
+    ids : pandas.api.extensions.ExtensionArray
+        The nullable array of the index IDs of `keys`.
+    """
+
+    df: pd.DataFrame
+    values: dict[Any, Any]
+    duplicates: frozenset[Any]
+    keys: pd.Index
+    ids: ExtensionArray
+
+    @classmethod
+    def from_column(
+        cls, df: pd.DataFrame, column: str, backend: FrameBackend | None = None
+    ) -> 'IndexMap':
+        r"""Build the map of a column of a DataFrame. Missing values are excluded.
+
+        The unique and duplicated values are found by `backend`, which should be bound
+        to `df`. If None the pandas backend is used.
+        """
+
+        backend = PandasFrameBackend(df) if backend is None else backend
+        unique, duplicated = backend.split_unique(column)
+        ids = unique.index.tolist()
+
+        return cls(
+            df=df,
+            values=dict(zip(unique.tolist(), ids, strict=True)),
+            duplicates=frozenset(duplicated.tolist()),
+            keys=pd.Index(unique.array),
+            ids=pd.array(ids),
+        )
+
+
+class IndexLookup(NamedTuple):
+    r"""The result of looking up the index IDs of multiple values of a column.
+
+    The Series share the index of the looked up values.
+
+    Parameters
+    ----------
+    indices : pandas.Series
+        The index IDs of the rows matching the values. Values without a unique match and
+        missing values have a missing index ID.
+
+    missing : pandas.Series
+        A boolean mask of the values that do not match any row. Missing values are not
+        included in the mask.
+
+    ambiguous : pandas.Series
+        A boolean mask of the values that match multiple rows.
+    """
+
+    indices: pd.Series
+    missing: pd.Series
+    ambiguous: pd.Series
+
 
 class BaseDataFrameModel(BaseModel, Generic[IndexT]):
     """The base model that all DataFrame models will inherit from.
@@ -57,6 +246,11 @@ class BaseDataFrameModel(BaseModel, Generic[IndexT]):
     ----------
     df : pandas.DataFrame, default pandas.DataFrame()
         The contents of the model as a DataFrame.
+
+    backend : cambiato.models.DataFrameBackend, default cambiato.models.get_default_backend()
+        The backend that processes `df` in the column operations of the model, e.g.
+        :meth:`get_index_map`, :meth:`get_column` and :meth:`localize_and_convert_timezone`.
+        The results are always pandas objects.
     """
 
     dtypes: ClassVar[StrMapping] = {}
@@ -64,12 +258,16 @@ class BaseDataFrameModel(BaseModel, Generic[IndexT]):
     parse_dates: ClassVar[ColumnList] = []
 
     df: pd.DataFrame = Field(default_factory=pd.DataFrame)
+    backend: DataFrameBackend = Field(default_factory=get_default_backend)
+    _frame_backend: FrameBackend | None = PrivateAttr(default=None)
+    _index_maps: dict[str, IndexMap] = PrivateAttr(default_factory=dict)
+    _labels: tuple[pd.DataFrame, dict[Any, str]] | None = PrivateAttr(default=None)
 
     @property
     def shape(self) -> tuple[int, int]:
         r"""The shape (rows, cols) of the DataFrame."""
 
-        return self.df.shape
+        return cast(tuple[int, int], self.df.shape)
 
     @property
     def index(self) -> pd.Index:
@@ -81,7 +279,7 @@ class BaseDataFrameModel(BaseModel, Generic[IndexT]):
     def row_count(self) -> int:
         r"""The number of rows of the DataFrame."""
 
-        return self.df.shape[0]
+        return int(self.df.shape[0])
 
     @property
     def empty(self) -> bool:
@@ -95,15 +293,95 @@ class BaseDataFrameModel(BaseModel, Generic[IndexT]):
 
         return self.df.dtypes
 
+    def memory_usage(self) -> int:
+        r"""The deep memory usage of the DataFrame `df` including its index in bytes.
+
+        Arrow backed columns are measured by the total size of the Arrow buffers they
+        reference, where buffers shared between columns are counted once. A column that
+        is a slice of a larger Arrow array thus reports the size of the full array, which
+        it keeps alive. Other columns are measured by :meth:`pandas.Series.memory_usage`
+        including the memory of Python objects.
+
+        Returns
+        -------
+        int
+            The memory usage in bytes.
+        """
+
+        df = self.df
+        seen: set[int] = set()
+        nbytes = int(df.index.memory_usage(deep=True))
+
+        for _, s in df.items():
+            arr = s.array
+            if isinstance(arr, pd.arrays.ArrowExtensionArray):
+                nbytes += _arrow_buffers_nbytes(arr.__arrow_array__(), seen)
+            else:
+                nbytes += int(s.memory_usage(deep=True, index=False))
+
+        return nbytes
+
+    @property
+    def frame_backend(self) -> FrameBackend:
+        r"""The backend bound to the DataFrame `df`.
+
+        The backend is created on first access and cached on the model until the DataFrame
+        `df` is replaced. If `df` is modified inplace the cached backend should be cleared
+        with :meth:`clear_lookups`.
+        """
+
+        df = self.df
+        frame_backend = self._frame_backend
+
+        if frame_backend is None or frame_backend.df is not df:
+            frame_backend = self._frame_backend = FRAME_BACKENDS[self.backend](df)
+
+        return frame_backend
+
     @property
     @abstractmethod
     def index_type(self) -> Callable[[Any], IndexT]:
         """The constructor for the index type, which should be int or str."""
 
-    def display_row(self, id_: int | str) -> str:
-        r"""String representation of a row in the DataFrame.
+    def create_labels(self) -> pd.Series:
+        r"""Create the labels of the rows of the DataFrame in one vectorised operation.
 
         Each subclass should override this method to fit its DataFrame content.
+        The default label of a row is its index ID.
+
+        Returns
+        -------
+        pandas.Series
+            The labels of the rows with the same index as the DataFrame.
+        """
+
+        return pd.Series(self.df.index.astype(str), index=self.df.index, dtype=ARROW_STRING)
+
+    @property
+    def labels(self) -> dict[Any, str]:
+        r"""The mapping of the index IDs of the DataFrame to the labels of their rows.
+
+        The labels are created by :meth:`create_labels` on first access and cached on
+        the model until the DataFrame `df` is replaced. If `df` is modified inplace the
+        cached labels should be cleared with :meth:`clear_lookups`.
+        """
+
+        df = self.df
+        labels = self._labels
+
+        if labels is None or labels[0] is not df:
+            s = pd.Series() if self.empty else self.create_labels()
+            labels = self._labels = (
+                df,
+                dict(
+                    zip(s.index.to_numpy().tolist(), s.to_numpy(dtype=object).tolist(), strict=True)
+                ),
+            )
+
+        return labels[1]
+
+    def display_row(self, id_: int | str) -> str:
+        r"""String representation of a row in the DataFrame.
 
         Parameters
         ----------
@@ -114,23 +392,42 @@ class BaseDataFrameModel(BaseModel, Generic[IndexT]):
         -------
         str
             The string representation of the row.
+
+        Raises
+        ------
+        cambiato.MissingRowError
+            If `id_` does not exist in the DataFrame.
         """
 
-        return str(id_)
+        try:
+            return self.labels[id_]
+        except KeyError:
+            raise exceptions.MissingRowError(
+                f'Row with index ID {id_!r} does not exist in the DataFrame!'
+            ) from None
 
     @property
     def format_func(self) -> Callable[[int | str], str]:
         r"""A function to format a row of the DataFrame as a string.
 
-        The function takes an index ID of the DataFrame and displays its row as a string.
+        The function takes an index ID of the DataFrame and looks up the label of its row.
         """
 
-        return lambda x: self.display_row(x)
+        labels = self.labels
+
+        def format_func(id_: int | str) -> str:
+            try:
+                return labels[id_]
+            except KeyError:
+                return self.display_row(id_)
+
+        return format_func
 
     def get_index(self, value: Any, column: str) -> IndexT | None:
         r"""Get the index of a row from a value of a column.
 
-        Should only be used for columns with values that uniquely identifies a row.
+        Should only be used for columns with values that uniquely identifies a row. The lookup
+        uses the cached hash map of `column`, see :meth:`get_index_map`.
 
         Parameters
         ----------
@@ -154,7 +451,86 @@ class BaseDataFrameModel(BaseModel, Generic[IndexT]):
             If multiple rows match the supplied column value.
         """
 
+        index_map = self.get_index_map(column)
+
+        if value in index_map.duplicates:
+            raise exceptions.MultipleRowsForColumnValueError(
+                f'Multiple rows match column "{column}" == {value!r}!'
+            )
+
+        idx = index_map.values.get(value)
+
+        return None if idx is None else self.index_type(idx)
+
+    def get_indices(self, values: Sequence[Any] | pd.Series, column: str) -> IndexLookup:
+        r"""Get the indices of multiple rows from values of a column in one vectorised lookup.
+
+        Should only be used for columns with values that uniquely identifies a row. The
+        lookup uses the cached hash map of `column`, see :meth:`get_index_map`.
+
+        Parameters
+        ----------
+        values : Sequence[Any] or pandas.Series
+            The values of `column` for which to get the row index IDs.
+
+        column : str
+            The column to filter by `values`.
+
+        Returns
+        -------
+        cambiato.models.IndexLookup
+            The index IDs of the rows matching `values` and the masks of the values that
+            do not match any row or match multiple rows. If `values` is a Series the
+            result shares its index.
+
+        Raises
+        ------
+        cambiato.MissingColumnError
+            If `column` is not among the columns of the DataFrame.
+        """
+
+        index_map = self.get_index_map(column)
+        s = values if isinstance(values, pd.Series) else pd.Series(values, dtype=object)
+        target = pd.Index(s.array)
+
+        indexer = index_map.keys.get_indexer(target)
+        not_found = indexer == -1
+        ambiguous = target.isin(list(index_map.duplicates))
+
+        return IndexLookup(
+            indices=pd.Series(index_map.ids.take(indexer, allow_fill=True), index=s.index),
+            missing=pd.Series(not_found & ~ambiguous & s.notna().to_numpy(), index=s.index),
+            ambiguous=pd.Series(not_found & ambiguous, index=s.index),
+        )
+
+    def get_index_map(self, column: str) -> IndexMap:
+        r"""Get the hash map from the values of a column to the index of their row.
+
+        The map is built on first access and cached on the model until the DataFrame `df`
+        is replaced, e.g. by :meth:`model_copy`. If `df` is modified inplace the cached maps
+        should be cleared with :meth:`clear_lookups`.
+
+        Parameters
+        ----------
+        column : str
+            The column to map to the index.
+
+        Returns
+        -------
+        cambiato.models.IndexMap
+            The map of `column`.
+
+        Raises
+        ------
+        cambiato.MissingColumnError
+            If `column` is not among the columns of the DataFrame.
+        """
+
         df = self.df
+        index_map = self._index_maps.get(column)
+
+        if index_map is not None and index_map.df is df:
+            return index_map
 
         if column not in df.columns:
             raise exceptions.MissingColumnError(
@@ -162,19 +538,60 @@ class BaseDataFrameModel(BaseModel, Generic[IndexT]):
                 f'of the DataFrame : {df.columns.tolist()}'
             )
 
-        mask = df[column].eq(value)
+        index_map = self._index_maps[column] = IndexMap.from_column(
+            df=df, column=column, backend=self.frame_backend
+        )
 
-        if not mask.any():
-            return None
+        return index_map
 
-        pos = int(mask.to_numpy().argmax())
+    def update_rows(self, rows: Self, drop: Collection[Any] = ()) -> Self:
+        r"""Get a copy of the model with rows replaced by the rows of another model.
 
-        if mask.iloc[pos + 1 :].any():
-            raise exceptions.MultipleRowsForColumnValueError(
-                f'Multiple rows match column "{column}" == {value!r}!'
-            )
+        The rows keep their position in the DataFrame. Rows of `rows` that are not among the rows
+        of the model are ignored. The categories of the categorical columns are extended with the
+        new values of `rows`. Useful to apply the changes of a few rows saved to the database to
+        a cached model without loading all of its rows again.
+
+        Parameters
+        ----------
+        rows : Self
+            The rows to replace. The model should have the same columns as the model.
+
+        drop : Collection[Any], default ()
+            The index IDs of the rows to remove from the model.
+
+        Returns
+        -------
+        Self
+            A new model with the updated rows and the same backend as the model.
+        """
+
+        df = self.df
+        if drop:
+            df = df[~df.index.isin(list(drop))]
+
+        df = df.copy()
+        new_rows = rows.df[rows.df.index.isin(df.index)]
+
+        for column in new_rows.columns:
+            values = new_rows[column]
+            if isinstance(df[column].dtype, pd.CategoricalDtype):
+                categories = df[column].cat.categories
+                if isinstance(values.dtype, pd.CategoricalDtype):
+                    values = values.astype(object)
+                new_categories = pd.Index(values.dropna().unique()).difference(categories)
+                if not new_categories.empty:
+                    df[column] = df[column].cat.add_categories(new_categories)
+            df.loc[new_rows.index, column] = values
 
-        return self.index_type(df.index[pos])
+        return type(self)(df=df, backend=self.backend)
+
+    def clear_lookups(self) -> None:
+        r"""Clear the cached index maps, labels and backend after modifying `df` inplace."""
+
+        self._index_maps.clear()
+        self._labels = None
+        self._frame_backend = None
 
     def get_index_by_row_nr(self, row_nr: int) -> IndexT:
         r"""Get the index of a row from its row number in the DataFrame.
@@ -239,9 +656,9 @@ class BaseDataFrameModel(BaseModel, Generic[IndexT]):
                 f'of the DataFrame : {df.columns.tolist()}'
             )
 
-        s = df[column].drop_duplicates() if unique else df[column]
-
-        return s if sort_ascending is None else s.sort_values(ascending=sort_ascending)
+        return self.frame_backend.get_column(
+            column=column, unique=unique, sort_ascending=sort_ascending
+        )
 
     def localize_and_convert_timezone(
         self,
@@ -253,6 +670,11 @@ class BaseDataFrameModel(BaseModel, Generic[IndexT]):
     ) -> pd.DataFrame:
         r"""Localize datetime columns and optionally convert them to timezone `target_tz`.
 
+        The columns are processed by the backend of the model and the localized columns are
+        tz-aware Arrow timestamp columns. Converting the timezone of an Arrow timestamp column
+        only changes its type since the values are stored in UTC. Arrow backed columns are
+        thus not copied when localized into UTC or converted to `target_tz`.
+
         Parameters
         ----------
         df : pandas.DataFrame or None, default None
@@ -270,6 +692,7 @@ class BaseDataFrameModel(BaseModel, Generic[IndexT]):
             A sequence of columns that may need to be converted to the datetime datatype.
             If a datetime column has all missing values it may be of datatype string and
             thus needs conversion to datetime before localization/timezone conversion.
+            String columns in ISO 8601 format, e.g. from SQLite, are parsed by Arrow.
 
         copy : bool, default False
             True if the operation should be performed on a copy of the underlying DataFrame.
@@ -283,28 +706,107 @@ class BaseDataFrameModel(BaseModel, Generic[IndexT]):
 
         df = (self.df.copy() if copy else self.df) if df is None else (df.copy() if copy else df)
 
-        datetime_cols = set(df.select_dtypes(include=['datetime64[ns]']).columns)
-
+        datetime_cols = [col for col, dtype in df.dtypes.items() if _is_timestamp_dtype(dtype)]
         if ensure_datetime_cols:
-            cols_to_process = datetime_cols.union(set(ensure_datetime_cols))
-        else:
-            cols_to_process = datetime_cols
+            datetime_cols.extend(c for c in ensure_datetime_cols if c not in datetime_cols)
 
-        for col in cols_to_process:
-            if col in datetime_cols:
-                s = df[col]
-            else:
-                s = pd.to_datetime(df[col]).astype('timestamp[ns][pyarrow]')
+        frame_backend = FRAME_BACKENDS[self.backend](df)
 
-            if s.dt.tz is None:
-                s = s.dt.tz_localize(location_tz)
-            if target_tz is not None:
-                s = s.dt.tz_convert(target_tz)
+        for col in datetime_cols:
+            arr = frame_backend.localize_and_convert_timezone(
+                column=col, location_tz=location_tz, target_tz=target_tz
+            )
+            df[col] = pd.arrays.ArrowExtensionArray(arr)
 
-            df[col] = s
+        if df is self.df:
+            self.clear_lookups()
 
         return df
 
+    def diff(
+        self, previous: 'BaseDataFrameModel', columns: Sequence[str] | None = None
+    ) -> ChangedDatabaseRows:
+        r"""Compute the rows that have changed compared to a previous snapshot of the model.
+
+        The rows of the snapshots are aligned by their index. Rows that only exist in the
+        model are inserted and rows that only exist in `previous` are deleted. The rows that
+        exist in both snapshots are compared column by column in vectorised operations, where
+        missing values are considered equal. Only the changed rows and values are converted
+        into Python objects, which makes the diff suitable for delta refreshes, audits and
+        pushing updates to clients.
+
+        Parameters
+        ----------
+        previous : cambiato.models.BaseDataFrameModel
+            The previous snapshot to compare the model with.
+
+        columns : Sequence[str] or None, default None
+            The columns to compare. If None all columns of the model are compared.
+
+        Returns
+        -------
+        cambiato.db.ChangedDatabaseRows
+            The changed rows. Each edited row contains the index column and the new values
+            of the changed columns. The added rows contain the index column and all `columns`
+            and the deleted rows are the index values of the deleted rows. Missing values
+            are None and the rows are in the order of the DataFrames.
+
+        Raises
+        ------
+        cambiato.MissingColumnError
+            If a column of `columns` is missing from any of the snapshots.
+
+        cambiato.DataFrameError
+            If the index of any of the snapshots is not a single unique index column.
+        """
+
+        df, previous_df = self.df, previous.df
+        columns = df.columns.tolist() if columns is None else list(columns)
+
+        for name, _df in (('model', df), ('previous snapshot', previous_df)):
+            if missing_cols := [c for c in columns if c not in _df.columns]:
+                raise exceptions.MissingColumnError(
+                    f'Columns {missing_cols} are not among the columns of the DataFrame '
+                    f'of the {name} : {_df.columns.tolist()}'
+                )
+            if isinstance(_df.index, pd.MultiIndex) or not _df.index.is_unique:
+                raise exceptions.DataFrameError(
+                    f'The DataFrame of the {name} must have a single unique index column '
+                    'to compute the diff!'
+                )
+
+        index, previous_index = df.index, previous_df.index
+        index_name = 'index' if index.name is None else index.name
+
+        previous_pos = previous_index.get_indexer(index)
+        is_added = previous_pos == -1
+        common_pos = np.flatnonzero(~is_added)
+        previous_pos = previous_pos[common_pos]
+        common_ids = _to_objects(index.take(common_pos))
+
+        edited_rows: dict[int, Row] = {}
+        for col in columns:
+            new = df[col].take(common_pos)
+            changed_pos = np.flatnonzero(_values_differ(new, previous_df[col].take(previous_pos)))
+            if changed_pos.size == 0:
+                continue
+
+            values = _to_objects(new.take(changed_pos))
+            for pos, value in zip(changed_pos.tolist(), values, strict=True):
+                if (row := edited_rows.get(pos)) is None:
+                    row = edited_rows[pos] = {index_name: common_ids[pos]}
+                row[col] = value
+
+        added = df.loc[is_added, columns].reset_index(names=index_name)
+        added_rows = added.astype(object).where(added.notna(), None).to_dict('records')
+        deleted_rows = _to_objects(previous_index[~previous_index.isin(index)])
+
+        return ChangedDatabaseRows(
+            edited_rows=[edited_rows[pos] for pos in sorted(edited_rows)],
+            added_rows=added_rows,
+            deleted_rows=deleted_rows,
+        )
+
 
 class IntIndexedDataFrameModel(BaseDataFrameModel[int]):
     """A DataFrame model with an integer based index column."""
@@ -3,6 +3,9 @@ r"""The DataFrame models, which represent table like structures of objects."""
 # Standard library
 from typing import ClassVar
 
+# Third party
+import pandas as pd
+
 # Local
 from cambiato import exceptions
 from cambiato.models.core import (
@@ -10,6 +13,7 @@ from cambiato.models.core import (
     IntIndexedDataFrameModel,
     StrIndexedDataFrameModel,
     StrMapping,
+    join_str_columns,
 )
 
 
@@ -22,8 +26,8 @@ class ChecklistDataFrameModel(IntIndexedDataFrameModel):
     dtypes: ClassVar[StrMapping] = {c_checklist_id: 'uint32[pyarrow]', c_name: 'string[pyarrow]'}
     index_cols: ClassVar[ColumnList] = [c_checklist_id]
 
-    def display_row(self, id_: int | str) -> str:
-        return self.df.loc[id_, self.c_name]  # type: ignore[return-value]
+    def create_labels(self) -> pd.Series:
+        return join_str_columns(self.df[self.c_name])
 
 
 class FacilityDataFrameModel(IntIndexedDataFrameModel):
@@ -40,16 +44,15 @@ class FacilityDataFrameModel(IntIndexedDataFrameModel):
     }
     index_cols: ClassVar[ColumnList] = [c_facility_id]
 
-    def display_row(self, id_: int | str) -> str:
-        row = self.df.loc[id_, [self.c_ean, self.c_address]]  # type: ignore[list-item, index]
-
-        return f'{row[self.c_ean]} | {row[self.c_address]}'
+    def create_labels(self) -> pd.Series:
+        return join_str_columns(self.df[self.c_ean], self.df[self.c_address], sep=' | ')
 
 
 class OrderDataFrameModel(IntIndexedDataFrameModel):
     r"""A model of the orders represented as a DataFrame."""
 
     c_order_id: ClassVar[str] = 'order_id'
+    c_utility_id: ClassVar[str] = 'utility_id'
     c_order_type_id: ClassVar[str] = 'order_type_id'
     c_order_type_name: ClassVar[str] = 'order_type_name'
     c_order_status_id: ClassVar[str] = 'order_status_id'
@@ -68,6 +71,15 @@ class OrderDataFrameModel(IntIndexedDataFrameModel):
     c_updated_by: ClassVar[str] = 'updated_by'
     c_updated_at: ClassVar[str] = 'updated_at'
 
+    dtypes: ClassVar[StrMapping] = {
+        c_utility_id: 'uint32[pyarrow]',
+        # The columns with few distinct values are categorical to store each value once.
+        c_order_type_name: 'category',
+        c_order_status_name: 'category',
+        c_assigned_to_displayname: 'category',
+        c_created_by: 'category',
+        c_updated_by: 'category',
+    }
     index_cols: ClassVar[ColumnList] = [c_order_id]
     parse_dates: ClassVar[ColumnList] = [
         c_scheduled_start_at,
@@ -76,25 +88,24 @@ class OrderDataFrameModel(IntIndexedDataFrameModel):
         c_created_by,
     ]
 
+    def create_labels(self) -> pd.Series:
+        df = self.df
+
+        return join_str_columns(
+            df.index,
+            df[self.c_facility_ean],
+            df[self.c_address],
+            df[self.c_order_type_name],
+            df[self.c_order_status_name],
+            prefix='ID:',
+        )
+
     def display_row(self, id_: int | str) -> str:
         try:
-            s = self.df.loc[
-                id_,  # type: ignore[index]
-                [
-                    self.c_order_type_name,  # type: ignore[list-item]
-                    self.c_facility_ean,  # type: ignore[list-item]
-                    self.c_order_status_name,  # type: ignore[list-item]
-                    self.c_address,  # type: ignore[list-item]
-                ],
-            ]
+            return self.labels[id_]
         except KeyError:
             raise exceptions.MissingRowError(f'Order with order_id={id_} does not exist!') from None
 
-        return (
-            f'ID:{id_}|{s[self.c_facility_ean]}|{s[self.c_address]}|'
-            f'{s[self.c_order_type_name]}|{s[self.c_order_status_name]}'
-        )
-
 
 class OrderStatusDataFrameModel(IntIndexedDataFrameModel):
     r"""A model of the order statuses represented as a DataFrame."""
@@ -105,8 +116,8 @@ class OrderStatusDataFrameModel(IntIndexedDataFrameModel):
     dtypes: ClassVar[StrMapping] = {c_order_status_id: 'uint32[pyarrow]', c_name: 'string[pyarrow]'}
     index_cols: ClassVar[ColumnList] = [c_order_status_id]
 
-    def display_row(self, id_: int | str) -> str:
-        return self.df.loc[id_, self.c_name]  # type: ignore[return-value]
+    def create_labels(self) -> pd.Series:
+        return join_str_columns(self.df[self.c_name])
 
 
 class OrderTypeDataFrameModel(IntIndexedDataFrameModel):
@@ -118,8 +129,8 @@ class OrderTypeDataFrameModel(IntIndexedDataFrameModel):
     dtypes: ClassVar[StrMapping] = {c_order_type_id: 'uint32[pyarrow]', c_name: 'string[pyarrow]'}
     index_cols: ClassVar[ColumnList] = [c_order_type_id]
 
-    def display_row(self, id_: int | str) -> str:
-        return self.df.loc[id_, self.c_name]  # type: ignore[return-value]
+    def create_labels(self) -> pd.Series:
+        return join_str_columns(self.df[self.c_name])
 
 
 class UserDataFrameModel(StrIndexedDataFrameModel):
@@ -131,8 +142,8 @@ class UserDataFrameModel(StrIndexedDataFrameModel):
     dtypes: ClassVar[StrMapping] = {c_user_id: 'string[pyarrow]', c_displayname: 'string[pyarrow]'}
     index_cols: ClassVar[ColumnList] = [c_user_id]
 
-    def display_row(self, id_: int | str) -> str:
-        return self.df.loc[id_, self.c_displayname]  # type: ignore[return-value]
+    def create_labels(self) -> pd.Series:
+        return join_str_columns(self.df[self.c_displayname])
 
 
 class UtilityDataFrameModel(IntIndexedDataFrameModel):
@@ -144,5 +155,5 @@ class UtilityDataFrameModel(IntIndexedDataFrameModel):
     dtypes: ClassVar[StrMapping] = {c_utility_id: 'uint32[pyarrow]', c_name: 'string[pyarrow]'}
     index_cols: ClassVar[ColumnList] = [c_utility_id]
 
-    def display_row(self, id_: int | str) -> str:
-        return self.df.loc[id_, self.c_name]  # type: ignore[return-value]
+    def create_labels(self) -> pd.Series:
+        return join_str_columns(self.df[self.c_name])
@@ -16,7 +16,10 @@ from cambiato.translations.controllers import Controllers, OrderController
 from cambiato.translations.core import (
     TranslationMapping,
     TranslationModel,
+    TranslationRegistry,
+    Translator,
     create_translation_mapping,
+    load_database_translations,
     load_translation,
     translate_dataframe,
 )
@@ -29,7 +32,10 @@ __all__ = [
     # core
     'TranslationMapping',
     'TranslationModel',
+    'TranslationRegistry',
+    'Translator',
     'create_translation_mapping',
+    'load_database_translations',
     'load_translation',
     'translate_dataframe',
     # components
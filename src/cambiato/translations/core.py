@@ -1,12 +1,16 @@
 r"""Core functionality to work with translations."""
 
 # Standard library
-from collections.abc import Mapping, Sequence
+import threading
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from importlib.resources import files
-from typing import Any, Protocol, TypeAlias, TypeVar, overload
+from typing import Any, Protocol, TypeAlias, TypeVar, cast, overload
 
 # Third party
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 
 # Local
 from cambiato import exceptions
@@ -87,6 +91,81 @@ def load_translation(language: Language) -> PageTranslationModels:
     return PageTranslationModels(order_page=order_page)
 
 
+class TranslationRegistry(Mapping[Language, PageTranslationModels]):
+    r"""A registry of the translations of the app that loads each language when first used.
+
+    The translation file of a language is parsed and validated by :func:`load_translation`
+    the first time the language is looked up and the models are kept for the lifetime of
+    the registry. Startup thus only pays for the languages that are used. The registry is
+    thread-safe and a language is only loaded once.
+
+    Parameters
+    ----------
+    languages : Iterable[cambiato.config.Language]
+        The languages that can be loaded from the registry.
+    """
+
+    def __init__(self, languages: Iterable[Language]) -> None:
+        self._languages = tuple(dict.fromkeys(languages))
+        self._translations: dict[Language, PageTranslationModels] = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return (
+            f'{type(self).__name__}(languages={self._languages!r}, '
+            f'loaded={tuple(self._translations)!r})'
+        )
+
+    def __getitem__(self, language: Language) -> PageTranslationModels:
+        if (translation := self._translations.get(language)) is not None:
+            return translation
+
+        if language not in self._languages:
+            raise KeyError(language)
+
+        with self._lock:
+            if (translation := self._translations.get(language)) is None:
+                translation = self._translations[language] = load_translation(language)
+
+        return translation
+
+    def __contains__(self, language: object) -> bool:
+        return language in self._languages
+
+    def __iter__(self) -> Iterator[Language]:
+        return iter(self._languages)
+
+    def __len__(self) -> int:
+        return len(self._languages)
+
+    @property
+    def loaded_languages(self) -> tuple[Language, ...]:
+        r"""The languages that have been loaded."""
+
+        return tuple(self._translations)
+
+
+def load_database_translations() -> dict[Language, Database]:
+    r"""Load the translations of the default data in the database for all languages.
+
+    The translations are loaded from the translation files shipped with Cambiato and are used
+    to seed the translation table of the database.
+
+    Returns
+    -------
+    dict[cambiato.config.Language, cambiato.translations.Database]
+        The translations of the default data in the database of each available language.
+    """
+
+    translations = {}
+    for lang_file in files('cambiato.translations.translations').iterdir():
+        if lang_file.name.endswith('.json'):
+            tm = TranslationModel.model_validate_json(lang_file.read_text())
+            translations[Language(lang_file.name.removesuffix('.json'))] = tm.database
+
+    return translations
+
+
 def create_translation_mapping(translation: Mapping[int, T]) -> TranslationMapping:
     r"""Create a translation mapping to use for translating a DataFrame.
 
@@ -105,6 +184,193 @@ def create_translation_mapping(translation: Mapping[int, T]) -> TranslationMappi
     return {key: value.model_dump() for key, value in translation.items()}
 
 
+def _translate_categorical(
+    s: pd.Series, translation: pa.Array, positions: np.ndarray
+) -> pd.Series | None:
+    r"""Translate the categories of a categorical column instead of each of its rows.
+
+    Parameters
+    ----------
+    s : pandas.Series
+        The categorical column to translate.
+
+    translation : pyarrow.Array
+        The translations of the column in the order of the translation IDs.
+
+    positions : numpy.ndarray
+        The positions in `translation` of the IDs of the rows of `s`.
+        Rows without a translation have position -1.
+
+    Returns
+    -------
+    pandas.Series or None
+        The translated column. None is returned if a category has multiple IDs with
+        different translations and thus cannot be translated as a category.
+    """
+
+    # The distinct pairs of category codes and translation positions in one hash pass.
+    n = len(translation) + 1
+    pairs = pd.unique((s.cat.codes.to_numpy().astype(np.int64) + 1) * n + positions + 1)
+    codes, pair_positions = pairs // n - 1, pairs % n - 1
+    is_valid = (codes != -1) & (pair_positions != -1)
+
+    pairs = pd.DataFrame(
+        {
+            'code': codes[is_valid],
+            'translation': translation.take(pair_positions[is_valid]).to_numpy(
+                zero_copy_only=False
+            ),
+        }
+    )
+    pairs = pairs.dropna(subset='translation').drop_duplicates()
+
+    if pairs['code'].duplicated().any():
+        return None
+
+    categories = s.cat.categories
+    new_categories = categories.to_series(index=range(len(categories)))
+    new_categories.loc[pairs['code'].to_numpy()] = pairs['translation'].to_numpy()
+    new_categories = pd.Index(new_categories, dtype=categories.dtype)
+
+    if new_categories.is_unique:
+        return s.cat.rename_categories(new_categories)
+
+    # Multiple categories have the same translation.
+    dtype = pd.CategoricalDtype(pd.Index(new_categories.unique(), dtype=categories.dtype))
+
+    return s.map(dict(zip(categories, new_categories, strict=True))).astype(dtype)
+
+
+def _translate_values(s: pd.Series, translation: pa.Array, positions: np.ndarray) -> pd.Series:
+    r"""Translate the rows of a column in one vectorised operation.
+
+    Parameters
+    ----------
+    s : pandas.Series
+        The column to translate.
+
+    translation : pyarrow.Array
+        The translations of the column in the order of the translation IDs.
+
+    positions : numpy.ndarray
+        The positions in `translation` of the IDs of the rows of `s`.
+        Rows without a translation have position -1.
+
+    Returns
+    -------
+    pandas.Series
+        The translated column. Rows without a translation or with a missing
+        translation keep their value.
+    """
+
+    translated = translation.take(pa.array(positions, mask=positions == -1))
+    arr = s.array
+
+    if isinstance(arr, pd.arrays.ArrowExtensionArray | pd.arrays.ArrowStringArray):
+        values = arr.__arrow_array__()
+        result = pc.coalesce(translated.cast(values.type), values)
+        return pd.Series(type(arr)(result), index=s.index, name=s.name)
+
+    found = translated.is_valid().to_numpy(zero_copy_only=False)
+
+    return s.mask(found, translated.to_numpy(zero_copy_only=False)) if found.any() else s
+
+
+class Translator:
+    r"""A precompiled translation of the columns of DataFrames.
+
+    The translation mapping is compiled once into one array of translations per column.
+    Translating a DataFrame looks up the positions of the IDs of its rows in one vectorised
+    hash lookup, which are shared by all columns. Each column is then translated by taking
+    the translations at these positions, without reindexing the DataFrame. Categorical
+    columns are translated by renaming their categories rather than updating each row.
+
+    Parameters
+    ----------
+    translation : cambiato.translations.TranslationMapping
+        The translations of the columns. The keys are the IDs of the rows to translate.
+
+    columns : Sequence[str] or str or None, default None
+        The columns to translate, which replace the column names of `translation` in
+        the order they are defined. If None the column names of `translation` are used.
+
+    id_column : str or None, default None
+        The column with the IDs of the rows to translate.
+        If None the index of the translated DataFrame is used.
+    """
+
+    def __init__(
+        self,
+        translation: TranslationMapping,
+        columns: TranslationColumns = None,
+        id_column: TranslationIdColumn = None,
+    ) -> None:
+        df_trans = pd.DataFrame.from_dict(translation, orient='index')
+        _columns = [columns] if isinstance(columns, str) else columns
+
+        if _columns is not None:  # Rename the columns to translate
+            df_trans = df_trans.iloc[:, 0 : len(_columns)]
+            df_trans.columns = _columns
+
+        self.id_column = id_column
+        self.ids = df_trans.index
+        self.translations = {
+            col: pa.array(df_trans[col], from_pandas=True) for col in df_trans.columns
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f'{type(self).__name__}(columns={list(self.translations)!r}, '
+            f'id_column={self.id_column!r}, nr_ids={self.ids.size})'
+        )
+
+    def translate(self, df: pd.DataFrame, copy: bool = False) -> pd.DataFrame:
+        r"""Translate the columns of a DataFrame.
+
+        Columns of the translator that are not in `df` are skipped.
+
+        Parameters
+        ----------
+        df : pandas.DataFrame
+            The DataFrame to translate.
+
+        copy : bool, default False
+            True if a copy of the translated DataFrame should be returned.
+            If False the DataFrame `df` is modified inplace.
+
+        Returns
+        -------
+        df : pandas.DataFrame
+            `df` with its columns translated.
+        """
+
+        df = df.copy() if copy else df
+        id_col = self.id_column
+        ids = df.index if id_col is None or df.index.name == id_col else pd.Index(df[id_col])
+        positions = None
+
+        for col, translation in self.translations.items():
+            if col not in df.columns:
+                continue
+
+            if positions is None:
+                positions = self.ids.get_indexer(ids)
+
+            s = df[col]
+            if isinstance(s.dtype, pd.CategoricalDtype):
+                translated = _translate_categorical(
+                    s=s, translation=translation, positions=positions
+                )
+                if translated is not None:
+                    df[col] = translated
+                    continue
+                s = s.astype(s.cat.categories.dtype)
+
+            df[col] = _translate_values(s=s, translation=translation, positions=positions)
+
+        return df
+
+
 @overload
 def translate_dataframe(
     df: pd.DataFrame,
@@ -134,6 +400,10 @@ def translate_dataframe(
 ) -> pd.DataFrame:
     r"""Translate selected columns of a :class:`pandas.DataFrame`.
 
+    Each translation is compiled into a :class:`Translator`, which translates the columns
+    without reindexing `df`. Use a :class:`Translator` directly to compile a translation once
+    and apply it to multiple DataFrames.
+
     Parameters
     ----------
     df : pandas.DataFrame
@@ -166,7 +436,8 @@ def translate_dataframe(
     Returns
     -------
     df : pandas.DataFrame
-        An updated version of `df` with selected columns translated.
+        An updated version of `df` with selected columns translated. Categorical columns
+        are translated by renaming their categories rather than updating each row.
 
     Raises
     ------
@@ -178,16 +449,16 @@ def translate_dataframe(
 
     if isinstance(translation, Mapping):
         trans_iter: Sequence[TranslationMapping] = [translation]
-        cols_iter = [columns]
-        id_col_iter = [id_column]
+        cols_iter: list[TranslationColumns] = [cast(TranslationColumns, columns)]
+        id_col_iter: list[TranslationIdColumn] = [cast(TranslationIdColumn, id_column)]
     else:
         trans_iter = translation
-        cols_iter = columns  # type: ignore[assignment]
-        id_col_iter = id_column  # type: ignore[assignment]
+        cols_iter = [] if columns is None else list(columns)
+        id_col_iter = [] if id_column is None else list(id_column)
 
     len_trans_iter = len(trans_iter)
-    len_cols_iter = 0 if cols_iter is None else len(cols_iter)
-    len_id_col_iter = 0 if id_col_iter is None else len(id_col_iter)
+    len_cols_iter = len(cols_iter)
+    len_id_col_iter = len(id_col_iter)
 
     if len_trans_iter != len_cols_iter != len_id_col_iter:
         raise exceptions.CambiatoError(
@@ -195,21 +466,7 @@ def translate_dataframe(
             f'({len_trans_iter} != {len_cols_iter} != {len_id_col_iter}) !'
         )
 
-    original_index_col = df.index.name
-    original_col_order = df.columns.tolist()
-
     for trans, cols, id_col in zip(trans_iter, cols_iter, id_col_iter, strict=True):
-        _cols = [cols] if isinstance(cols, str) else cols
-
-        df_trans = pd.DataFrame.from_dict(trans, orient='index')  # type: ignore[call-overload]
-
-        if _cols is not None:  # Rename the columns to translate
-            df_trans = df_trans.iloc[:, 0 : len(_cols)]
-            df_trans.columns = _cols
-
-        if id_col is not None and df.index.name != id_col:
-            df = df.reset_index().set_index(id_col)
-
-        df.update(df_trans)
+        Translator(translation=trans, columns=cols, id_column=id_col).translate(df)
 
-    return df.reset_index().set_index(original_index_col).loc[:, original_col_order]
+    return df
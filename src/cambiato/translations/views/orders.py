@@ -11,6 +11,14 @@ class EditOrdersView(BaseModel):
     schedule_entire_day_toggle_label: str
     schedule_entire_day_toggle_help: str
     update_orders_success_message: str
+    order_status_filter_label: str
+    order_type_filter_label: str
+    technician_filter_label: str
+    scheduled_filter_label: str
+    scheduled_filter_help: str
+    previous_page_button_label: str
+    next_page_button_label: str
+    page_caption: str
 
 
 class Orders(BaseModel):
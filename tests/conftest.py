@@ -3,6 +3,7 @@ r"""Fixtures for testing Cambiato."""
 # Standard library
 import io
 from copy import deepcopy
+from datetime import timedelta
 from pathlib import Path
 from typing import Any
 from zoneinfo import ZoneInfo
@@ -17,10 +18,12 @@ from cambiato.config import (
     BITWARDEN_PASSWORDLESS_API_URL,
     LOGGING_DEFAULT_DATETIME_FORMAT,
     LOGGING_DEFAULT_FORMAT,
+    CacheBackend,
     Language,
     LogLevel,
     Stream,
 )
+from cambiato.models import DataFrameBackend
 from tests.config import STATIC_FILES_CONFIG_BASE_DIR
 
 
@@ -54,9 +57,14 @@ def config_data(tmp_path: Path) -> tuple[str, dict[str, Any]]:
     db_path = tmp_path / 'Cambiato.db'
     db_url_str = f'sqlite:///{db_path!s}'
     web_log_file_path = tmp_path / 'Cambiato.log'
-
-    config_data_str = config_data_str.replace(':db_url', db_url_str).replace(
-        ':web_log_file_path', str(web_log_file_path)
+    profiling_log_file_path = tmp_path / 'Cambiato-profiling.log'
+    cache_dir = tmp_path / 'cache'
+
+    config_data_str = (
+        config_data_str.replace(':db_url', db_url_str)
+        .replace(':web_log_file_path', str(web_log_file_path))
+        .replace(':cache_dir', str(cache_dir))
+        .replace(':profiling_log_file_path', str(profiling_log_file_path))
     )
 
     database_config = {
@@ -111,6 +119,31 @@ def config_data(tmp_path: Path) -> tuple[str, dict[str, Any]]:
         'email': None,
     }
 
+    cache_config = {
+        'backend': CacheBackend.ARROW,
+        'directory': cache_dir,
+        'ttl': timedelta(minutes=30),
+        'max_memory': 512 * 1024**2,
+        'warm_up': False,
+        'ready_file': cache_dir / 'ready',
+    }
+
+    profiling_config = {
+        'enabled': True,
+        'file': {
+            'unique': False,
+            'path': profiling_log_file_path,
+            'max_bytes': 5_000_000,
+            'backup_count': 4,
+            'mode': 'a',
+            'encoding': 'UTF-8',
+            'disabled': False,
+            'min_log_level': LogLevel.INFO,
+            'format': LOGGING_DEFAULT_FORMAT,
+            'datetime_format': LOGGING_DEFAULT_DATETIME_FORMAT,
+        },
+    }
+
     config_exp = {
         'timezone': ZoneInfo('Europe/Stockholm'),
         'languages': (Language.EN,),
@@ -118,6 +151,9 @@ def config_data(tmp_path: Path) -> tuple[str, dict[str, Any]]:
         'database': database_config,
         'bwp': bwp_config,
         'logging': logging_config,
+        'cache': cache_config,
+        'dataframe': {'backend': DataFrameBackend.PANDAS},
+        'profiling': profiling_config,
     }
 
     return config_data_str, config_exp
@@ -0,0 +1 @@
+r"""Unit tests for the app sub-package."""
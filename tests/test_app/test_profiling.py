@@ -0,0 +1,282 @@
+r"""Unit tests for the module `app.profiling`."""
+
+# Standard library
+import json
+import logging
+from collections.abc import Iterator
+from datetime import UTC, datetime
+
+# Third party
+import pytest
+
+# Local
+from cambiato.app.profiling import (
+    PROFILING_LOGGER_NAME,
+    RenderProfile,
+    RenderProfiler,
+    StageTiming,
+    enable_profiling,
+    is_profiling_enabled,
+    profiled,
+    stage,
+)
+
+# =============================================================================================
+# Fixtures
+# =============================================================================================
+
+
+@pytest.fixture
+def profiling_enabled() -> Iterator[None]:
+    r"""Enable the profiling of the reruns during a test."""
+
+    enable_profiling(True)
+    yield
+    enable_profiling(False)
+
+
+# =============================================================================================
+# Tests
+# =============================================================================================
+
+
+@pytest.mark.usefixtures('profiling_enabled')
+class TestStage:
+    r"""Tests for the context manager `stage`."""
+
+    def test_nested_stages(self) -> None:
+        r"""Test that nested stages are recorded in start order with their depth."""
+
+        # Setup - None
+        # ===========================================================
+
+        # Exercise
+        # ===========================================================
+        with RenderProfiler(name='page') as profiler:
+            with stage('load'):
+                with stage('query'):
+                    pass
+                with stage('convert'):
+                    pass
+            with stage('render'):
+                pass
+
+        # Verify
+        # ===========================================================
+        profile = profiler.profile
+        assert profile is not None
+        assert profile.name == 'page'
+        assert [(s.name, s.depth) for s in profile.stages] == [
+            ('load', 0),
+            ('query', 1),
+            ('convert', 1),
+            ('render', 0),
+        ]
+        load, query, convert, _ = profile.stages
+        assert load.seconds >= query.seconds + convert.seconds
+        assert profile.seconds >= load.seconds
+
+        # Clean up - None
+        # ===========================================================
+
+    def test_depth_is_restored_on_exception(self) -> None:
+        r"""Test that the depth of the next stage is restored if a stage raises an exception."""
+
+        # Setup - None
+        # ===========================================================
+
+        # Exercise
+        # ===========================================================
+        with RenderProfiler(name='page') as profiler:
+            with pytest.raises(ValueError, match='Failed!'), stage('outer'), stage('inner'):
+                raise ValueError('Failed!')
+            with stage('next'):
+                pass
+
+        # Verify
+        # ===========================================================
+        assert profiler.profile is not None
+        assert [(s.name, s.depth) for s in profiler.profile.stages] == [
+            ('outer', 0),
+            ('inner', 1),
+            ('next', 0),
+        ]
+
+        # Clean up - None
+        # ===========================================================
+
+    def test_outside_of_rerun(self) -> None:
+        r"""Test that a stage outside of a profiled rerun is not recorded."""
+
+        # Setup - None
+        # ===========================================================
+
+        # Exercise
+        # ===========================================================
+        with stage('outside'):
+            pass
+
+        with RenderProfiler(name='page') as profiler:
+            pass
+
+        # Verify
+        # ===========================================================
+        assert profiler.profile is not None
+        assert profiler.profile.stages == ()
+
+        # Clean up - None
+        # ===========================================================
+
+
+class TestRenderProfiler:
+    r"""Tests for the class `RenderProfiler`."""
+
+    def test_disabled(self, caplog: pytest.LogCaptureFixture) -> None:
+        r"""Test that the profiler does nothing when profiling is disabled."""
+
+        # Setup
+        # ===========================================================
+        enable_profiling(False)
+
+        # Exercise
+        # ===========================================================
+        with (
+            caplog.at_level(logging.INFO, logger=PROFILING_LOGGER_NAME),
+            RenderProfiler(name='page') as profiler,
+            stage('load'),
+        ):
+            pass
+
+        # Verify
+        # ===========================================================
+        assert is_profiling_enabled() is False
+        assert profiler.profile is None
+        assert caplog.records == []
+
+        # Clean up - None
+        # ===========================================================
+
+    @pytest.mark.usefixtures('profiling_enabled')
+    def test_nested_profiler(self, caplog: pytest.LogCaptureFixture) -> None:
+        r"""Test that a nested profiler does nothing and its stages belong to the outer rerun."""
+
+        # Setup - None
+        # ===========================================================
+
+        # Exercise
+        # ===========================================================
+        with caplog.at_level(logging.INFO, logger=PROFILING_LOGGER_NAME):
+            with RenderProfiler(name='page') as outer:
+                with RenderProfiler(name='fragment') as inner, stage('render'):
+                    pass
+                inner_profile = inner.profile
+            outer_profile = outer.profile
+
+        # Verify
+        # ===========================================================
+        assert inner_profile is None
+        assert outer_profile is not None
+        assert outer_profile.name == 'page'
+        assert [s.name for s in outer_profile.stages] == ['render']
+        assert [r.getMessage() for r in caplog.records] == [outer_profile.to_json()]
+
+        # Clean up - None
+        # ===========================================================
+
+
+class TestProfiled:
+    r"""Tests for the decorator `profiled`."""
+
+    @pytest.mark.usefixtures('profiling_enabled')
+    def test_outside_of_rerun(self, caplog: pytest.LogCaptureFixture) -> None:
+        r"""Test that a call outside of a profiled rerun is profiled as a rerun of its own."""
+
+        # Setup
+        # ===========================================================
+        @profiled()
+        def edit_orders(value: int) -> int:
+            with stage('save'):
+                return value + 1
+
+        # Exercise
+        # ===========================================================
+        with caplog.at_level(logging.INFO, logger=PROFILING_LOGGER_NAME):
+            result = edit_orders(1)
+
+        # Verify
+        # ===========================================================
+        assert result == 2
+        assert len(caplog.records) == 1
+
+        profile = json.loads(caplog.records[0].getMessage())
+        assert profile['name'] == 'edit_orders'
+        assert [(s['name'], s['depth']) for s in profile['stages']] == [
+            ('edit_orders', 0),
+            ('save', 1),
+        ]
+
+        # Clean up - None
+        # ===========================================================
+
+    @pytest.mark.usefixtures('profiling_enabled')
+    def test_inside_of_rerun(self) -> None:
+        r"""Test that a call inside of a profiled rerun is timed as a stage with the given name."""
+
+        # Setup
+        # ===========================================================
+        @profiled(name='view')
+        def edit_orders() -> None:
+            pass
+
+        # Exercise
+        # ===========================================================
+        with RenderProfiler(name='page') as profiler:
+            edit_orders()
+
+        # Verify
+        # ===========================================================
+        assert profiler.profile is not None
+        assert [(s.name, s.depth) for s in profiler.profile.stages] == [('view', 0)]
+
+        # Clean up - None
+        # ===========================================================
+
+
+class TestRenderProfile:
+    r"""Tests for the class `RenderProfile`."""
+
+    def test_to_json(self) -> None:
+        r"""Test to serialize a profile into a JSON line with the wall times in milliseconds."""
+
+        # Setup
+        # ===========================================================
+        profile = RenderProfile(
+            name='Order',
+            started_at=datetime(2025, 1, 2, 3, 4, 5, tzinfo=UTC),
+            seconds=0.0123456,
+            stages=(
+                StageTiming(name='database: load orders', seconds=0.01, depth=0),
+                StageTiming(name='pandas: translate', seconds=0.0004567, depth=1),
+            ),
+        )
+        exp_result = {
+            'name': 'Order',
+            'started_at': '2025-01-02T03:04:05+00:00',
+            'ms': 12.35,
+            'stages': [
+                {'name': 'database: load orders', 'ms': 10.0, 'depth': 0},
+                {'name': 'pandas: translate', 'ms': 0.46, 'depth': 1},
+            ],
+        }
+
+        # Exercise
+        # ===========================================================
+        result = profile.to_json()
+
+        # Verify
+        # ===========================================================
+        assert '\n' not in result
+        assert json.loads(result) == exp_result
+
+        # Clean up - None
+        # ===========================================================
@@ -1,12 +1,16 @@
 r"""Unit tests for the module config.core."""
 
+# Standard library
+import sys
+
 # Third party
 import pytest
 from sqlalchemy import make_url
 
 # Local
 from cambiato import exceptions
-from cambiato.config import DatabaseConfig
+from cambiato.config import DatabaseConfig, DataFrameConfig
+from cambiato.models import DataFrameBackend
 
 
 class TestDatabaseSection:
@@ -104,3 +108,44 @@ class TestDatabaseSection:
 
         # Clean up - None
         # ===========================================================
+
+
+class TestDataFrameSection:
+    r"""Tests for the dataframe section of the config."""
+
+    def test_defaults(self) -> None:
+        r"""Test the default configuration of the dataframe section."""
+
+        # Exercise
+        # ===========================================================
+        result = DataFrameConfig()
+
+        # Verify
+        # ===========================================================
+        assert result.backend == DataFrameBackend.PANDAS
+
+        # Clean up - None
+        # ===========================================================
+
+    @pytest.mark.raises
+    def test_polars_backend_not_installed(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        r"""Test to select the polars backend when polars is not installed."""
+
+        # Setup
+        # ===========================================================
+        monkeypatch.setitem(sys.modules, 'polars', None)
+
+        # Exercise
+        # ===========================================================
+        with pytest.raises(exceptions.ConfigError) as exc_info:
+            DataFrameConfig(backend='polars')
+
+        # Verify
+        # ===========================================================
+        error_msg = exc_info.exconly()
+        print(error_msg)
+
+        assert 'polars' in error_msg
+
+        # Clean up - None
+        # ===========================================================
@@ -0,0 +1,493 @@
+r"""Unit tests for module `database.cache`."""
+
+# Standard library
+import os
+import time
+from datetime import timedelta
+from pathlib import Path
+
+# Third party
+import pandas as pd
+import pyarrow as pa
+import pytest
+from pandas.testing import assert_frame_equal
+
+# Local
+from cambiato.database import (
+    ALL_SCOPE,
+    ArrowIPCCache,
+    CacheRegistry,
+    CacheStats,
+    InvalidationEvent,
+    add_invalidation_listener,
+    create_cache_key,
+    create_scopes,
+    emit_invalidation,
+    remove_invalidation_listener,
+)
+from cambiato.database.cache import INITIAL_VERSION
+
+# =============================================================================================
+# Fixtures
+# =============================================================================================
+
+
+@pytest.fixture
+def df() -> pd.DataFrame:
+    r"""A DataFrame with an index and pyarrow backed columns."""
+
+    return pd.DataFrame(
+        {
+            'order_id': pd.Series([1, 2, 3], dtype=pd.ArrowDtype(pa.int64())),
+            'title': pd.Series(['a', None, 'c'], dtype=pd.ArrowDtype(pa.string())),
+            'description': pd.Series(['x', 'y', None], dtype='string[pyarrow]'),
+            'price': pd.Series([1.5, None, 3.0], dtype=pd.ArrowDtype(pa.float64())),
+            'status': pd.Series(['New', 'Done', 'New'], dtype='string[pyarrow]').astype('category'),
+        }
+    ).set_index('order_id')
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> ArrowIPCCache:
+    r"""An empty Arrow IPC cache without a time to live."""
+
+    return ArrowIPCCache(directory=tmp_path / 'cache')
+
+
+# =============================================================================================
+# Tests
+# =============================================================================================
+
+
+class TestCreateCacheKey:
+    r"""Tests for the function `create_cache_key`."""
+
+    def test_deterministic_and_order_independent(self) -> None:
+        r"""Test that the key is independent of the order of the keyword arguments."""
+
+        # Exercise
+        # ===========================================================
+        key_1 = create_cache_key(utility_id=1, active=True)
+        key_2 = create_cache_key(active=True, utility_id=1)
+        key_3 = create_cache_key(utility_id=2, active=True)
+
+        # Verify
+        # ===========================================================
+        assert key_1 == key_2
+        assert key_1 != key_3
+
+        # Clean up - None
+        # ===========================================================
+
+
+class TestCreateScopes:
+    r"""Tests for the function `create_scopes`."""
+
+    @pytest.mark.parametrize(
+        ('utility_ids', 'exp_result'),
+        [
+            pytest.param(None, (ALL_SCOPE,), id='None'),
+            pytest.param((), (ALL_SCOPE,), id='empty'),
+            pytest.param((2, 1, 2), ('1', '2'), id='utilities'),
+        ],
+    )
+    def test_create_scopes(
+        self, utility_ids: tuple[int, ...] | None, exp_result: tuple[str]
+    ) -> None:
+        r"""Test to create the scopes of the utilities of a cached object."""
+
+        # Exercise
+        # ===========================================================
+        result = create_scopes(utility_ids)
+
+        # Verify
+        # ===========================================================
+        assert result == exp_result
+
+        # Clean up - None
+        # ===========================================================
+
+
+class TestEmitInvalidation:
+    r"""Tests for the function `emit_invalidation`."""
+
+    def test_emit_to_listeners(self) -> None:
+        r"""Test that the events are emitted to the subscribed listeners."""
+
+        # Setup
+        # ===========================================================
+        events: list[InvalidationEvent] = []
+
+        def failing_listener(event: InvalidationEvent) -> None:
+            raise ValueError(f'Could not process {event}!')
+
+        add_invalidation_listener(failing_listener)
+        add_invalidation_listener(events.append)
+        add_invalidation_listener(events.append)
+
+        # Exercise
+        # ===========================================================
+        try:
+            event = emit_invalidation(tables=['order'], utility_ids=[1, 1])
+            remove_invalidation_listener(events.append)
+            emit_invalidation(tables=['order'])
+
+            # Verify
+            # ===========================================================
+            assert events == [event]
+            assert event == InvalidationEvent(
+                tables=frozenset({'order'}), utility_ids=frozenset({1})
+            )
+            assert event.affects(('facility', 'order'))
+            assert not event.affects(('facility',))
+
+        # Clean up
+        # ===========================================================
+        finally:
+            remove_invalidation_listener(failing_listener)
+            remove_invalidation_listener(events.append)
+
+
+class TestArrowIPCCache:
+    r"""Tests for the class `ArrowIPCCache`."""
+
+    def test_store_and_load(self, cache: ArrowIPCCache, df: pd.DataFrame) -> None:
+        r"""Test to store a DataFrame and load it from the memory-mapped cache file."""
+
+        # Setup
+        # ===========================================================
+        version = cache.get_version('orders')
+
+        # Exercise
+        # ===========================================================
+        stored_df = cache.store(namespace='orders', key='k', version=version, df=df)
+        loaded_df = cache.load(namespace='orders', key='k', version=version)
+
+        # Verify
+        # ===========================================================
+        assert version == INITIAL_VERSION
+        assert loaded_df is not None
+        assert_frame_equal(stored_df, df)
+        assert_frame_equal(loaded_df, df)
+
+        # Clean up - None
+        # ===========================================================
+
+    def test_load_missing(self, cache: ArrowIPCCache) -> None:
+        r"""Test that loading a DataFrame that is not cached returns None."""
+
+        # Exercise
+        # ===========================================================
+        result = cache.load(namespace='orders', key='k', version=INITIAL_VERSION)
+
+        # Verify
+        # ===========================================================
+        assert result is None
+
+        # Clean up - None
+        # ===========================================================
+
+    def test_invalidate(self, cache: ArrowIPCCache, df: pd.DataFrame) -> None:
+        r"""Test that invalidating a namespace bumps its version and removes its files."""
+
+        # Setup
+        # ===========================================================
+        cache.store(namespace='orders', key='k', version=INITIAL_VERSION, df=df)
+        cache.store(namespace='facilities', key='k', version=INITIAL_VERSION, df=df)
+
+        # Exercise
+        # ===========================================================
+        version = cache.invalidate('orders')
+
+        # Verify
+        # ===========================================================
+        assert version != INITIAL_VERSION
+        assert cache.get_version('orders') == version
+        assert cache.get_version('facilities') == INITIAL_VERSION
+        assert cache.load(namespace='orders', key='k', version=version) is None
+        assert list(cache.directory.glob('orders-*.arrow')) == []
+        assert len(list(cache.directory.glob('facilities-*.arrow'))) == 1
+
+        # Clean up - None
+        # ===========================================================
+
+    def test_invalidate_scopes(self, cache: ArrowIPCCache) -> None:
+        r"""Test that invalidating scopes only changes the versions of the affected scopes."""
+
+        # Setup
+        # ===========================================================
+        version_1 = cache.get_version('orders', scopes=('1',))
+        version_2 = cache.get_version('orders', scopes=('2',))
+        version_all = cache.get_version('orders', scopes=(ALL_SCOPE,))
+
+        # Exercise
+        # ===========================================================
+        cache.invalidate('orders', scopes=('1',))
+
+        # Verify
+        # ===========================================================
+        assert cache.get_version('orders', scopes=('1',)) != version_1
+        assert cache.get_version('orders', scopes=('2',)) == version_2
+        assert cache.get_version('orders', scopes=(ALL_SCOPE,)) != version_all
+        assert cache.get_version('orders') == INITIAL_VERSION
+
+        # Clean up - None
+        # ===========================================================
+
+    def test_store_removes_stale_versions(self, cache: ArrowIPCCache, df: pd.DataFrame) -> None:
+        r"""Test that storing a new version of a DataFrame removes the old version."""
+
+        # Setup
+        # ===========================================================
+        cache.store(namespace='orders', key='k', version='1', df=df)
+
+        # Exercise
+        # ===========================================================
+        cache.store(namespace='orders', key='k', version='2', df=df)
+
+        # Verify
+        # ===========================================================
+        assert [p.name for p in cache.directory.glob('orders-*.arrow')] == ['orders-k-2.arrow']
+
+        # Clean up - None
+        # ===========================================================
+
+    def test_expired(self, tmp_path: Path, df: pd.DataFrame) -> None:
+        r"""Test that a DataFrame stored longer ago than the time to live is not loaded."""
+
+        # Setup
+        # ===========================================================
+        cache = ArrowIPCCache(directory=tmp_path, ttl=timedelta(minutes=5))
+        cache.store(namespace='orders', key='k', version=INITIAL_VERSION, df=df)
+        path = next(tmp_path.glob('orders-*.arrow'))
+        mtime = time.time() - 600
+        os.utime(path, (mtime, mtime))
+
+        # Exercise
+        # ===========================================================
+        result = cache.load(namespace='orders', key='k', version=INITIAL_VERSION)
+
+        # Verify
+        # ===========================================================
+        assert result is None
+
+        # Clean up - None
+        # ===========================================================
+
+    def test_get_or_store(self, cache: ArrowIPCCache, df: pd.DataFrame) -> None:
+        r"""Test that the DataFrame is only loaded by `func` if it is not cached."""
+
+        # Setup
+        # ===========================================================
+        calls: list[int] = []
+
+        def func() -> pd.DataFrame:
+            calls.append(1)
+            return df
+
+        # Exercise
+        # ===========================================================
+        df_1 = cache.get_or_store(namespace='orders', key='k', version=INITIAL_VERSION, func=func)
+        df_2 = cache.get_or_store(namespace='orders', key='k', version=INITIAL_VERSION, func=func)
+
+        # Verify
+        # ===========================================================
+        assert len(calls) == 1
+        assert_frame_equal(df_1, df)
+        assert_frame_equal(df_2, df)
+
+        # Clean up - None
+        # ===========================================================
+
+
+class TestCacheRegistry:
+    r"""Tests for the class `CacheRegistry`."""
+
+    def test_put_and_get(self) -> None:
+        r"""Test to store entries and account for their memory usage."""
+
+        # Setup
+        # ===========================================================
+        registry = CacheRegistry()
+
+        # Exercise
+        # ===========================================================
+        registry.put(namespace='orders', key='1', value='a', nbytes=100, description='id=1')
+        registry.put(namespace='orders', key='2', value='b', nbytes=50)
+        registry.put(namespace='facilities', key='1', value='c', nbytes=10, shared=True)
+        registry.put(namespace='orders', key='1', value='d', nbytes=200)
+
+        # Verify
+        # ===========================================================
+        assert registry.get(namespace='orders', key='1') == 'd'
+        assert registry.get(namespace='orders', key='3') is None
+        assert registry.total_bytes == 260
+        assert len(registry) == 3
+        assert registry.usage_by_namespace() == {'orders': (2, 250), 'facilities': (1, 10)}
+
+        # Clean up - None
+        # ===========================================================
+
+    def test_evict_least_recently_used(self) -> None:
+        r"""Test that the least recently used entries are evicted to fit the byte budget."""
+
+        # Setup
+        # ===========================================================
+        registry = CacheRegistry(max_bytes=100)
+        registry.put(namespace='orders', key='1', value='a', nbytes=40)
+        registry.put(namespace='orders', key='2', value='b', nbytes=40)
+        registry.get(namespace='orders', key='1')
+
+        # Exercise
+        # ===========================================================
+        evicted = registry.put(namespace='orders', key='3', value='c', nbytes=40)
+        evicted_oversized = registry.put(namespace='facilities', key='1', value='d', nbytes=500)
+
+        # Verify
+        # ===========================================================
+        assert [e.key for e in evicted] == ['2']
+        assert [(e.namespace, e.key) for e in evicted_oversized] == [
+            ('orders', '1'),
+            ('orders', '3'),
+        ]
+        assert [e.value for e in registry.entries()] == ['d']
+        assert registry.total_bytes == 500
+
+        # Clean up - None
+        # ===========================================================
+
+    def test_version_and_ttl(self) -> None:
+        r"""Test that entries of another version or older than the time to live are missing."""
+
+        # Setup
+        # ===========================================================
+        registry = CacheRegistry(ttl=timedelta(minutes=5))
+        registry.put(namespace='orders', key='1', value='a', nbytes=10, version='1')
+        registry.put(namespace='orders', key='2', value='b', nbytes=20)
+        entry = registry.entries()[-1]
+        registry._entries['orders', '2'] = entry._replace(
+            loaded_at=entry.loaded_at - timedelta(minutes=10)
+        )
+
+        # Exercise
+        # ===========================================================
+        result_other_version = registry.get(namespace='orders', key='1', version='2')
+        result_expired = registry.get(namespace='orders', key='2')
+
+        # Verify
+        # ===========================================================
+        assert result_other_version is None
+        assert result_expired is None
+        assert len(registry) == 0
+        assert registry.total_bytes == 0
+
+        # Clean up - None
+        # ===========================================================
+
+    def test_invalidate(self) -> None:
+        r"""Test to remove the entries of a namespace and all entries."""
+
+        # Setup
+        # ===========================================================
+        registry = CacheRegistry()
+        registry.put(namespace='orders', key='1', value='a', nbytes=10)
+        registry.put(namespace='facilities', key='1', value='b', nbytes=20)
+
+        # Exercise
+        # ===========================================================
+        registry.invalidate('orders')
+        usage = registry.usage_by_namespace()
+        registry.invalidate()
+
+        # Verify
+        # ===========================================================
+        assert usage == {'facilities': (1, 20)}
+        assert len(registry) == 0
+        assert registry.total_bytes == 0
+
+        # Clean up - None
+        # ===========================================================
+
+    def test_invalidate_scopes(self) -> None:
+        r"""Test to remove the entries of a namespace loaded for specific scopes."""
+
+        # Setup
+        # ===========================================================
+        registry = CacheRegistry()
+        registry.put(namespace='orders', key='1', value='a', nbytes=10, scopes=('1',))
+        registry.put(namespace='orders', key='2', value='b', nbytes=10, scopes=('2',))
+        registry.put(namespace='orders', key='3', value='c', nbytes=10, scopes=(ALL_SCOPE,))
+        registry.put(namespace='orders', key='4', value='d', nbytes=10)
+        registry.put(namespace='facilities', key='1', value='e', nbytes=10, scopes=('1',))
+
+        # Exercise
+        # ===========================================================
+        registry.invalidate('orders', scopes=('1',))
+
+        # Verify
+        # ===========================================================
+        assert [(e.namespace, e.key) for e in registry.entries()] == [
+            ('orders', '2'),
+            ('facilities', '1'),
+        ]
+        assert registry.total_bytes == 20
+
+        # Clean up - None
+        # ===========================================================
+
+    def test_stats(self) -> None:
+        r"""Test that the lookups, removed entries and loads are counted per namespace."""
+
+        # Setup
+        # ===========================================================
+        registry = CacheRegistry(max_bytes=100, ttl=timedelta(minutes=5))
+        registry.get(namespace='orders', key='1')
+        registry.record_load('orders', seconds=0.5)
+        registry.put(namespace='orders', key='1', value='a', nbytes=40)
+        registry.get(namespace='orders', key='1')
+        registry.get(namespace='orders', key='1', record_stats=False)
+        registry.record_load('orders', seconds=1.5)
+        registry.put(namespace='orders', key='2', value='b', nbytes=50)
+        registry.put(namespace='facilities', key='1', value='c', nbytes=30)
+        entry = registry.entries()[-1]
+        registry._entries['facilities', '1'] = entry._replace(
+            loaded_at=entry.loaded_at - timedelta(minutes=10)
+        )
+        registry.get(namespace='facilities', key='1')
+        registry.put(namespace='facilities', key='2', value='d', nbytes=10)
+        registry.invalidate('facilities')
+
+        # Exercise
+        # ===========================================================
+        stats = registry.stats()
+
+        # Verify
+        # ===========================================================
+        assert stats == {
+            'facilities': CacheStats(
+                namespace='facilities', misses=1, expirations=1, invalidations=1
+            ),
+            'orders': CacheStats(
+                namespace='orders',
+                hits=1,
+                misses=1,
+                evictions=1,
+                loads=2,
+                load_seconds=2.0,
+                max_load_seconds=1.5,
+                entries=1,
+                nbytes=50,
+                max_nbytes=50,
+            ),
+        }
+        assert stats['orders'].hit_ratio == 0.5
+        assert stats['orders'].mean_load_seconds == 1.0
+        assert stats['facilities'].mean_load_seconds is None
+
+        registry.reset_stats()
+        assert registry.stats() == {
+            'orders': CacheStats(namespace='orders', entries=1, nbytes=50, max_nbytes=50)
+        }
+
+        # Clean up - None
+        # ===========================================================
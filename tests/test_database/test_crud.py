@@ -0,0 +1,314 @@
+r"""Unit tests for the sub-package `database.crud`."""
+
+# Standard library
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+# Third party
+import pytest
+
+# Local
+from cambiato.config import Language
+from cambiato.database import (
+    ChangedDatabaseRows,
+    InvalidationEvent,
+    SessionFactory,
+    add_invalidation_listener,
+    create_order,
+    create_session_factory,
+    get_active_orders_page,
+    get_all_active_orders,
+    get_all_order_types,
+    get_all_utilities,
+    init,
+    process_changed_orders,
+    remove_invalidation_listener,
+)
+from cambiato.database.models import Order, OrderType, Translation, User, Utility
+from cambiato.database.models.default import user_role
+
+USER_DEFINED_ORDER_TYPE_ID = 100
+
+# =============================================================================================
+# Fixtures
+# =============================================================================================
+
+
+@pytest.fixture
+def session_factory(tmp_path: Path) -> SessionFactory:
+    r"""A session factory of an initialized SQLite database with Swedish translations.
+
+    The database has a user-defined order type without a translation and
+    an order of a default order type and of the user-defined order type.
+    """
+
+    url = f'sqlite:///{tmp_path / "Cambiato.db"!s}'
+    session_factory = create_session_factory(url=url, create_database=True)
+
+    with session_factory() as session:
+        init(session=session)
+        session.add_all(
+            (
+                Translation(
+                    table_name=Utility.__tablename__,
+                    row_id=1,
+                    language=Language.SV,
+                    name='El',
+                ),
+                Translation(
+                    table_name=OrderType.__tablename__,
+                    row_id=1,
+                    language=Language.SV,
+                    name='Mätarbyte',
+                ),
+                OrderType(order_type_id=USER_DEFINED_ORDER_TYPE_ID, name='Meter Inspection'),
+                User(
+                    user_id='user',
+                    username='user',
+                    displayname='User',
+                    role_id=user_role.role_id,
+                ),
+            )
+        )
+        session.add_all(
+            Order(
+                order_id=order_id,
+                order_type_id=order_type_id,
+                order_status_id=1,
+                utility_id=1,
+                created_by='user',
+            )
+            for order_id, order_type_id in ((1, 1), (2, USER_DEFINED_ORDER_TYPE_ID))
+        )
+        session.commit()
+
+    return session_factory
+
+
+# =============================================================================================
+# Tests
+# =============================================================================================
+
+
+class TestTranslateInDatabase:
+    r"""Tests for translating the names of the reference tables in the queries."""
+
+    def test_seeded_translations(self, session_factory: SessionFactory) -> None:
+        r"""Test that the translations of the translation files are seeded by `init`."""
+
+        # Exercise
+        # ===========================================================
+        with session_factory() as session:
+            translation = session.get(Translation, (OrderType.__tablename__, 1, Language.EN))
+
+        # Verify
+        # ===========================================================
+        assert translation is not None
+        assert translation.name == 'Device Change'
+
+        # Clean up - None
+        # ===========================================================
+
+    @pytest.mark.parametrize(
+        ('language', 'exp_names'),
+        [
+            pytest.param(None, ['Device Change', 'Meter Inspection'], id='untranslated'),
+            pytest.param(Language.EN, ['Device Change', 'Meter Inspection'], id='en'),
+            pytest.param(Language.SV, ['Mätarbyte', 'Meter Inspection'], id='sv'),
+        ],
+    )
+    def test_get_all_order_types(
+        self, language: Language | None, exp_names: list[str], session_factory: SessionFactory
+    ) -> None:
+        r"""Test that order types without a translation fall back to their name."""
+
+        # Exercise
+        # ===========================================================
+        with session_factory() as session:
+            order_types = get_all_order_types(_session=session, language=language)
+
+        # Verify
+        # ===========================================================
+        df = order_types.df
+        names = df.loc[[1, USER_DEFINED_ORDER_TYPE_ID], order_types.c_name].tolist()
+
+        assert names == exp_names
+        assert df.index.is_unique
+
+        # Clean up - None
+        # ===========================================================
+
+    def test_get_all_utilities(self, session_factory: SessionFactory) -> None:
+        r"""Test to translate the names of the utilities into a partially translated language."""
+
+        # Exercise
+        # ===========================================================
+        with session_factory() as session:
+            utilities = get_all_utilities(_session=session, language=Language.SV)
+
+        # Verify
+        # ===========================================================
+        names = utilities.df[utilities.c_name]
+
+        assert names.loc[1] == 'El'
+        assert names.loc[2] == 'District Heating'
+
+        # Clean up - None
+        # ===========================================================
+
+    def test_get_all_active_orders(self, session_factory: SessionFactory) -> None:
+        r"""Test to translate the order type and order status names of the orders."""
+
+        # Exercise
+        # ===========================================================
+        with session_factory() as session:
+            orders = get_all_active_orders(_session=session, language=Language.SV)
+
+        # Verify
+        # ===========================================================
+        df = orders.df.sort_index()
+
+        assert df[orders.c_order_type_name].tolist() == ['Mätarbyte', 'Meter Inspection']
+        assert df[orders.c_order_status_name].tolist() == ['To do', 'To do']
+
+        # Clean up - None
+        # ===========================================================
+
+
+class TestGetActiveOrdersPage:
+    r"""Tests for the function `get_active_orders_page`."""
+
+    def test_keyset_cursor(self, session_factory: SessionFactory) -> None:
+        r"""Test to load the pages of the orders with the cursor of the previous page."""
+
+        # Exercise
+        # ===========================================================
+        with session_factory() as session:
+            first_page = get_active_orders_page(_session=session, limit=1)
+            second_page = get_active_orders_page(
+                _session=session, limit=1, cursor=first_page.next_cursor
+            )
+
+        # Verify
+        # ===========================================================
+        assert first_page.orders.index.tolist() == [2]
+        assert first_page.next_cursor == 2
+        assert second_page.orders.index.tolist() == [1]
+        assert second_page.next_cursor is None
+
+        # Clean up - None
+        # ===========================================================
+
+    @pytest.mark.parametrize(
+        ('filters', 'exp_order_ids'),
+        [
+            pytest.param({}, [2, 1], id='no filters'),
+            pytest.param({'order_ids': (1,)}, [1], id='order_ids'),
+            pytest.param({'utility_ids': (2,)}, [], id='utility_ids'),
+            pytest.param({'order_types': (USER_DEFINED_ORDER_TYPE_ID,)}, [2], id='order_types'),
+            pytest.param({'order_statuses': (2,)}, [], id='order_statuses'),
+            pytest.param({'technicians': ('user',)}, [1], id='technicians'),
+            pytest.param(
+                {
+                    'scheduled_from': datetime(2025, 1, 1, tzinfo=UTC),
+                    'scheduled_to': datetime(2025, 1, 2, tzinfo=UTC),
+                },
+                [1],
+                id='scheduled',
+            ),
+            pytest.param(
+                {'scheduled_from': datetime(2025, 1, 2, tzinfo=UTC)}, [], id='scheduled_from'
+            ),
+        ],
+    )
+    def test_filters(
+        self, filters: dict[str, Any], exp_order_ids: list[int], session_factory: SessionFactory
+    ) -> None:
+        r"""Test to filter the orders of the page in the query."""
+
+        # Setup
+        # ===========================================================
+        with session_factory() as session:
+            order = session.get(Order, 1)
+            assert order is not None
+            order.assigned_to_user_id = 'user'
+            order.scheduled_start_at = datetime(2025, 1, 1, 8, tzinfo=UTC)
+            session.commit()
+
+        # Exercise
+        # ===========================================================
+        with session_factory() as session:
+            page = get_active_orders_page(_session=session, **filters)
+
+        # Verify
+        # ===========================================================
+        assert page.orders.index.tolist() == exp_order_ids
+        assert page.next_cursor is None
+
+        # Clean up - None
+        # ===========================================================
+
+
+class TestInvalidationEvents:
+    r"""Tests for the invalidation events emitted by the functions writing orders."""
+
+    def test_create_order(self, session_factory: SessionFactory) -> None:
+        r"""Test that creating an order emits an event of the utility of the order."""
+
+        # Setup
+        # ===========================================================
+        events: list[InvalidationEvent] = []
+        add_invalidation_listener(events.append)
+        order = Order(order_type_id=1, order_status_id=1, utility_id=2, created_by='user')
+
+        # Exercise
+        # ===========================================================
+        try:
+            with session_factory() as session:
+                result = create_order(session=session, order=order)
+
+            # Verify
+            # ===========================================================
+            assert result.ok
+            assert events == [
+                InvalidationEvent(tables=frozenset({'order'}), utility_ids=frozenset({2}))
+            ]
+
+        # Clean up
+        # ===========================================================
+        finally:
+            remove_invalidation_listener(events.append)
+
+    def test_process_changed_orders(self, session_factory: SessionFactory) -> None:
+        r"""Test that processing changed orders emits an event of the changed utilities."""
+
+        # Setup
+        # ===========================================================
+        events: list[InvalidationEvent] = []
+        add_invalidation_listener(events.append)
+        changed_orders = ChangedDatabaseRows(
+            edited_rows=[{'order_id': 1, 'description': 'Edited'}],
+            added_rows=[
+                {'order_type_id': 1, 'order_status_id': 1, 'utility_id': 3, 'created_by': 'user'}
+            ],
+            deleted_rows=[2],
+        )
+
+        # Exercise
+        # ===========================================================
+        try:
+            with session_factory() as session:
+                result = process_changed_orders(session=session, changed_orders=changed_orders)
+
+            # Verify
+            # ===========================================================
+            assert result.ok, result.long_msg
+            assert events == [
+                InvalidationEvent(tables=frozenset({'order'}), utility_ids=frozenset({1, 3}))
+            ]
+
+        # Clean up
+        # ===========================================================
+        finally:
+            remove_invalidation_listener(events.append)
@@ -0,0 +1,191 @@
+r"""Unit tests for module `database.export`."""
+
+# Standard library
+from pathlib import Path
+
+# Third party
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
+import pytest
+
+# Local
+from cambiato import exceptions
+from cambiato.database import (
+    ExportFormat,
+    ExportTable,
+    SessionFactory,
+    create_session_factory,
+    export_table,
+    init,
+)
+from cambiato.database.models import Facility, Order
+
+NR_FACILITIES = 25
+
+# =============================================================================================
+# Fixtures
+# =============================================================================================
+
+
+@pytest.fixture
+def session_factory(tmp_path: Path) -> SessionFactory:
+    r"""A session factory of an initialized SQLite database with facilities and orders."""
+
+    url = f'sqlite:///{tmp_path / "Cambiato.db"!s}'
+    session_factory = create_session_factory(url=url, create_database=True)
+
+    with session_factory() as session:
+        init(session=session)
+        session.add_all(
+            Facility(facility_id=i, utility_id=1, ean=735_999_100_000_000_000 + i)
+            for i in range(1, NR_FACILITIES + 1)
+        )
+        session.add_all(
+            Order(
+                order_id=i,
+                order_type_id=1,
+                order_status_id=1,
+                utility_id=1,
+                facility_id=i,
+                description=None if i % 2 else f'Order {i}',
+            )
+            for i in range(1, NR_FACILITIES + 1)
+        )
+        session.commit()
+
+    return session_factory
+
+
+# =============================================================================================
+# Tests
+# =============================================================================================
+
+
+class TestExportTable:
+    r"""Tests for the function `export_table`."""
+
+    @pytest.mark.parametrize(
+        'batch_size', [pytest.param(10, id='batches'), pytest.param(100, id='single')]
+    )
+    def test_export_orders_to_parquet(
+        self, batch_size: int, session_factory: SessionFactory, tmp_path: Path
+    ) -> None:
+        r"""Test to export the orders to a Parquet file with one row group per batch."""
+
+        # Setup
+        # ===========================================================
+        path = tmp_path / 'orders.parquet'
+        nr_row_groups_exp = -(-NR_FACILITIES // batch_size)
+
+        # Exercise
+        # ===========================================================
+        with session_factory() as session:
+            result = export_table(
+                session=session,
+                table=ExportTable.ORDERS,
+                path=path,
+                format=ExportFormat.PARQUET,
+                batch_size=batch_size,
+            )
+
+        # Verify
+        # ===========================================================
+        assert result.path == path
+        assert result.nr_rows == NR_FACILITIES
+        assert result.nr_bytes == path.stat().st_size
+        assert result.rows_per_second > 0
+
+        parquet_file = pq.ParquetFile(path)
+        assert parquet_file.metadata.num_row_groups == nr_row_groups_exp
+
+        table = parquet_file.read()
+        assert table.column('order_id').to_pylist() == list(range(1, NR_FACILITIES + 1))
+        assert table.column('description').null_count == -(-NR_FACILITIES // 2)
+        assert table.schema.field('created_at').type == pa.timestamp('us')
+
+        # Clean up - None
+        # ===========================================================
+
+    def test_export_facilities_to_csv(
+        self, session_factory: SessionFactory, tmp_path: Path
+    ) -> None:
+        r"""Test to export the facilities to a CSV file in batches."""
+
+        # Setup
+        # ===========================================================
+        path = tmp_path / 'facilities.csv'
+
+        # Exercise
+        # ===========================================================
+        with session_factory() as session:
+            result = export_table(
+                session=session,
+                table=ExportTable.FACILITIES,
+                path=path,
+                format=ExportFormat.CSV,
+                batch_size=10,
+            )
+
+        # Verify
+        # ===========================================================
+        assert result.nr_rows == NR_FACILITIES
+
+        table = pa_csv.read_csv(path)
+        assert table.num_rows == NR_FACILITIES
+        assert table.column('ean').to_pylist() == [
+            735_999_100_000_000_000 + i for i in range(1, NR_FACILITIES + 1)
+        ]
+
+        # Clean up - None
+        # ===========================================================
+
+    @pytest.mark.parametrize('export_format', [ExportFormat.PARQUET, ExportFormat.CSV])
+    def test_export_empty_table(
+        self, export_format: ExportFormat, session_factory: SessionFactory, tmp_path: Path
+    ) -> None:
+        r"""Test to export a table without rows."""
+
+        # Setup
+        # ===========================================================
+        path = tmp_path / f'checklists.{export_format}'
+
+        # Exercise
+        # ===========================================================
+        with session_factory() as session:
+            result = export_table(
+                session=session, table=ExportTable.CHECKLISTS, path=path, format=export_format
+            )
+
+        # Verify
+        # ===========================================================
+        assert result.nr_rows == 0
+        assert path.exists()
+
+        # Clean up - None
+        # ===========================================================
+
+    @pytest.mark.raises
+    def test_export_to_missing_directory(
+        self, session_factory: SessionFactory, tmp_path: Path
+    ) -> None:
+        r"""Test that an export to a directory that does not exist raises `ExportError`."""
+
+        # Setup
+        # ===========================================================
+        path = tmp_path / 'missing' / 'orders.parquet'
+
+        # Exercise
+        # ===========================================================
+        with session_factory() as session, pytest.raises(exceptions.ExportError) as exc_info:
+            export_table(session=session, table=ExportTable.ORDERS, path=path)
+
+        # Verify
+        # ===========================================================
+        error_msg = exc_info.exconly()
+        print(error_msg)
+
+        assert 'orders' in error_msg
+
+        # Clean up - None
+        # ===========================================================
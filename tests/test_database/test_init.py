@@ -54,6 +54,7 @@ class TestInit:
             'MountType': select(func.count()).select_from(models.MountType),
             'OrderType': select(func.count()).select_from(models.OrderType),
             'OrderStatus': select(func.count()).select_from(models.OrderStatus),
+            'Translation': select(func.count()).select_from(models.Translation),
         }
 
         # Exercise
@@ -87,6 +88,38 @@ class TestInit:
         # Clean up - None
         # ===========================================================
 
+    def test_initialize_database_twice(self, tmp_path: Path) -> None:
+        r"""Test that initializing an already initialized database is a no-op."""
+
+        # Setup
+        # ===========================================================
+        url = f'sqlite:///{tmp_path / "Cambiato.db"!s}'
+        session_factory = create_session_factory(url=url, create_database=True)
+        query = select(func.count()).select_from(models.OrderStatus)
+
+        with session_factory() as session:
+            error, error_msg = init(session=session)
+            count_exp = session.scalars(query).one()
+
+        assert error is False, error_msg
+        assert count_exp > 0
+
+        # Exercise
+        # ===========================================================
+        with session_factory() as session:
+            error, error_msg = init(session=session)
+
+        # Verify
+        # ===========================================================
+        assert error is False, error_msg
+        assert error_msg == ''
+
+        with session_factory() as session:
+            assert session.scalars(query).one() == count_exp
+
+        # Clean up - None
+        # ===========================================================
+
     @pytest.mark.raises
     def test_sqlite_foreign_key_constraints_enabled(self) -> None:
         r"""Test that foreign key constraints are enabled in a SQLite database."""
@@ -0,0 +1,419 @@
+r"""Unit tests for module `database.result_cache`."""
+
+# Standard library
+import os
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+
+# Third party
+import pandas as pd
+import pytest
+
+# Local
+from cambiato import exceptions
+from cambiato.database import (
+    ArrowIPCCache,
+    CacheWarmUp,
+    ResultCache,
+    SessionFactory,
+    TableVersions,
+    WarmUpCall,
+    WarmUpStatus,
+    create_session_factory,
+    emit_invalidation,
+)
+from cambiato.models import UtilityDataFrameModel
+
+# =============================================================================================
+# Fixtures
+# =============================================================================================
+
+
+class LoadUtilities:
+    r"""A function that loads utilities and records its calls."""
+
+    def __init__(self) -> None:
+        self.calls: list[dict[str, Any]] = []
+
+    def __call__(self, _session: Any, **kwargs: Any) -> UtilityDataFrameModel:
+        self.calls.append(kwargs)
+        df = pd.DataFrame(
+            {'utility_id': [1, 2], 'name': ['Electricity', f'Call {len(self.calls)}']}
+        ).astype({'utility_id': 'uint32[pyarrow]', 'name': 'string[pyarrow]'})
+
+        return UtilityDataFrameModel(df=df.set_index('utility_id'))
+
+
+class BlockingLoadUtilities(LoadUtilities):
+    r"""A function that loads utilities and waits until `parties` loads are running."""
+
+    def __init__(self, parties: int) -> None:
+        super().__init__()
+        self.barrier = threading.Barrier(parties, timeout=5)
+
+    def __call__(self, _session: Any, **kwargs: Any) -> UtilityDataFrameModel:
+        result = super().__call__(_session, **kwargs)
+        self.barrier.wait()
+
+        return result
+
+
+@pytest.fixture
+def result_cache() -> Iterator[ResultCache]:
+    r"""A result cache in memory subscribed to the invalidation events."""
+
+    result_cache = ResultCache()
+    yield result_cache
+    result_cache.close()
+
+
+@pytest.fixture
+def session_factory(tmp_path: Path) -> SessionFactory:
+    r"""A session factory of an empty SQLite database."""
+
+    return create_session_factory(url=f'sqlite:///{tmp_path / "Cambiato.db"!s}')
+
+
+# =============================================================================================
+# Tests
+# =============================================================================================
+
+
+class TestTableVersions:
+    r"""Tests for the class `TableVersions`."""
+
+    @pytest.mark.parametrize('in_memory', [pytest.param(True, id='memory'), False])
+    def test_bump(self, in_memory: bool, tmp_path: Path) -> None:
+        r"""Test that bumping a table changes the versions that depend on the table."""
+
+        # Setup
+        # ===========================================================
+        versions = TableVersions(directory=None if in_memory else tmp_path / 'versions')
+        order_1 = versions.get_version(['order'], scopes=('1',))
+        order_2 = versions.get_version(['order'], scopes=('2',))
+        order_all = versions.get_version(['order'], scopes=('all',))
+        utility = versions.get_version(['utility'])
+
+        # Exercise
+        # ===========================================================
+        versions.bump(['order'], scopes=('1',))
+
+        # Verify
+        # ===========================================================
+        assert versions.get_version(['order'], scopes=('1',)) != order_1
+        assert versions.get_version(['order'], scopes=('2',)) == order_2
+        assert versions.get_version(['order'], scopes=('all',)) != order_all
+        assert versions.get_version(['utility']) == utility
+
+        versions.bump(['order'])
+        assert versions.get_version(['order'], scopes=('2',)) != order_2
+
+        # Clean up - None
+        # ===========================================================
+
+    def test_shared_between_instances(self, tmp_path: Path) -> None:
+        r"""Test that the versions of a directory are shared between instances."""
+
+        # Setup
+        # ===========================================================
+        versions = TableVersions(directory=tmp_path)
+        other = TableVersions(directory=tmp_path)
+
+        # Exercise
+        # ===========================================================
+        versions.bump(['order', 'utility'])
+
+        # Verify
+        # ===========================================================
+        assert other.get_version(['utility', 'order']) == versions.get_version(['order', 'utility'])
+
+        # Clean up - None
+        # ===========================================================
+
+
+class TestResultCache:
+    r"""Tests for the class `ResultCache`."""
+
+    def test_cached(self, result_cache: ResultCache) -> None:
+        r"""Test that results are cached by the keyword arguments of the cached function."""
+
+        # Setup
+        # ===========================================================
+        func = LoadUtilities()
+        cached = result_cache.cached(func, namespace='utilities', tables=('utility',))
+
+        # Exercise
+        # ===========================================================
+        first = cached(_session=None, language='sv')
+        second = cached(_session=None, language='sv')
+        other = cached(_session=None, language='en')
+
+        # Verify
+        # ===========================================================
+        assert first is second
+        assert other is not first
+        assert func.calls == [{'language': 'sv'}, {'language': 'en'}]
+
+        stats = result_cache.registry.stats()['utilities']
+        assert (stats.hits, stats.misses, stats.loads, stats.entries) == (1, 2, 2, 2)
+
+        # Clean up - None
+        # ===========================================================
+
+    def test_invalidate_dependent_tables(self, result_cache: ResultCache) -> None:
+        r"""Test that an invalidation event only reloads the results that read its tables."""
+
+        # Setup
+        # ===========================================================
+        utilities = LoadUtilities()
+        others = LoadUtilities()
+        cached_utilities = result_cache.cached(
+            utilities, namespace='utilities', tables=('utility', 'translation')
+        )
+        cached_others = result_cache.cached(others, namespace='others', tables=('order',))
+        cached_utilities(_session=None)
+        cached_others(_session=None)
+
+        # Exercise
+        # ===========================================================
+        emit_invalidation(tables=('translation',))
+        cached_utilities(_session=None)
+        cached_others(_session=None)
+
+        # Verify
+        # ===========================================================
+        assert len(utilities.calls) == 2
+        assert len(others.calls) == 1
+
+        # Clean up - None
+        # ===========================================================
+
+    def test_invalidate_utilities(self, result_cache: ResultCache) -> None:
+        r"""Test that an invalidation event of a utility keeps the results of other utilities."""
+
+        # Setup
+        # ===========================================================
+        func = LoadUtilities()
+        cached = result_cache.cached(func, namespace='orders', tables=('order',))
+        cached(_session=None, utility_ids=(1,))
+        cached(_session=None, utility_ids=(2,))
+        cached(_session=None)
+
+        # Exercise
+        # ===========================================================
+        emit_invalidation(tables=('order',), utility_ids=(1,))
+        cached(_session=None, utility_ids=(1,))
+        cached(_session=None, utility_ids=(2,))
+        cached(_session=None)
+
+        # Verify
+        # ===========================================================
+        assert func.calls[3:] == [{'utility_ids': (1,)}, {}]
+
+        # Clean up - None
+        # ===========================================================
+
+    def test_clear(self, result_cache: ResultCache) -> None:
+        r"""Test to clear the results of a cached function."""
+
+        # Setup
+        # ===========================================================
+        func = LoadUtilities()
+        cached = result_cache.cached(func, namespace='utilities', tables=('utility',))
+        cached(_session=None)
+
+        # Exercise
+        # ===========================================================
+        cached.clear()  # type: ignore[attr-defined]
+        cached(_session=None)
+
+        # Verify
+        # ===========================================================
+        assert len(func.calls) == 2
+
+        # Clean up - None
+        # ===========================================================
+
+    def test_put(self, result_cache: ResultCache) -> None:
+        r"""Test to replace a result with an updated result after an invalidation event."""
+
+        # Setup
+        # ===========================================================
+        func = LoadUtilities()
+        cached = result_cache.cached(func, namespace='utilities', tables=('utility',))
+        loaded = cached(_session=None, utility_ids=(1,))
+        emit_invalidation(tables=('utility',), utility_ids=(1,))
+        updated = UtilityDataFrameModel(df=loaded.df.assign(name='Updated'))
+
+        # Exercise
+        # ===========================================================
+        result = cached.put(updated, utility_ids=(1,))  # type: ignore[attr-defined]
+
+        # Verify
+        # ===========================================================
+        assert result is updated
+        assert cached(_session=None, utility_ids=(1,)) is updated
+        assert len(func.calls) == 1
+
+        emit_invalidation(tables=('utility',), utility_ids=(1,))
+        assert cached(_session=None, utility_ids=(1,)).df.loc[2, 'name'] == 'Call 2'
+
+        # Clean up - None
+        # ===========================================================
+
+    def test_concurrent_loads(self, result_cache: ResultCache) -> None:
+        r"""Test that different keys load concurrently while the same key is loaded once."""
+
+        # Setup
+        # ===========================================================
+        func = BlockingLoadUtilities(parties=2)
+        cached = result_cache.cached(func, namespace='utilities', tables=('utility',))
+        languages = ['en', 'sv', 'en']
+
+        # Exercise
+        # ===========================================================
+        with ThreadPoolExecutor(max_workers=len(languages)) as executor:
+            futures = [
+                executor.submit(cached, _session=None, language=language) for language in languages
+            ]
+            results = [future.result() for future in futures]
+
+        # Verify
+        # ===========================================================
+        assert sorted(call['language'] for call in func.calls) == ['en', 'sv']
+        assert results[0] is results[2]
+        assert results[0] is not results[1]
+
+        # Clean up - None
+        # ===========================================================
+
+    def test_shared_cache(self, tmp_path: Path) -> None:
+        r"""Test that the results cached on disk are shared between result caches."""
+
+        # Setup
+        # ===========================================================
+        shared_cache = ArrowIPCCache(directory=tmp_path)
+        func = LoadUtilities()
+        result_caches = [
+            ResultCache(shared_cache=shared_cache, subscribe=False),
+            ResultCache(shared_cache=shared_cache, subscribe=False),
+        ]
+        first, second = (
+            rc.cached(func, namespace='utilities', tables=('utility',), model=UtilityDataFrameModel)
+            for rc in result_caches
+        )
+
+        # Exercise
+        # ===========================================================
+        first(_session=None)
+        result = second(_session=None)
+
+        # Verify
+        # ===========================================================
+        assert len(func.calls) == 1
+        assert result.df.loc[2, 'name'] == 'Call 1'
+
+        result_caches[0].clear()
+        assert second(_session=None).df.loc[2, 'name'] == 'Call 2'
+
+        # Clean up - None
+        # ===========================================================
+
+    @pytest.mark.raises
+    def test_namespace_already_cached(self, result_cache: ResultCache) -> None:
+        r"""Test that a namespace can only be used by one cached function."""
+
+        # Setup
+        # ===========================================================
+        result_cache.cached(LoadUtilities(), namespace='utilities', tables=('utility',))
+
+        # Exercise
+        # ===========================================================
+        with pytest.raises(exceptions.CambiatoError) as exc_info:
+            result_cache.cached(LoadUtilities(), namespace='utilities', tables=('utility',))
+
+        # Verify
+        # ===========================================================
+        assert 'utilities' in exc_info.exconly()
+
+        # Clean up - None
+        # ===========================================================
+
+
+class TestCacheWarmUp:
+    r"""Tests for the class `CacheWarmUp`."""
+
+    def test_warm_up(
+        self, result_cache: ResultCache, session_factory: SessionFactory, tmp_path: Path
+    ) -> None:
+        r"""Test to warm up a cache in a background thread with a failing call."""
+
+        # Setup
+        # ===========================================================
+        func = LoadUtilities()
+        cached = result_cache.cached(func, namespace='utilities', tables=('utility',))
+        ready_file = tmp_path / 'ready'
+        ready_path = tmp_path / f'ready.{os.getpid()}'
+        ready_path.touch()
+
+        def fail(_session: Any) -> None:
+            raise ValueError('Failed to load!')
+
+        def create_calls(_session: Any) -> list[WarmUpCall]:
+            return [
+                WarmUpCall(func=cached, kwargs={'language': 'en'}),
+                WarmUpCall(func=fail, kwargs={}),
+                WarmUpCall(func=cached, kwargs={'language': 'sv'}),
+            ]
+
+        warm_up = CacheWarmUp(session_factory=session_factory, ready_file=ready_file)
+
+        # Exercise
+        # ===========================================================
+        started = warm_up.start(calls=create_calls)
+        ready = warm_up.wait(timeout=10)
+
+        # Verify
+        # ===========================================================
+        assert started is True
+        assert ready is True
+        assert warm_up.is_ready
+        assert warm_up.status._replace(duration=0) == WarmUpStatus(
+            total=3, done=3, failed=1, ready=True
+        )
+        assert warm_up.ready_path == ready_path
+        assert ready_path.exists()
+        assert not ready_file.exists()
+        assert warm_up.start(calls=create_calls) is False
+
+        cached(_session=None, language='sv')
+        assert func.calls == [{'language': 'en'}, {'language': 'sv'}]
+
+        # Clean up - None
+        # ===========================================================
+
+    def test_create_calls_fails(self, session_factory: SessionFactory) -> None:
+        r"""Test that the warm-up completes without calls if the calls cannot be created."""
+
+        # Setup
+        # ===========================================================
+        def create_calls(_session: Any) -> list[WarmUpCall]:
+            raise ValueError('Failed to create calls!')
+
+        warm_up = CacheWarmUp(session_factory=session_factory)
+
+        # Exercise
+        # ===========================================================
+        status = warm_up.run(calls=create_calls)
+
+        # Verify
+        # ===========================================================
+        assert status.ready is True
+        assert status.total == 0
+        assert warm_up.is_ready
+
+        # Clean up - None
+        # ===========================================================
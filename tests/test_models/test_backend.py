@@ -0,0 +1,251 @@
+r"""Unit tests for the module `models.backend`."""
+
+# Standard library
+import sys
+from datetime import datetime
+from typing import Any
+
+# Third party
+import pandas as pd
+import pyarrow as pa
+import pytest
+from pandas.testing import assert_series_equal
+
+# Local
+from cambiato import exceptions
+from cambiato.models import (
+    FRAME_BACKENDS,
+    DataFrameBackend,
+    FacilityDataFrameModel,
+    PandasFrameBackend,
+    get_default_backend,
+    set_default_backend,
+)
+
+# =============================================================================================
+# Fixtures
+# =============================================================================================
+
+
+@pytest.fixture(
+    params=[
+        pytest.param(DataFrameBackend.PANDAS, id='pandas'),
+        pytest.param(DataFrameBackend.POLARS, id='polars'),
+    ]
+)
+def backend(request: pytest.FixtureRequest) -> DataFrameBackend:
+    r"""The backends to test. The polars backend is skipped if polars is not installed."""
+
+    if request.param == DataFrameBackend.POLARS:
+        pytest.importorskip('polars')
+
+    return request.param
+
+
+@pytest.fixture
+def df() -> pd.DataFrame:
+    r"""A DataFrame with duplicated and missing values in columns of different datatypes."""
+
+    return pd.DataFrame(
+        {
+            'ean': pd.array([30, 10, 20, 10, None, 40], dtype=pd.ArrowDtype(pa.int64())),
+            'name': pd.array(['c', 'a', None, 'b', 'a', 'd'], dtype=pd.ArrowDtype(pa.string())),
+            'status': pd.Categorical(
+                ['New', None, 'Done', 'New', 'Done', 'Planned'],
+                categories=['Planned', 'New', 'Done'],
+            ),
+            'created_at': pd.array(
+                [
+                    '2025-03-30 01:30:00',
+                    '2025-03-30 03:30:00',
+                    None,
+                    '2025-10-26 01:30:00',
+                    '2025-10-26 03:30:00',
+                    '2025-12-31 23:59:59',
+                ],
+                dtype=pd.ArrowDtype(pa.string()),
+            ),
+        },
+        index=pd.Index([6, 5, 4, 3, 2, 1], name='facility_id'),
+    )
+
+
+# =============================================================================================
+# Tests
+# =============================================================================================
+
+
+class TestFrameBackends:
+    r"""Tests that the frame backends give the same results as the pandas backend."""
+
+    @pytest.mark.parametrize('column', ['ean', 'name', 'status'])
+    def test_split_unique(self, column: str, backend: DataFrameBackend, df: pd.DataFrame) -> None:
+        r"""Test to split the values of a column into unique and duplicated values."""
+
+        # Setup
+        # ===========================================================
+        frame_backend = FRAME_BACKENDS[backend](df)
+        s = df[column].dropna()
+        duplicated = s.duplicated(keep=False)
+
+        # Exercise
+        # ===========================================================
+        unique, duplicates = frame_backend.split_unique(column)
+
+        # Verify
+        # ===========================================================
+        assert_series_equal(unique, s[~duplicated])
+        assert_series_equal(duplicates, s[duplicated])
+
+        # Clean up - None
+        # ===========================================================
+
+    @pytest.mark.parametrize('column', ['ean', 'name', 'status'])
+    @pytest.mark.parametrize(
+        'options',
+        [
+            pytest.param({'unique': False, 'sort_ascending': None}, id='as_is'),
+            pytest.param({'unique': True, 'sort_ascending': None}, id='unique'),
+            pytest.param({'unique': True, 'sort_ascending': True}, id='unique_ascending'),
+            pytest.param({'unique': True, 'sort_ascending': False}, id='unique_descending'),
+        ],
+    )
+    def test_get_column(
+        self, column: str, options: dict[str, Any], backend: DataFrameBackend, df: pd.DataFrame
+    ) -> None:
+        r"""Test to get a column with duplicates removed and sorted."""
+
+        # Setup
+        # ===========================================================
+        frame_backend = FRAME_BACKENDS[backend](df)
+        exp_result = PandasFrameBackend(df).get_column(column=column, **options)
+
+        # Exercise
+        # ===========================================================
+        result = frame_backend.get_column(column=column, **options)
+
+        # Verify
+        # ===========================================================
+        assert_series_equal(result, exp_result)
+
+        # Clean up - None
+        # ===========================================================
+
+    @pytest.mark.parametrize(
+        ('location_tz', 'target_tz'),
+        [
+            pytest.param('UTC', None, id='utc'),
+            pytest.param('Europe/Stockholm', None, id='localize'),
+            pytest.param('Europe/Stockholm', 'UTC', id='localize_and_convert'),
+        ],
+    )
+    def test_localize_and_convert_timezone(
+        self, location_tz: str, target_tz: str | None, backend: DataFrameBackend
+    ) -> None:
+        r"""Test to localize and convert a datetime column with a missing value."""
+
+        # Setup
+        # ===========================================================
+        df = pd.DataFrame(
+            {
+                'created_at': pd.Series(
+                    [datetime(2025, 3, 30, 1, 30), None, datetime(2025, 10, 26, 3, 30)],
+                    dtype=pd.ArrowDtype(pa.timestamp('us')),
+                )
+            }
+        )
+        frame_backend = FRAME_BACKENDS[backend](df)
+        exp_result = PandasFrameBackend(df).localize_and_convert_timezone(
+            column='created_at', location_tz=location_tz, target_tz=target_tz
+        )
+
+        # Exercise
+        # ===========================================================
+        result = frame_backend.localize_and_convert_timezone(
+            column='created_at', location_tz=location_tz, target_tz=target_tz
+        )
+
+        # Verify
+        # ===========================================================
+        assert result.type == exp_result.type
+        assert result.to_pylist() == exp_result.to_pylist()
+
+        # Clean up - None
+        # ===========================================================
+
+    def test_model_with_backend(self, backend: DataFrameBackend, df: pd.DataFrame) -> None:
+        r"""Test the column operations of a DataFrame model with a backend."""
+
+        # Setup
+        # ===========================================================
+        df = df.rename(columns={'name': FacilityDataFrameModel.c_address})
+        model = FacilityDataFrameModel(df=df, backend=backend)
+
+        # Exercise
+        # ===========================================================
+        index = model.get_index(value=30, column=FacilityDataFrameModel.c_ean)
+        s = model.get_column(FacilityDataFrameModel.c_address, unique=True, sort_ascending=True)
+        df_tz = model.localize_and_convert_timezone(
+            location_tz='Europe/Stockholm', ensure_datetime_cols=['created_at'], copy=True
+        )
+
+        # Verify
+        # ===========================================================
+        assert model.frame_backend.name == backend
+        assert index == 6
+        assert s.index.tolist() == [5, 3, 6, 1, 4]
+        assert str(df_tz['created_at'].dtype) == 'timestamp[ns, tz=Europe/Stockholm][pyarrow]'
+
+        # Clean up - None
+        # ===========================================================
+
+
+class TestSetDefaultBackend:
+    r"""Tests for the function `set_default_backend`."""
+
+    def test_set_default_backend(self, backend: DataFrameBackend) -> None:
+        r"""Test that models without a backend use the default backend."""
+
+        # Setup
+        # ===========================================================
+        default_backend = get_default_backend()
+
+        # Exercise
+        # ===========================================================
+        set_default_backend(backend)
+        model = FacilityDataFrameModel()
+
+        # Verify
+        # ===========================================================
+        try:
+            assert model.backend == backend
+            assert model.frame_backend.name == backend
+
+        # Clean up
+        # ===========================================================
+        finally:
+            set_default_backend(default_backend)
+
+    @pytest.mark.raises
+    def test_polars_not_installed(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        r"""Test that setting the polars backend without polars installed raises an error."""
+
+        # Setup
+        # ===========================================================
+        monkeypatch.setitem(sys.modules, 'polars', None)
+
+        # Exercise
+        # ===========================================================
+        with pytest.raises(exceptions.DataFrameError) as exc_info:
+            set_default_backend(DataFrameBackend.POLARS)
+
+        # Verify
+        # ===========================================================
+        error_msg = exc_info.exconly()
+        print(error_msg)
+
+        assert 'pip install cambiato[polars]' in error_msg
+        assert get_default_backend() == DataFrameBackend.PANDAS
+
+        # Clean up - None
+        # ===========================================================
@@ -6,6 +6,7 @@ from typing import ClassVar
 
 # Third party
 import pandas as pd
+import pyarrow as pa
 import pytest
 from pandas.testing import assert_series_equal
 
@@ -145,6 +146,166 @@ class TestIntIndexedDataFrameModelGetIndex:
         # Clean up - None
         # ===========================================================
 
+    def test_index_map_is_cached(self, int_indexed_df_model: IntIndexedTestDataFrameModel) -> None:
+        r"""Test that the index map of a column is built once and reused for lookups."""
+
+        # Setup
+        # ===========================================================
+        c_name = int_indexed_df_model.c_name
+
+        # Exercise
+        # ===========================================================
+        index_map = int_indexed_df_model.get_index_map(c_name)
+        int_indexed_df_model.get_index(value='District Heating', column=c_name)
+
+        # Verify
+        # ===========================================================
+        assert int_indexed_df_model.get_index_map(c_name) is index_map
+        assert index_map.values == {'Electricity': 1, 'District Heating': 2}
+        assert index_map.duplicates == frozenset()
+
+        # Clean up - None
+        # ===========================================================
+
+    def test_index_map_invalidated_when_df_is_replaced(
+        self, int_indexed_df_model: IntIndexedTestDataFrameModel
+    ) -> None:
+        r"""Test that the index map is rebuilt for a copy of the model with a new DataFrame."""
+
+        # Setup
+        # ===========================================================
+        c_name = int_indexed_df_model.c_name
+        int_indexed_df_model.get_index(value='Electricity', column=c_name)
+
+        df = int_indexed_df_model.df.copy()
+        df.loc[1, c_name] = 'Gas'
+
+        # Exercise
+        # ===========================================================
+        model = int_indexed_df_model.model_copy(update={'df': df})
+
+        # Verify
+        # ===========================================================
+        assert model.get_index(value='Gas', column=c_name) == 1
+        assert model.get_index(value='Electricity', column=c_name) is None
+        assert int_indexed_df_model.get_index(value='Electricity', column=c_name) == 1
+
+        # Clean up - None
+        # ===========================================================
+
+    def test_clear_lookups_after_inplace_modification(
+        self, int_indexed_df_model: IntIndexedTestDataFrameModel
+    ) -> None:
+        r"""Test that clearing the index maps picks up inplace modifications of the DataFrame."""
+
+        # Setup
+        # ===========================================================
+        c_name = int_indexed_df_model.c_name
+        int_indexed_df_model.get_index(value='Electricity', column=c_name)
+        int_indexed_df_model.df.loc[1, c_name] = 'Gas'
+
+        # Exercise
+        # ===========================================================
+        int_indexed_df_model.clear_lookups()
+
+        # Verify
+        # ===========================================================
+        assert int_indexed_df_model.get_index(value='Gas', column=c_name) == 1
+
+        # Clean up - None
+        # ===========================================================
+
+    @pytest.mark.raises
+    def test_only_duplicated_values_raise(
+        self, int_indexed_df_model: IntIndexedTestDataFrameModel
+    ) -> None:
+        r"""Test that duplicated values raise while other values of the column are found."""
+
+        # Setup
+        # ===========================================================
+        df = int_indexed_df_model.df
+        c_name = int_indexed_df_model.c_name
+        df.loc[3, :] = df.loc[2, :]
+        df.loc[4, c_name] = 'Gas'
+
+        # Exercise
+        # ===========================================================
+        with pytest.raises(exceptions.MultipleRowsForColumnValueError):
+            int_indexed_df_model.get_index(value='District Heating', column=c_name)
+
+        # Verify
+        # ===========================================================
+        assert int_indexed_df_model.get_index(value='Gas', column=c_name) == 4
+        assert int_indexed_df_model.get_index(value='Electricity', column=c_name) == 1
+
+        # Clean up - None
+        # ===========================================================
+
+
+class TestIntIndexedDataFrameModelGetIndices:
+    r"""Tests for the method `IntIndexedDataFrameModel.get_indices`."""
+
+    def test_get_values(self, int_indexed_df_model: IntIndexedTestDataFrameModel) -> None:
+        r"""Get the index values of rows matching, not matching and missing values."""
+
+        # Setup
+        # ===========================================================
+        values = pd.Series(
+            ['District Heating', 'does not exist', None, 'Electricity'], index=[10, 11, 12, 13]
+        )
+        indices_exp = pd.Series([2, None, None, 1], index=values.index, dtype='Int64')
+        missing_exp = pd.Series([False, True, False, False], index=values.index)
+
+        # Exercise
+        # ===========================================================
+        result = int_indexed_df_model.get_indices(values=values, column='name')
+
+        # Verify
+        # ===========================================================
+        assert_series_equal(result.indices, indices_exp)
+        assert_series_equal(result.missing, missing_exp)
+        assert not result.ambiguous.any()
+
+        # Clean up - None
+        # ===========================================================
+
+    def test_ambiguous_values(self, int_indexed_df_model: IntIndexedTestDataFrameModel) -> None:
+        r"""Test that values matching multiple rows are marked as ambiguous."""
+
+        # Setup
+        # ===========================================================
+        df = int_indexed_df_model.df
+        c_name = int_indexed_df_model.c_name
+        df.loc[2, c_name] = df.loc[1, c_name]
+        ambiguous_exp = pd.Series([True, False])
+
+        # Exercise
+        # ===========================================================
+        result = int_indexed_df_model.get_indices(values=['Electricity', 'Gas'], column=c_name)
+
+        # Verify
+        # ===========================================================
+        assert_series_equal(result.ambiguous, ambiguous_exp)
+        assert result.indices.isna().all()
+        assert result.missing.tolist() == [False, True]
+
+        # Clean up - None
+        # ===========================================================
+
+    @pytest.mark.raises
+    def test_column_not_part_of_dataframe(
+        self, int_indexed_df_model: IntIndexedTestDataFrameModel
+    ) -> None:
+        r"""Test given column is not among the column names of the DataFrame."""
+
+        # Exercise & Verify
+        # ===========================================================
+        with pytest.raises(exceptions.MissingColumnError):
+            int_indexed_df_model.get_indices(values=['Electricity'], column='does not exist')
+
+        # Clean up - None
+        # ===========================================================
+
 
 class TestIntIndexedDataFrameModelGetIndexByRowNr:
     r"""Tests for the method `IntIndexedDataFrameModel.get_index_by_row_nr`."""
@@ -188,6 +349,146 @@ class TestIntIndexedDataFrameModelGetIndexByRowNr:
         # ===========================================================
 
 
+class TestIntIndexedDataFrameModelLabels:
+    r"""Tests for the labels of the rows of `IntIndexedDataFrameModel`."""
+
+    def test_default_labels(self, int_indexed_df_model: IntIndexedTestDataFrameModel) -> None:
+        r"""Test that the default label of a row is its index ID."""
+
+        # Exercise
+        # ===========================================================
+        format_func = int_indexed_df_model.format_func
+
+        # Verify
+        # ===========================================================
+        assert int_indexed_df_model.labels == {1: '1', 2: '2'}
+        assert format_func(2) == '2'
+
+        # Clean up - None
+        # ===========================================================
+
+    def test_labels_of_empty_model(self) -> None:
+        r"""Test that a model without rows has no labels."""
+
+        # Exercise
+        # ===========================================================
+        model = IntIndexedTestDataFrameModel()
+
+        # Verify
+        # ===========================================================
+        assert model.labels == {}
+
+        # Clean up - None
+        # ===========================================================
+
+    @pytest.mark.raises
+    def test_display_row_that_does_not_exist(
+        self, int_indexed_df_model: IntIndexedTestDataFrameModel
+    ) -> None:
+        r"""Test to display a row that does not exist in the DataFrame."""
+
+        # Setup
+        # ===========================================================
+        error_msg_exp = 'Row with index ID 3 does not exist in the DataFrame!'
+
+        # Exercise
+        # ===========================================================
+        with pytest.raises(exceptions.MissingRowError) as exc_info:
+            int_indexed_df_model.format_func(3)
+
+        # Verify
+        # ===========================================================
+        error_msg = exc_info.value.args[0]
+        print(error_msg)
+
+        assert error_msg == error_msg_exp
+
+        # Clean up - None
+        # ===========================================================
+
+
+class TestIntIndexedDataFrameModelMemoryUsage:
+    r"""Tests for the method `IntIndexedDataFrameModel.memory_usage`."""
+
+    def test_shared_arrow_buffers_counted_once(self) -> None:
+        r"""Test that Arrow buffers referenced by multiple columns are counted once."""
+
+        # Setup
+        # ===========================================================
+        arr = pd.array(['a', 'bb', None] * 100, dtype=pd.ArrowDtype(pa.string()))
+        index = pd.RangeIndex(300)
+        model_one = IntIndexedTestDataFrameModel(df=pd.DataFrame({'name': arr}, index=index))
+        model_two = IntIndexedTestDataFrameModel(
+            df=pd.DataFrame({'name': arr, 'description': arr}, index=index)
+        )
+        model_with_int = IntIndexedTestDataFrameModel(
+            df=pd.DataFrame({'name': arr, 'pk': pd.Series(range(300), dtype='int64')})
+        )
+
+        # Exercise
+        # ===========================================================
+        nbytes_one = model_one.memory_usage()
+        nbytes_two = model_two.memory_usage()
+        nbytes_with_int = model_with_int.memory_usage()
+
+        # Verify
+        # ===========================================================
+        assert nbytes_one >= arr.nbytes
+        assert nbytes_two == nbytes_one
+        assert nbytes_with_int == nbytes_one + 300 * 8
+
+        # Clean up - None
+        # ===========================================================
+
+
+class TestIntIndexedDataFrameModelUpdateRows:
+    r"""Tests for the method `IntIndexedDataFrameModel.update_rows`."""
+
+    def test_update_and_drop_rows(self) -> None:
+        r"""Test to replace and drop rows while keeping the position of the other rows."""
+
+        # Setup
+        # ===========================================================
+        c = IntIndexedTestDataFrameModel
+        index = pd.Index([3, 2, 1], name=c.c_pk)
+        model = IntIndexedTestDataFrameModel(
+            df=pd.DataFrame(
+                {
+                    c.c_name: pd.Categorical(['a', 'a', 'b']),
+                    c.c_description: pd.array(['x', None, 'z'], dtype='string[pyarrow]'),
+                },
+                index=index,
+            )
+        )
+        rows = IntIndexedTestDataFrameModel(
+            df=pd.DataFrame(
+                {
+                    c.c_name: pd.Categorical(['c', 'd']),
+                    c.c_description: pd.array(['y', 'w'], dtype='string[pyarrow]'),
+                },
+                index=pd.Index([2, 4], name=c.c_pk),
+            )
+        )
+
+        # Exercise
+        # ===========================================================
+        result = model.update_rows(rows, drop=[1])
+
+        # Verify
+        # ===========================================================
+        df = result.df
+
+        assert df.index.tolist() == [3, 2]
+        assert df[c.c_name].tolist() == ['a', 'c']
+        assert df[c.c_description].tolist() == ['x', 'y']
+        assert isinstance(df[c.c_name].dtype, pd.CategoricalDtype)
+        assert df[c.c_description].dtype == model.df[c.c_description].dtype
+        assert model.df[c.c_name].tolist() == ['a', 'a', 'b'], 'The model should not be modified.'
+
+        # Clean up - None
+        # ===========================================================
+
+
 class TestIntIndexedDataFrameModelGetColumn:
     r"""Tests for the method `IntIndexedDataFrameModel.get_column`."""
 
@@ -299,3 +600,63 @@ class TestIntIndexedDataFrameModelGetColumn:
 
         # Clean up - None
         # ===========================================================
+
+
+class TestIntIndexedDataFrameModelLocalizeAndConvertTimezone:
+    r"""Tests for the method `IntIndexedDataFrameModel.localize_and_convert_timezone`."""
+
+    def test_localize_and_convert(self, int_indexed_df_model: IntIndexedTestDataFrameModel) -> None:
+        r"""Test to localize a naive datetime column into UTC and convert it to a timezone."""
+
+        # Setup
+        # ===========================================================
+        c_created_at = int_indexed_df_model.c_created_at
+        s_exp = pd.Series(
+            pd.to_datetime(['2025-08-31 15:37', '2025-08-31 15:38']).tz_localize(
+                'Europe/Stockholm'
+            ),
+            index=int_indexed_df_model.index,
+            name=c_created_at,
+        ).astype('timestamp[ns, Europe/Stockholm][pyarrow]')
+
+        # Exercise
+        # ===========================================================
+        df = int_indexed_df_model.localize_and_convert_timezone(target_tz='Europe/Stockholm')
+
+        # Verify
+        # ===========================================================
+        assert df is int_indexed_df_model.df
+        assert_series_equal(df[c_created_at], s_exp)
+
+        # Clean up - None
+        # ===========================================================
+
+    def test_ensure_datetime_cols(self, int_indexed_df_model: IntIndexedTestDataFrameModel) -> None:
+        r"""Test to parse string columns with ISO 8601 timestamps or only missing values."""
+
+        # Setup
+        # ===========================================================
+        df = int_indexed_df_model.df.copy()
+        df['updated_at'] = pd.Series(
+            ['2025-09-01 08:00:00.000000', None], index=df.index, dtype='string[pyarrow]'
+        )
+        df['deleted_at'] = pd.Series([None, None], index=df.index, dtype='string[pyarrow]')
+        dtype_exp = pd.ArrowDtype(pa.timestamp('ns', tz='UTC'))
+
+        # Exercise
+        # ===========================================================
+        result = int_indexed_df_model.localize_and_convert_timezone(
+            df=df, ensure_datetime_cols=['updated_at', 'deleted_at'], copy=True
+        )
+
+        # Verify
+        # ===========================================================
+        assert result is not df
+        assert result['updated_at'].dtype == dtype_exp
+        assert result['deleted_at'].dtype == dtype_exp
+        assert result.loc[1, 'updated_at'] == pd.Timestamp('2025-09-01 08:00', tz='UTC')
+        assert result['deleted_at'].isna().all()
+        assert df['updated_at'].dtype == 'string[pyarrow]'
+
+        # Clean up - None
+        # ===========================================================
@@ -0,0 +1,268 @@
+r"""Unit tests for the module `models.dataframe`."""
+
+# Standard library
+from datetime import datetime
+
+# Third party
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+# Local
+from cambiato import exceptions
+from cambiato.database import ChangedDatabaseRows
+from cambiato.models import FacilityDataFrameModel, OrderDataFrameModel
+from cambiato.models.core import ARROW_STRING
+
+
+@pytest.fixture
+def facilities() -> FacilityDataFrameModel:
+    r"""A facility DataFrame model with a facility that is missing an address."""
+
+    df = pd.DataFrame(
+        {
+            FacilityDataFrameModel.c_ean: pd.array(
+                [735999100000000001, 735999100000000002], dtype='uint64[pyarrow]'
+            ),
+            FacilityDataFrameModel.c_address: pd.array(
+                ['Storgatan 1', None], dtype=pd.ArrowDtype(pa.string())
+            ),
+        },
+        index=pd.Index([1, 2], dtype='uint32[pyarrow]', name=FacilityDataFrameModel.c_facility_id),
+    )
+
+    return FacilityDataFrameModel(df=df)
+
+
+@pytest.fixture
+def orders() -> OrderDataFrameModel:
+    r"""An order DataFrame model with one order."""
+
+    c = OrderDataFrameModel
+    df = pd.DataFrame(
+        {
+            c.c_order_type_name: ['Meter change'],
+            c.c_order_status_name: ['New'],
+            c.c_facility_ean: pd.array([735999100000000001], dtype='uint64[pyarrow]'),
+            c.c_address: ['Storgatan 1'],
+        },
+        index=pd.Index([7], name=c.c_order_id),
+    )
+
+    return OrderDataFrameModel(df=df)
+
+
+class TestFacilityDataFrameModelLabels:
+    r"""Tests for the labels of `FacilityDataFrameModel`."""
+
+    def test_labels(self, facilities: FacilityDataFrameModel) -> None:
+        r"""Test that the label of a facility is its EAN and address."""
+
+        # Setup
+        # ===========================================================
+        labels_exp = {1: '735999100000000001 | Storgatan 1', 2: '735999100000000002 | '}
+
+        # Exercise
+        # ===========================================================
+        labels = facilities.labels
+
+        # Verify
+        # ===========================================================
+        assert labels == labels_exp
+        assert facilities.format_func(1) == labels_exp[1]
+
+        # Clean up - None
+        # ===========================================================
+
+    def test_labels_recreated_when_df_is_replaced(self, facilities: FacilityDataFrameModel) -> None:
+        r"""Test that the labels are recreated for a copy of the model with a new DataFrame."""
+
+        # Setup
+        # ===========================================================
+        facilities.labels  # noqa: B018
+        df = facilities.df.copy()
+        df[facilities.c_address] = df[facilities.c_address].fillna('Lillgatan 2')
+
+        # Exercise
+        # ===========================================================
+        model = facilities.model_copy(update={'df': df})
+
+        # Verify
+        # ===========================================================
+        assert model.display_row(2) == '735999100000000002 | Lillgatan 2'
+        assert facilities.display_row(2) == '735999100000000002 | '
+
+        # Clean up - None
+        # ===========================================================
+
+
+class TestOrderDataFrameModelLabels:
+    r"""Tests for the labels of `OrderDataFrameModel`."""
+
+    def test_display_row(self, orders: OrderDataFrameModel) -> None:
+        r"""Test the label of an order."""
+
+        # Exercise & Verify
+        # ===========================================================
+        assert orders.display_row(7) == 'ID:7|735999100000000001|Storgatan 1|Meter change|New'
+
+        # Clean up - None
+        # ===========================================================
+
+    @pytest.mark.raises
+    def test_display_row_that_does_not_exist(self, orders: OrderDataFrameModel) -> None:
+        r"""Test to display an order that does not exist."""
+
+        # Exercise
+        # ===========================================================
+        with pytest.raises(exceptions.MissingRowError) as exc_info:
+            orders.format_func(8)
+
+        # Verify
+        # ===========================================================
+        assert exc_info.value.args[0] == 'Order with order_id=8 does not exist!'
+
+        # Clean up - None
+        # ===========================================================
+
+
+class TestOrderDataFrameModelDiff:
+    r"""Tests for the method `OrderDataFrameModel.diff`."""
+
+    @pytest.fixture
+    def snapshots(self) -> tuple[OrderDataFrameModel, OrderDataFrameModel]:
+        r"""A previous and a current snapshot of the orders.
+
+        Order 4 is deleted, order 5 is inserted and orders 1, 2 and 3 are edited. The
+        order statuses are categoricals with different categories in the snapshots.
+        """
+
+        c = OrderDataFrameModel
+        timestamp = pd.ArrowDtype(pa.timestamp('us'))
+
+        previous_df = pd.DataFrame(
+            {
+                c.c_order_status_name: pd.Categorical(
+                    ['New', 'New', 'Planned', None], categories=['New', 'Planned']
+                ),
+                c.c_ext_id: pd.array(['a', 'b', None, 'd'], dtype=ARROW_STRING),
+                c.c_scheduled_start_at: pd.array(
+                    [datetime(2025, 1, 1), None, None, None], dtype=timestamp
+                ),
+            },
+            index=pd.Index([1, 2, 3, 4], name=c.c_order_id),
+        )
+        df = pd.DataFrame(
+            {
+                c.c_order_status_name: pd.Categorical(
+                    ['Done', 'New', 'Planned', None], categories=['New', 'Planned', 'Done']
+                ),
+                c.c_ext_id: pd.array([None, 'b2', None, 'e'], dtype=ARROW_STRING),
+                c.c_scheduled_start_at: pd.array(
+                    [datetime(2025, 1, 1), None, datetime(2025, 2, 1), None], dtype=timestamp
+                ),
+            },
+            index=pd.Index([5, 3, 2, 1], name=c.c_order_id),
+        )
+
+        return OrderDataFrameModel(df=previous_df), OrderDataFrameModel(df=df)
+
+    def test_diff(self, snapshots: tuple[OrderDataFrameModel, OrderDataFrameModel]) -> None:
+        r"""Test to compute the inserted, deleted and edited rows from all columns."""
+
+        # Setup
+        # ===========================================================
+        previous, orders = snapshots
+        c = OrderDataFrameModel
+
+        # Exercise
+        # ===========================================================
+        result = orders.diff(previous)
+
+        # Verify
+        # ===========================================================
+        assert result.edited_rows == [
+            {c.c_order_id: 3, c.c_order_status_name: 'New', c.c_ext_id: 'b2'},
+            {
+                c.c_order_id: 2,
+                c.c_order_status_name: 'Planned',
+                c.c_ext_id: None,
+                c.c_scheduled_start_at: datetime(2025, 2, 1),
+            },
+            {
+                c.c_order_id: 1,
+                c.c_order_status_name: None,
+                c.c_ext_id: 'e',
+                c.c_scheduled_start_at: None,
+            },
+        ]
+        assert result.added_rows == [
+            {
+                c.c_order_id: 5,
+                c.c_order_status_name: 'Done',
+                c.c_ext_id: None,
+                c.c_scheduled_start_at: datetime(2025, 1, 1),
+            }
+        ]
+        assert result.deleted_rows == [4]
+
+        # Clean up - None
+        # ===========================================================
+
+    def test_diff_selected_columns(
+        self, snapshots: tuple[OrderDataFrameModel, OrderDataFrameModel]
+    ) -> None:
+        r"""Test to compute the diff of selected columns and of identical snapshots."""
+
+        # Setup
+        # ===========================================================
+        previous, orders = snapshots
+        c = OrderDataFrameModel
+
+        # Exercise
+        # ===========================================================
+        result = orders.diff(previous, columns=[c.c_scheduled_start_at])
+        result_identical = orders.diff(orders)
+
+        # Verify
+        # ===========================================================
+        assert result.edited_rows == [
+            {c.c_order_id: 2, c.c_scheduled_start_at: datetime(2025, 2, 1)},
+            {c.c_order_id: 1, c.c_scheduled_start_at: None},
+        ]
+        assert result.added_rows == [
+            {c.c_order_id: 5, c.c_scheduled_start_at: datetime(2025, 1, 1)}
+        ]
+        assert result.deleted_rows == [4]
+        assert result_identical == ChangedDatabaseRows(
+            edited_rows=[], added_rows=[], deleted_rows=[]
+        )
+
+        # Clean up - None
+        # ===========================================================
+
+    @pytest.mark.raises
+    def test_diff_missing_column(
+        self, snapshots: tuple[OrderDataFrameModel, OrderDataFrameModel]
+    ) -> None:
+        r"""Test to compute the diff of a column that is missing from the previous snapshot."""
+
+        # Setup
+        # ===========================================================
+        previous, orders = snapshots
+        previous = OrderDataFrameModel(df=previous.df.drop(columns=OrderDataFrameModel.c_ext_id))
+
+        # Exercise
+        # ===========================================================
+        with pytest.raises(exceptions.MissingColumnError) as exc_info:
+            orders.diff(previous)
+
+        # Verify
+        # ===========================================================
+        error_msg = exc_info.exconly()
+        print(error_msg)
+
+        assert 'previous snapshot' in error_msg
+
+        # Clean up - None
+        # ===========================================================
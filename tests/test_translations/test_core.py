@@ -6,14 +6,17 @@ from typing import TypeAlias
 
 # Third party
 import pandas as pd
+import pyarrow as pa
 import pytest
-from pandas.testing import assert_frame_equal
+from pandas.testing import assert_frame_equal, assert_series_equal
 
 # Local
 from cambiato import exceptions
 from cambiato.config import Language
 from cambiato.translations import PageTranslationModels
 from cambiato.translations.core import (
+    TranslationRegistry,
+    Translator,
     create_translation_mapping,
     load_translation,
     translate_dataframe,
@@ -163,6 +166,60 @@ class TestLoadTranslation:
         # ===========================================================
 
 
+class TestTranslationRegistry:
+    r"""Tests for the class `TranslationRegistry`."""
+
+    def test_load_on_first_use(self) -> None:
+        r"""Test that a language is loaded the first time it is looked up and then reused."""
+
+        # Setup
+        # ===========================================================
+        registry = TranslationRegistry(languages=(Language.EN, Language.SV, Language.EN))
+
+        # Exercise
+        # ===========================================================
+        loaded_before = registry.loaded_languages
+        trans_1 = registry[Language.EN]
+        trans_2 = registry[Language.EN]
+
+        # Verify
+        # ===========================================================
+        assert loaded_before == ()
+        assert registry.loaded_languages == (Language.EN,)
+        assert isinstance(trans_1, PageTranslationModels)
+        assert trans_1 is trans_2
+        assert list(registry) == [Language.EN, Language.SV]
+        assert Language.SV in registry
+
+        # Clean up - None
+        # ===========================================================
+
+    @pytest.mark.raises
+    def test_language_not_available(self) -> None:
+        r"""Test to look up a language that is not available in the registry."""
+
+        # Setup
+        # ===========================================================
+        registry = TranslationRegistry(languages=(Language.EN,))
+
+        # Exercise
+        # ===========================================================
+        with pytest.raises(KeyError) as exc_info:
+            registry[Language.SV]
+
+        # Verify
+        # ===========================================================
+        error_msg = exc_info.exconly()
+        print(error_msg)
+
+        assert Language.SV in error_msg
+        assert registry.get(Language.SV) is None
+        assert registry.loaded_languages == ()
+
+        # Clean up - None
+        # ===========================================================
+
+
 class TestCreateTranslationMapping:
     r"""Tests for the function `create_translation_mapping`."""
 
@@ -373,6 +430,71 @@ class TestTranslateDataFrame:
         # Clean up - None
         # ===========================================================
 
+    def test_translate_categorical_column(
+        self,
+        df_multi_translation: tuple[
+            pd.DataFrame, tuple[TranslationMapping, TranslationMapping], pd.DataFrame
+        ],
+    ) -> None:
+        r"""Test to translate a categorical column by its categories."""
+
+        # Setup
+        # ===========================================================
+        df, (_, tool_trans), _ = df_multi_translation
+        df = pd.concat([df, df.iloc[[0]].rename(index={1: 3})])
+        df['tool'] = df['tool'].astype('category')
+
+        s_exp = pd.Series(
+            ['Axe', 'Tinderbox', 'Axe'], index=df.index, name='tool', dtype='category'
+        )
+
+        # Exercise
+        # ===========================================================
+        df_result = translate_dataframe(
+            df=df, translation=tool_trans, columns='tool', id_column='tool_id'
+        )
+
+        # Verify
+        # ===========================================================
+        print(f'df_result:\n{df_result}\n')
+
+        assert_series_equal(df_result['tool'], s_exp)
+        assert df_result['tool'].cat.categories.tolist() == ['Axe', 'Tinderbox']
+
+        # Clean up - None
+        # ===========================================================
+
+    def test_translate_categorical_column_with_ambiguous_category(
+        self,
+        df_multi_translation: tuple[
+            pd.DataFrame, tuple[TranslationMapping, TranslationMapping], pd.DataFrame
+        ],
+    ) -> None:
+        r"""Test to translate a categorical column where a category has multiple IDs.
+
+        The column is translated row by row.
+        """
+
+        # Setup
+        # ===========================================================
+        df, (_, tool_trans), _ = df_multi_translation
+        df['tool'] = pd.Series(['axe', 'axe'], index=df.index, dtype='category')
+
+        # Exercise
+        # ===========================================================
+        df_result = translate_dataframe(
+            df=df, translation=tool_trans, columns='tool', id_column='tool_id'
+        )
+
+        # Verify
+        # ===========================================================
+        print(f'df_result:\n{df_result}\n')
+
+        assert df_result['tool'].tolist() == ['Axe', 'Tinderbox']
+
+        # Clean up - None
+        # ===========================================================
+
     @pytest.mark.raises
     def test_multi_translate_unequal_sequence_lengths(
         self,
@@ -406,3 +528,80 @@ class TestTranslateDataFrame:
 
         # Clean up - None
         # ===========================================================
+
+
+class TestTranslator:
+    r"""Tests for the class `Translator`."""
+
+    @pytest.mark.parametrize(
+        'dtype',
+        [
+            pytest.param(object, id='object'),
+            pytest.param('string[pyarrow]', id='string[pyarrow]'),
+            pytest.param(pd.ArrowDtype(pa.string()), id='ArrowDtype'),
+        ],
+    )
+    def test_translate_id_column(self, dtype: object) -> None:
+        r"""Test to translate a column by an ID column with IDs without translations.
+
+        The rows without a translation or with a missing translation keep their values.
+        """
+
+        # Setup
+        # ===========================================================
+        df = pd.DataFrame(
+            {
+                'tool_id': pd.array([9, 8, 7, 9, None], dtype='int64[pyarrow]'),
+                'tool': pd.array(['tbox', 'axe', 'pick', 'tbox', None], dtype=dtype),
+                'slot': pd.array(['a', 'b', 'c', 'd', 'e'], dtype=dtype),
+            },
+            index=pd.Index([1, 2, 3, 4, 5], name='rs_id'),
+        )
+        translation = {8: {'name': 'Axe', 'slot': None}, 9: {'name': 'Tinderbox', 'slot': 'X'}}
+        translator = Translator(
+            translation=translation, columns=['tool', 'slot'], id_column='tool_id'
+        )
+        s_exp = pd.Series(
+            ['Tinderbox', 'Axe', 'pick', 'Tinderbox', None], index=df.index, name='tool'
+        ).astype(dtype)
+
+        # Exercise
+        # ===========================================================
+        df_result = translator.translate(df, copy=True)
+
+        # Verify
+        # ===========================================================
+        print(f'df_result:\n{df_result}\n')
+
+        assert_series_equal(df_result['tool'], s_exp)
+        assert df_result['slot'].tolist() == ['X', 'b', 'c', 'X', 'e']
+        assert df_result.index.equals(df.index)
+        assert df_result.columns.equals(df.columns)
+        assert df['tool'].tolist()[0] == 'tbox'
+
+        # Clean up - None
+        # ===========================================================
+
+    def test_reuse_translator(
+        self, df_translation: tuple[pd.DataFrame, TranslationMapping, pd.DataFrame]
+    ) -> None:
+        r"""Test to translate multiple DataFrames with the same translator."""
+
+        # Setup
+        # ===========================================================
+        df, translation, df_exp = df_translation
+        df_categorical = df.astype({'name': 'category'})
+        translator = Translator(translation=translation)
+
+        # Exercise
+        # ===========================================================
+        df_result = translator.translate(df, copy=True)
+        df_result_categorical = translator.translate(df_categorical, copy=True)
+
+        # Verify
+        # ===========================================================
+        assert_frame_equal(df_result, df_exp)
+        assert_frame_equal(df_result_categorical, df_exp.astype({'name': 'category'}))
+
+        # Clean up - None
+        # ===========================================================